@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from fastapi import Request, Response
+
+from ..core.json_codec import encode
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+# 이 크기보다 작은 응답은 압축하지 않음 (헤더 오버헤드가 더 큼)
+MIN_COMPRESS_SIZE = 1024
+
+
+class CachedPayload:
+    """직렬화된 응답 본문 + ETag + 인코딩별 압축 결과 캐시
+
+    강한 ETag 는 바이트 단위로 같은 표현에만 붙여야 하므로, 압축된 본문은
+    인코딩 접미사를 붙인 ETag("<버전>-br", "<버전>-gzip")를 쓴다.
+    """
+
+    __slots__ = ('body', 'version', 'etag', '_encoded')
+
+    def __init__(self, body: bytes, version: Optional[str] = None):
+        self.body = body
+        self.version = version or hashlib.blake2b(body, digest_size=8).hexdigest()
+        self.etag = f'"{self.version}"'
+        self._encoded: Dict[str, bytes] = {}
+
+    def content_encoding(self, encoding: Optional[str]) -> Optional[str]:
+        """실제로 적용할 압축 방식 (작은 본문은 압축하지 않음)"""
+        return encoding if encoding and len(self.body) >= MIN_COMPRESS_SIZE else None
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """표현(인코딩)별 ETag"""
+        encoding = self.content_encoding(encoding)
+        return f'"{self.version}-{encoding}"' if encoding else self.etag
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """요청한 인코딩으로 압축된 본문 (버전당 한 번만 압축)"""
+        encoding = self.content_encoding(encoding)
+        if not encoding:
+            return self.body
+        data = self._encoded.get(encoding)
+        if data is None:
+            if encoding == 'br':
+                data = brotli.compress(self.body, quality=5)
+            else:
+                data = gzip.compress(self.body, compresslevel=6)
+            self._encoded[encoding] = data
+        return data
+
+    @classmethod
+    def from_content(cls, content, volatile_keys: Iterable[str] = ()) -> 'CachedPayload':
+        """dict 응답을 직렬화 (volatile_keys 는 버전 계산에서 제외)"""
+        return cls(encode(content), _content_version(content, volatile_keys))
+
+
+def _content_version(content, volatile_keys: Iterable[str]) -> str:
+    """응답 내용 버전 (volatile_keys 와 기사 수집 시각은 제외)"""
+    if isinstance(content, dict):
+        volatile_keys = tuple(volatile_keys)
+        content = {key: value for key, value in content.items() if key not in volatile_keys}
+    return hashlib.blake2b(encode(content, stable=True), digest_size=8).hexdigest()
+
+
+class ResultCache:
+    """짧은 TTL의 응답 캐시 (LRU)
+
+    같은 키로 다시 저장할 때 내용 버전이 이전과 같으면 기존 payload를 그대로
+    유지하고 만료 시간만 연장한다. 따라서 내용이 바뀌지 않는 한 ETag도 유지되어
+    클라이언트는 304를 받는다.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedPayload]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at < time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: str, content, volatile_keys: Iterable[str] = ()) -> CachedPayload:
+        version = _content_version(content, volatile_keys)
+        with self._lock:
+            previous = self._entries.get(key)
+        if previous is not None and previous[1].version == version:
+            payload = previous[1]
+        else:
+            payload = CachedPayload(encode(content), version)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+
+def cache_key(*parts) -> str:
+    """요청 파라미터로 캐시 키 생성"""
+    return '|'.join('' if part is None else str(part) for part in parts)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 압축 방식 선택 (br > gzip)"""
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0'):
+            continue
+        accepted.add(name.strip().lower())
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def _etag_matches(if_none_match: str, version: str) -> bool:
+    """If-None-Match 에 같은 버전의 ETag 가 있는지 (인코딩 접미사는 무시)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):  # If-None-Match 는 약한 비교 허용
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag == version or tag.rsplit('-', 1)[0] == version:
+            return True
+    return False
+
+
+def payload_response(request: Request, payload: CachedPayload,
+                     cache_control: str = "no-cache") -> Response:
+    """ETag/If-None-Match 처리와 압축을 적용한 응답 생성"""
+    encoding = payload.content_encoding(negotiate_encoding(request.headers.get("accept-encoding", "")))
+    headers = {
+        "ETag": payload.etag_for(encoding),
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), payload.version):
+        return Response(status_code=304, headers=headers)
+
+    body = payload.encoded(encoding)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
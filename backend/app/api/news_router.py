@@ -1,147 +1,86 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
-from typing import List, Dict, Optional, Generator
+from typing import List, Dict, Optional, AsyncIterator, Callable
 import logging
 import asyncio
-import concurrent.futures
 from datetime import datetime, timedelta
 import re
 import os
-import json
 import time
 
-from ..scrapers.bbc_scraper import BBCNewsScraper
-from ..scrapers.nypost_scraper import NYPostScraper
-from ..scrapers.thesun_scraper import TheSunScraper
-from ..scrapers.vnexpress_scraper import VNExpressScraper
-from ..scrapers.bangkokpost_scraper import BangkokPostScraper
-from ..scrapers.asahi_scraper import AsahiScraper
-from ..scrapers.yomiuri_scraper import YomiuriScraper
-from ..scrapers.hybrid_dailymail_scraper import HybridDailyMailScraper
-from ..scrapers.scmp_scraper import SCMPScraper
-from ..scrapers.hybrid_nypost_scraper import HybridNYPostScraper
-from ..scrapers.thethaiger_scraper import TheThaigerScraper
+from ..core.article_store import ArticleStore, sort_articles
+from ..core.json_codec import sse_event
+from ..core.source_registry import categories_response, expand_sources, sources_response
+from ..models.article import Article
+from .http_cache import CachedPayload, ResultCache, cache_key, payload_response
+from .responses import FastJSONResponse
+from ..scrapers.registry import CAP_LATEST, CAP_SEARCH, fan_out, gather_sources, select_scrapers
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/news", tags=["news"])
+router = APIRouter(prefix="/api/news", tags=["news"], default_response_class=FastJSONResponse)
 
-# 스크래퍼 인스턴스 생성
-bbc_scraper = BBCNewsScraper()
-thesun_scraper = TheSunScraper()
-vnexpress_scraper = VNExpressScraper()
-bangkokpost_scraper = BangkokPostScraper()
-asahi_scraper = AsahiScraper()
-yomiuri_scraper = YomiuriScraper()
-# 하이브리드 스크래퍼들 (느림)
-scmp_scraper = SCMPScraper()
-thethaiger_scraper = TheThaigerScraper()
-nypost_scraper = HybridNYPostScraper()
-dailymail_scraper = HybridDailyMailScraper()
+# 응답 캐시 (ETag는 캐시된 결과의 내용 버전에서 파생)
+search_cache = ResultCache(ttl=float(os.getenv('SEARCH_CACHE_TTL', '60')))
+trending_cache = ResultCache(ttl=float(os.getenv('TRENDING_CACHE_TTL', '120')))
 
-def run_scraper_search(scraper, query, limit):
-    """스크래퍼 검색을 실행하는 헬퍼 함수 (실제 검색용)"""
-    try:
-        return scraper.search_news(query, limit)
-    except Exception as e:
-        logger.error(f"{scraper.__class__.__name__} 검색 실패: {e}")
-        return []
+# 메타데이터 응답은 내용이 고정이므로 시작 시 한 번만 직렬화
+SOURCES_PAYLOAD = CachedPayload.from_content(sources_response())
+CATEGORIES_PAYLOAD = CachedPayload.from_content(categories_response())
 
-def run_scraper_trending(scraper, category, limit):
-    """스크래퍼 트렌딩 뉴스를 실행하는 헬퍼 함수 (트렌딩용)"""
+def parse_date_bound(value: Optional[str], is_end: bool) -> Optional[datetime]:
+    """date_from/date_to 파라미터를 비교용 datetime으로 변환 (요청당 한 번)"""
+    if not value:
+        return None
     try:
-        scraper_name = scraper.__class__.__name__
-        logger.info(f"{scraper_name} 트렌딩 뉴스 시작: category={category}, limit={limit}")
-        
-        # 모든 사이트에서 실제 최신/메인 뉴스 사용 (검색이 아닌 트렌딩)
-        if hasattr(scraper, 'get_latest_news'):
-            # 카테고리를 스크래퍼별로 적절히 매핑
-            if scraper_name == 'BBCNewsScraper':
-                # BBC는 sports도 지원하지만 sport로 통일
-                if category == 'sports':
-                    category = 'sport'
-            
-            logger.info(f"{scraper_name}에서 get_latest_news 호출: category={category}")
-            
-            result = scraper.get_latest_news(category, limit)
-            logger.info(f"{scraper_name} 트렌딩 결과: {len(result) if result else 0}개 기사")
-            return result
-        else:
-            # get_latest_news가 없으면 검색으로 fallback
-            logger.info(f"{scraper_name}에서 search_news fallback 호출")
-            result = scraper.search_news(query, limit)
-            logger.info(f"{scraper_name} 검색 fallback 결과: {len(result) if result else 0}개 기사")
-            return result
+        # datetime-local 형식과 date 형식 모두 지원
+        if 'T' in value:
+            # datetime-local 형식: 2024-07-15T10:30
+            return datetime.strptime(value, '%Y-%m-%dT%H:%M')
+        # date 형식: 2024-07-15 (시작은 하루 시작, 종료는 하루 끝까지 포함)
+        parsed = datetime.strptime(value, '%Y-%m-%d')
+        return parsed + timedelta(days=1) if is_end else parsed
     except Exception as e:
-        logger.error(f"{scraper.__class__.__name__} 트렌딩 실패: {e}", exc_info=True)
-        return []
+        logger.debug(f"날짜 파라미터 파싱 실패 ({value}): {e}")
+        return None  # 파싱 실패시 해당 조건 무시
 
-def filter_articles_by_date(articles: List[Dict], date_from: Optional[str], date_to: Optional[str]) -> List[Dict]:
-    """날짜 범위로 기사 필터링"""
-    if not date_from and not date_to:
-        return articles
+def make_date_filter(date_from: Optional[str], date_to: Optional[str]) -> Callable[[Article], bool]:
+    """날짜 범위 조건을 기사 단위 판별 함수로 변환"""
+    from_date = parse_date_bound(date_from, is_end=False)
+    to_date = parse_date_bound(date_to, is_end=True)
     
-    filtered_articles = []
-    
-    for article in articles:
+    def in_range(article: Article) -> bool:
         try:
-            published_date = article.get('published_date', '')
+            published_date = article.published_date
             if not published_date:
                 # 날짜 정보가 없는 기사는 포함 (또는 제외할 수도 있음)
-                filtered_articles.append(article)
-                continue
+                return True
             
             # 다양한 날짜 형식 파싱 시도
             article_date = parse_article_date(published_date)
             if not article_date:
                 # 파싱 실패한 기사는 포함
-                filtered_articles.append(article)
-                continue
+                return True
             
             # 날짜 범위 체크
-            date_in_range = True
-            
-            if date_from:
-                try:
-                    # datetime-local 형식과 date 형식 모두 지원
-                    if 'T' in date_from:
-                        # datetime-local 형식: 2024-07-15T10:30
-                        from_date = datetime.strptime(date_from, '%Y-%m-%dT%H:%M')
-                    else:
-                        # date 형식: 2024-07-15 (하루 시작으로 설정)
-                        from_date = datetime.strptime(date_from, '%Y-%m-%d')
-                    
-                    if article_date < from_date:
-                        date_in_range = False
-                except Exception as e:
-                    logger.debug(f"date_from 파싱 실패 ({date_from}): {e}")
-                    pass  # date_from 파싱 실패시 무시
-            
-            if date_to and date_in_range:
-                try:
-                    # datetime-local 형식과 date 형식 모두 지원
-                    if 'T' in date_to:
-                        # datetime-local 형식: 2024-07-15T22:30
-                        to_date = datetime.strptime(date_to, '%Y-%m-%dT%H:%M')
-                    else:
-                        # date 형식: 2024-07-15 (하루 끝까지 포함)
-                        to_date = datetime.strptime(date_to, '%Y-%m-%d') + timedelta(days=1)
-                    
-                    if article_date >= to_date:
-                        date_in_range = False
-                except Exception as e:
-                    logger.debug(f"date_to 파싱 실패 ({date_to}): {e}")
-                    pass  # date_to 파싱 실패시 무시
-            
-            if date_in_range:
-                filtered_articles.append(article)
-                
+            if from_date and article_date < from_date:
+                return False
+            if to_date and article_date >= to_date:
+                return False
+            return True
         except Exception as e:
             logger.debug(f"날짜 필터링 중 오류: {e}")
             # 오류 발생시 해당 기사는 포함
-            filtered_articles.append(article)
+            return True
     
-    return filtered_articles
+    return in_range
+
+def filter_articles_by_date(articles: List[Article], date_from: Optional[str], date_to: Optional[str]) -> List[Article]:
+    """날짜 범위로 기사 필터링"""
+    if not date_from and not date_to:
+        return articles
+    in_range = make_date_filter(date_from, date_to)
+    return [article for article in articles if in_range(article)]
 
 def parse_article_date(date_string: str) -> Optional[datetime]:
     """다양한 날짜 형식을 파싱"""
@@ -193,6 +132,7 @@ def parse_article_date(date_string: str) -> Optional[datetime]:
 
 @router.get("/search")
 async def search_news(
+    request: Request,
     query: str = Query(..., description="검색할 키워드"),
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     per_site_limit: int = Query(10, ge=1, le=10, description="사이트당 가져올 기사 수 (1-10)"),
@@ -201,143 +141,58 @@ async def search_news(
     date_from: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD 형식)"),
     date_to: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD 형식)"),
     group_by_source: bool = Query(False, description="출처별로 그룹핑하여 반환할지 여부")
-) -> Dict:
+) -> Response:
     """뉴스 통합 검색 (사이트별 페이지네이션 및 출처별 그룹핑 지원, 지역별/언어별 필터링)"""
     try:
-        logger.info(f"뉴스 통합 검색 요청: {query}, 페이지: {page}, 사이트당: {per_site_limit}개, 사이트: {sources}, 그룹핑: {group_by_source}")
-        
-        # 검색할 사이트 파싱 및 그룹 확장
-        requested_sources = [s.strip().lower() for s in sources.split(",")] if sources != "all" else ["all"]
-        
-        # 지역별/언어별 그룹을 실제 사이트 목록으로 확장
-        expanded_sources = []
-        
-        # 지역별 그룹핑 매핑
-        region_groups = {
-            "asia": ["scmp", "vnexpress", "bangkokpost", "asahi", "yomiuri", "thethaiger"],
-            "europe": ["bbc", "thesun", "dailymail"],
-            "north_america": ["nypost"],
-            "english": ["bbc", "thesun", "nypost", "dailymail", "scmp", "bangkokpost", "thethaiger"],
-            "asian": ["vnexpress", "asahi", "yomiuri"]
-        }
+        key = cache_key("search", query, page, per_site_limit, sources, sort, date_from, date_to, group_by_source)
+        cached = search_cache.get(key)
+        if cached is not None:
+            logger.info(f"뉴스 검색 캐시 사용: {query}")
+            return payload_response(request, cached)
         
-        for source in requested_sources:
-            if source == "all":
-                expanded_sources = ["all"]
-                break
-            elif source in region_groups:
-                # 지역/언어 그룹을 개별 사이트로 확장
-                expanded_sources.extend(region_groups[source])
-                logger.info(f"검색: 그룹 '{source}' 확장: {region_groups[source]}")
-            else:
-                # 개별 사이트 추가
-                expanded_sources.append(source)
-        
-        # 중복 제거
-        if "all" not in expanded_sources:
-            expanded_sources = list(set(expanded_sources))
-            logger.info(f"검색: 최종 사이트 목록: {expanded_sources}")
+        logger.info(f"뉴스 통합 검색 요청: {query}, 페이지: {page}, 사이트당: {per_site_limit}개, 사이트: {sources}, 그룹핑: {group_by_source}")
         
-        requested_sources = expanded_sources
+        # 검색할 사이트 파싱 및 그룹 확장 (레지스트리 기반)
+        selected_sources = expand_sources(sources)
+        logger.info(f"최종 사이트 목록: {selected_sources}")
         
         # 각 사이트에서 페이지별로 가져올 기사 수 계산
         # 페이지네이션을 위해 더 많이 가져온 후 필요한 부분만 추출
         fetch_limit = page * per_site_limit
         
-        # 병렬로 여러 사이트에서 검색 (최적화된 병렬 처리)
-        max_workers = int(os.getenv('MAX_WORKERS', '4'))  # 적절한 병렬성 유지
-        scraper_timeout = int(os.getenv('SCRAPER_TIMEOUT', '15'))  # 무료 서버를 고려해 넉넉하게
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 각 스크래퍼별로 Future 생성 (필터링 적용)
-            futures = {}
-            
-            if sources == "all" or "bbc" in requested_sources:
-                futures[executor.submit(run_scraper_search, bbc_scraper, query, fetch_limit)] = "BBC News"
-            if sources == "all" or "vnexpress" in requested_sources:
-                futures[executor.submit(run_scraper_search, vnexpress_scraper, query, fetch_limit)] = "VN Express"
-            if sources == "all" or "bangkokpost" in requested_sources:
-                futures[executor.submit(run_scraper_search, bangkokpost_scraper, query, fetch_limit)] = "Bangkok Post"
-            if sources == "all" or "asahi" in requested_sources:
-                futures[executor.submit(run_scraper_search, asahi_scraper, query, fetch_limit)] = "Asahi Shimbun"
-            if sources == "all" or "yomiuri" in requested_sources:
-                futures[executor.submit(run_scraper_search, yomiuri_scraper, query, fetch_limit)] = "Yomiuri Shimbun"
-            if sources == "all" or "thesun" in requested_sources:
-                futures[executor.submit(run_scraper_search, thesun_scraper, query, fetch_limit)] = "The Sun"
-            if sources == "all" or "nypost" in requested_sources:
-                futures[executor.submit(run_scraper_search, nypost_scraper, query, fetch_limit)] = "NY Post"
-            if sources == "all" or "dailymail" in requested_sources:
-                futures[executor.submit(run_scraper_search, dailymail_scraper, query, fetch_limit)] = "Daily Mail"
-            if sources == "all" or "scmp" in requested_sources:
-                futures[executor.submit(run_scraper_search, scmp_scraper, query, fetch_limit)] = "SCMP"
-            if sources == "all" or "thethaiger" in requested_sources:
-                futures[executor.submit(run_scraper_search, thethaiger_scraper, query, fetch_limit)] = "The Thaiger"
-            
-            # 결과 수집
-            all_articles = []
-            articles_by_source = {}  # 출처별 그룹핑용
-            active_sources = []
-            
-            # 개별 future별로 타임아웃 적용 (더 안정적)
-            for future in futures:
-                source_name = futures[future]
-                try:
-                    articles = future.result(timeout=scraper_timeout)
-                    if articles:
-                        # 페이지네이션 적용: 해당 페이지에 해당하는 기사만 추출
-                        start_idx = (page - 1) * per_site_limit
-                        end_idx = start_idx + per_site_limit
-                        page_articles = articles[start_idx:end_idx]
-                        
-                        if page_articles:
-                            all_articles.extend(page_articles)
-                            articles_by_source[source_name] = page_articles  # 출처별 저장
-                            active_sources.append(source_name)
-                            logger.info(f"{source_name}에서 페이지 {page}: {len(page_articles)}개 기사 수집")
-                except concurrent.futures.TimeoutError:
-                    logger.warning(f"{source_name} 검색 타임아웃 ({scraper_timeout}초)")
-                except Exception as e:
-                    logger.error(f"{source_name} 검색 실패: {e}")
-        
-        # 정렬 적용
-        if all_articles:
-            if sort == "date_desc":
-                # 날짜 순으로 정렬 (최신순)
-                all_articles.sort(key=lambda x: x.get('published_date', ''), reverse=True)
-            elif sort == "date_asc":
-                # 날짜 순으로 정렬 (과거순)
-                all_articles.sort(key=lambda x: x.get('published_date', ''), reverse=False)
-            elif sort == "relevance":
-                # 관련도 순으로 정렬
-                all_articles.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+        # 병렬로 여러 사이트에서 검색 (레지스트리의 async 인터페이스로 일괄 실행)
+        specs = select_scrapers(selected_sources, CAP_SEARCH)
+        results = await gather_sources(specs, lambda spec: spec.search(query, fetch_limit))
+        
+        # 결과 수집 (기사는 저장소에 한 번만 보관하고 출처별로는 인덱스만 유지)
+        store = ArticleStore()
+        active_sources = []
+        
+        for spec, articles, error in results:
+            source_name = spec.name
+            if isinstance(error, asyncio.TimeoutError):
+                logger.warning(f"{source_name} 검색 타임아웃 ({error})")
+            elif articles:
+                # 페이지네이션 적용: 해당 페이지에 해당하는 기사만 추출
+                start_idx = (page - 1) * per_site_limit
+                end_idx = start_idx + per_site_limit
+                page_articles = articles[start_idx:end_idx]
+                
+                if page_articles:
+                    store.add(source_name, page_articles)
+                    active_sources.append(source_name)
+                    logger.info(f"{source_name}에서 페이지 {page}: {len(page_articles)}개 기사 수집")
         
-        # 출처별 그룹핑된 기사들도 정렬
-        if articles_by_source:
-            for source_name in articles_by_source:
-                source_articles = articles_by_source[source_name]
-                if sort == "date_desc":
-                    source_articles.sort(key=lambda x: x.get('published_date', ''), reverse=True)
-                elif sort == "date_asc":
-                    source_articles.sort(key=lambda x: x.get('published_date', ''), reverse=False)
-                elif sort == "relevance":
-                    source_articles.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-                articles_by_source[source_name] = source_articles
+        # 정렬 적용 (전체 순서 한 번만 정렬 - 출처별 순서도 여기서 결정)
+        store.sort(sort)
         
-        # 날짜 범위 필터링 적용
+        # 날짜 범위 필터링 적용 (한 번만)
         if date_from or date_to:
-            all_articles = filter_articles_by_date(all_articles, date_from, date_to)
-            logger.info(f"날짜 범위 필터링 적용: 시작={date_from}, 종료={date_to}, 필터링 후 기사 수: {len(all_articles)}")
-            
-            # 출처별 그룹핑된 기사들도 날짜 필터링 적용
-            if articles_by_source:
-                for source_name in list(articles_by_source.keys()):
-                    filtered_source_articles = filter_articles_by_date(articles_by_source[source_name], date_from, date_to)
-                    if filtered_source_articles:
-                        articles_by_source[source_name] = filtered_source_articles
-                    else:
-                        del articles_by_source[source_name]  # 필터링 후 기사가 없으면 제거
+            store.filter(make_date_filter(date_from, date_to))
+            logger.info(f"날짜 범위 필터링 적용: 시작={date_from}, 종료={date_to}, 필터링 후 기사 수: {len(store)}")
         
         # 다음 페이지 여부 확인 (간단히 현재 페이지에서 기사가 있다면 다음 페이지도 있을 가능성이 있다고 가정)
-        has_next_page = len(all_articles) > 0
+        has_next_page = len(store) > 0
         
         # 응답 구성
         response = {
@@ -345,22 +200,26 @@ async def search_news(
             "query": query,
             "page": page,
             "per_site_limit": per_site_limit,
-            "total_articles": len(all_articles),
+            "total_articles": len(store),
             "active_sources": active_sources,
             "has_next_page": has_next_page,
             "group_by_source": group_by_source
         }
         
+        # 요청한 형태만 생성
         if group_by_source:
             # 출처별 그룹핑된 결과 반환
-            response["articles_by_source"] = articles_by_source
+            response["articles_by_source"] = store.grouped()
             response["articles"] = []  # 그룹핑할 때는 전체 리스트는 비움
         else:
             # 일반적인 통합 결과 반환
-            response["articles"] = all_articles
+            response["articles"] = store.flat()
             response["articles_by_source"] = {}  # 그룹핑하지 않을 때는 비움
         
-        return response
+        # 결과가 있을 때만 캐시 (전체 실패 결과는 캐시하지 않음)
+        if active_sources:
+            return payload_response(request, search_cache.put(key, response))
+        return payload_response(request, CachedPayload.from_content(response))
         
     except Exception as e:
         logger.error(f"뉴스 검색 실패: {e}")
@@ -376,111 +235,31 @@ async def get_latest_news(
     try:
         logger.info(f"최신 뉴스 요청: {category}, 소스: {source}")
         
+        # 선택된 소스의 최신 뉴스를 병렬로 수집
+        specs = select_scrapers(expand_sources(source), CAP_LATEST)
+        results = await gather_sources(specs, lambda spec: spec.latest(category, limit))
+        
         all_articles = []
         sources = []
-        
-        if source == "all" or source == "bbc":
-            try:
-                bbc_articles = bbc_scraper.get_latest_news(category, limit)
-                if bbc_articles:
-                    all_articles.extend(bbc_articles)
-                    sources.append("BBC News")
-            except Exception as e:
-                logger.error(f"BBC 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "nypost":
-            try:
-                nypost_articles = nypost_scraper.get_latest_news(category, limit)
-                if nypost_articles:
-                    all_articles.extend(nypost_articles)
-                    sources.append("NY Post")
-            except Exception as e:
-                logger.error(f"NY Post 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "thesun":
-            try:
-                thesun_articles = thesun_scraper.get_latest_news(category, limit)
-                if thesun_articles:
-                    all_articles.extend(thesun_articles)
-                    sources.append("The Sun")
-            except Exception as e:
-                logger.error(f"The Sun 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "dailymail":
-            try:
-                dailymail_articles = dailymail_scraper.get_latest_news(category, limit)
-                if dailymail_articles:
-                    all_articles.extend(dailymail_articles)
-                    sources.append("Daily Mail")
-            except Exception as e:
-                logger.error(f"Daily Mail 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "scmp":
-            try:
-                scmp_articles = scmp_scraper.get_latest_news(category, limit)
-                if scmp_articles:
-                    all_articles.extend(scmp_articles)
-                    sources.append("SCMP")
-            except Exception as e:
-                logger.error(f"SCMP 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "vnexpress":
-            try:
-                vnexpress_articles = vnexpress_scraper.get_latest_news(category, limit)
-                if vnexpress_articles:
-                    all_articles.extend(vnexpress_articles)
-                    sources.append("VN Express")
-            except Exception as e:
-                logger.error(f"VN Express 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "bangkokpost":
-            try:
-                bangkokpost_articles = bangkokpost_scraper.get_latest_news(category, limit)
-                if bangkokpost_articles:
-                    all_articles.extend(bangkokpost_articles)
-                    sources.append("Bangkok Post")
-            except Exception as e:
-                logger.error(f"Bangkok Post 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "asahi":
-            try:
-                asahi_articles = asahi_scraper.get_latest_news(category, limit)
-                if asahi_articles:
-                    all_articles.extend(asahi_articles)
-                    sources.append("Asahi Shimbun")
-            except Exception as e:
-                logger.error(f"Asahi Shimbun 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "yomiuri":
-            try:
-                yomiuri_articles = yomiuri_scraper.get_latest_news(category, limit)
-                if yomiuri_articles:
-                    all_articles.extend(yomiuri_articles)
-                    sources.append("Yomiuri Shimbun")
-            except Exception as e:
-                logger.error(f"Yomiuri Shimbun 최신 뉴스 실패: {e}")
-        
-        if source == "all" or source == "thethaiger":
-            try:
-                thethaiger_articles = thethaiger_scraper.get_latest_news(category, limit)
-                if thethaiger_articles:
-                    all_articles.extend(thethaiger_articles)
-                    sources.append("The Thaiger")
-            except Exception as e:
-                logger.error(f"The Thaiger 최신 뉴스 실패: {e}")
+        for spec, articles, error in results:
+            if isinstance(error, asyncio.TimeoutError):
+                logger.warning(f"{spec.name} 최신 뉴스 타임아웃 ({error})")
+            elif articles:
+                all_articles.extend(articles)
+                sources.append(spec.name)
         
         # 날짜 순으로 정렬
         if all_articles:
-            all_articles.sort(key=lambda x: x.get('published_date', ''), reverse=True)
+            sort_articles(all_articles, "date_desc")
             all_articles = all_articles[:limit]
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "category": category,
             "total_articles": len(all_articles),
             "sources": sources,
             "articles": all_articles
-        }
+        })
         
     except Exception as e:
         logger.error(f"최신 뉴스 가져오기 실패: {e}")
@@ -488,99 +267,48 @@ async def get_latest_news(
 
 @router.get("/trending")
 async def get_trending_news(
+    request: Request,
     category: str = Query("all", description="카테고리 (all, news, sports, business, technology, entertainment)"),
     limit: int = Query(2, ge=1, le=10, description="사이트당 가져올 기사 수 (1-10)"),
     sources: str = Query("all", description="검색할 사이트 (all, asia, europe, north_america, english, asian, 또는 구체적인 사이트명들을 콤마로 구분)")
-) -> Dict:
+) -> Response:
     """각 사이트별 인기/트렌딩 뉴스 가져오기 (지역별/언어별 필터링 지원)"""
     try:
-        logger.info(f"트렌딩 뉴스 요청: 카테고리={category}, 사이트당={limit}개, 사이트={sources}")
-        
-        # 검색할 사이트 파싱 및 그룹 확장
-        requested_sources = [s.strip().lower() for s in sources.split(",")] if sources != "all" else ["all"]
-        
-        # 지역별/언어별 그룹을 실제 사이트 목록으로 확장
-        expanded_sources = []
+        key = cache_key("trending", category, limit, sources)
+        cached = trending_cache.get(key)
+        if cached is not None:
+            logger.info(f"트렌딩 뉴스 캐시 사용: 카테고리={category}, 사이트={sources}")
+            return payload_response(request, cached)
         
-        # 지역별 그룹핑 매핑
-        region_groups = {
-            "asia": ["scmp", "vnexpress", "bangkokpost", "asahi", "yomiuri", "thethaiger"],
-            "europe": ["bbc", "thesun", "dailymail"],
-            "north_america": ["nypost"],
-            "english": ["bbc", "thesun", "nypost", "dailymail", "scmp", "bangkokpost", "thethaiger"],
-            "asian": ["vnexpress", "asahi", "yomiuri"]
-        }
-        
-        for source in requested_sources:
-            if source == "all":
-                expanded_sources = ["all"]
-                break
-            elif source in region_groups:
-                # 지역/언어 그룹을 개별 사이트로 확장
-                expanded_sources.extend(region_groups[source])
-                logger.info(f"그룹 '{source}' 확장: {region_groups[source]}")
-            else:
-                # 개별 사이트 추가
-                expanded_sources.append(source)
-        
-        # 중복 제거
-        if "all" not in expanded_sources:
-            expanded_sources = list(set(expanded_sources))
-            logger.info(f"최종 사이트 목록: {expanded_sources}")
-        
-        requested_sources = expanded_sources
+        logger.info(f"트렌딩 뉴스 요청: 카테고리={category}, 사이트당={limit}개, 사이트={sources}")
         
-        # 병렬로 여러 사이트에서 트렌딩 뉴스 가져오기 (카테고리 직접 전달)
-        max_workers = int(os.getenv('MAX_WORKERS', '4'))  # 적절한 병렬성 유지
-        scraper_timeout = int(os.getenv('SCRAPER_TIMEOUT', '15'))  # 무료 서버를 고려해 넉넉하게
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {}
-            
-            if sources == "all" or "bbc" in requested_sources:
-                futures[executor.submit(run_scraper_trending, bbc_scraper, category, limit)] = "BBC News"
-            if sources == "all" or "vnexpress" in requested_sources:
-                futures[executor.submit(run_scraper_trending, vnexpress_scraper, category, limit)] = "VN Express"
-            if sources == "all" or "bangkokpost" in requested_sources:
-                futures[executor.submit(run_scraper_trending, bangkokpost_scraper, category, limit)] = "Bangkok Post"
-            if sources == "all" or "asahi" in requested_sources:
-                futures[executor.submit(run_scraper_trending, asahi_scraper, category, limit)] = "Asahi Shimbun"
-            if sources == "all" or "yomiuri" in requested_sources:
-                futures[executor.submit(run_scraper_trending, yomiuri_scraper, category, limit)] = "Yomiuri Shimbun"
-            if sources == "all" or "thesun" in requested_sources:
-                futures[executor.submit(run_scraper_trending, thesun_scraper, category, limit)] = "The Sun"
-            if sources == "all" or "nypost" in requested_sources:
-                futures[executor.submit(run_scraper_trending, nypost_scraper, category, limit)] = "NY Post"
-            if sources == "all" or "dailymail" in requested_sources:
-                futures[executor.submit(run_scraper_trending, dailymail_scraper, category, limit)] = "Daily Mail"
-            if sources == "all" or "scmp" in requested_sources:
-                futures[executor.submit(run_scraper_trending, scmp_scraper, category, limit)] = "SCMP"
-            if sources == "all" or "thethaiger" in requested_sources:
-                futures[executor.submit(run_scraper_trending, thethaiger_scraper, category, limit)] = "The Thaiger"
-            
-            # 결과 수집 (사이트별로 분리)
-            trending_by_source = {}
-            active_sources = []
-            total_articles = 0
-            
-            # 개별 future별로 타임아웃 적용 (더 안정적)
-            for future in futures:
-                source_name = futures[future]
-                try:
-                    articles = future.result(timeout=scraper_timeout)
-                    if articles:
-                        # 카테고리 필터링 비활성화 - 스크래퍼가 이미 카테고리별 검색을 수행
-                        # 스크래퍼에서 반환하는 모든 기사를 그대로 사용
-                        
-                        trending_by_source[source_name] = articles[:limit]
-                        active_sources.append(source_name)
-                        total_articles += len(articles[:limit])
-                        logger.info(f"{source_name}에서 {len(articles[:limit])}개 트렌딩 뉴스 수집")
-                except concurrent.futures.TimeoutError:
-                    logger.warning(f"{source_name} 트렌딩 뉴스 타임아웃 ({scraper_timeout}초)")
-                except Exception as e:
-                    logger.error(f"{source_name} 트렌딩 뉴스 수집 실패: {e}")
+        # 검색할 사이트 파싱 및 그룹 확장 (레지스트리 기반)
+        selected_sources = expand_sources(sources)
+        logger.info(f"최종 사이트 목록: {selected_sources}")
+        
+        # 병렬로 여러 사이트에서 트렌딩 뉴스 가져오기 (카테고리는 스크래퍼별 매핑 적용)
+        specs = select_scrapers(selected_sources)
+        results = await gather_sources(specs, lambda spec: spec.trending(category, limit))
+        
+        # 결과 수집 (사이트별로 분리)
+        trending_by_source = {}
+        active_sources = []
+        total_articles = 0
+        
+        for spec, articles, error in results:
+            source_name = spec.name
+            if isinstance(error, asyncio.TimeoutError):
+                logger.warning(f"{source_name} 트렌딩 뉴스 타임아웃 ({error})")
+            elif articles:
+                # 카테고리 필터링 비활성화 - 스크래퍼가 이미 카테고리별 검색을 수행
+                # 스크래퍼에서 반환하는 모든 기사를 그대로 사용
+                
+                trending_by_source[source_name] = articles[:limit]
+                active_sources.append(source_name)
+                total_articles += len(articles[:limit])
+                logger.info(f"{source_name}에서 {len(articles[:limit])}개 트렌딩 뉴스 수집")
         
-        return {
+        response = {
             "success": True,
             "category": category,
             "total_articles": total_articles,
@@ -589,6 +317,11 @@ async def get_trending_news(
             "last_updated": datetime.now().isoformat()
         }
         
+        # 내용이 이전과 같으면 기존 payload(ETag 포함)를 유지 - last_updated는 버전 계산에서 제외
+        if active_sources:
+            return payload_response(request, trending_cache.put(key, response, volatile_keys=("last_updated",)))
+        return payload_response(request, CachedPayload.from_content(response))
+        
     except Exception as e:
         logger.error(f"트렌딩 뉴스 가져오기 실패: {e}")
         raise HTTPException(status_code=500, detail=f"트렌딩 뉴스 가져오기 실패: {str(e)}")
@@ -601,7 +334,7 @@ async def get_trending_news_stream(
 ) -> StreamingResponse:
     """스트리밍 방식으로 각 사이트별 트렌딩 뉴스 실시간 전송"""
     
-    def generate_streaming_response() -> Generator[str, None, None]:
+    async def generate_streaming_response() -> AsyncIterator[bytes]:
         try:
             logger.info(f"스트리밍 트렌딩 뉴스 요청: 카테고리={category}, 사이트당={limit}개, 사이트={sources}")
             
@@ -613,161 +346,84 @@ async def get_trending_news_stream(
                 "sources": sources,
                 "timestamp": datetime.now().isoformat()
             }
-            yield f"data: {json.dumps(start_message)}\n\n"
-            
-            # 검색할 사이트 파싱 및 그룹 확장
-            requested_sources = [s.strip().lower() for s in sources.split(",")] if sources != "all" else ["all"]
-            
-            # 지역별/언어별 그룹을 실제 사이트 목록으로 확장
-            expanded_sources = []
-            
-            # 지역별 그룹핑 매핑
-            region_groups = {
-                "asia": ["scmp", "vnexpress", "bangkokpost", "asahi", "yomiuri", "thethaiger"],
-                "europe": ["bbc", "thesun", "dailymail"],
-                "north_america": ["nypost"],
-                "english": ["bbc", "thesun", "nypost", "dailymail", "scmp", "bangkokpost", "thethaiger"],
-                "asian": ["vnexpress", "asahi", "yomiuri"]
-            }
-            
-            for source in requested_sources:
-                if source == "all":
-                    expanded_sources = ["all"]
-                    break
-                elif source in region_groups:
-                    # 지역/언어 그룹을 개별 사이트로 확장
-                    expanded_sources.extend(region_groups[source])
-                    logger.info(f"스트리밍: 그룹 '{source}' 확장: {region_groups[source]}")
-                else:
-                    # 개별 사이트 추가
-                    expanded_sources.append(source)
-            
-            # 중복 제거
-            if "all" not in expanded_sources:
-                expanded_sources = list(set(expanded_sources))
-                logger.info(f"스트리밍: 최종 사이트 목록: {expanded_sources}")
-            
-            requested_sources = expanded_sources
-            
-            # 카테고리를 직접 사용 (키워드 매핑 제거)
-            
-            # 스크래퍼 매핑
-            scrapers_map = {
-                "bbc": (bbc_scraper, "BBC News"),
-                "vnexpress": (vnexpress_scraper, "VN Express"),
-                "bangkokpost": (bangkokpost_scraper, "Bangkok Post"),
-                "asahi": (asahi_scraper, "Asahi Shimbun"),
-                "yomiuri": (yomiuri_scraper, "Yomiuri Shimbun"),
-                "thesun": (thesun_scraper, "The Sun"),
-                "nypost": (nypost_scraper, "NY Post"),
-                "dailymail": (dailymail_scraper, "Daily Mail"),
-                "scmp": (scmp_scraper, "SCMP"),
-                "thethaiger": (thethaiger_scraper, "The Thaiger")
-            }
+            yield sse_event(start_message)
             
-            # 선택된 스크래퍼들 필터링
-            selected_scrapers = []
-            for scraper_key, (scraper, name) in scrapers_map.items():
-                if sources == "all" or scraper_key in requested_sources:
-                    selected_scrapers.append((scraper, name, scraper_key))
+            # 검색할 사이트 파싱 및 그룹 확장 (레지스트리 기반)
+            selected_sources = expand_sources(sources)
+            logger.info(f"최종 사이트 목록: {selected_sources}")
             
-            # 병렬 실행 설정
-            max_workers = int(os.getenv('MAX_WORKERS', '4'))
-            scraper_timeout = int(os.getenv('SCRAPER_TIMEOUT', '15'))  # 스트리밍이니까 여유롭게
+            # 선택된 소스의 스크래퍼 선언
+            specs = select_scrapers(selected_sources)
             
-            total_scrapers = len(selected_scrapers)
+            total_scrapers = len(specs)
             completed_scrapers = 0
-            all_articles_by_source = {}  # 수정: 누락된 변수 추가
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # 모든 스크래퍼 실행
-                futures = {}
-                for scraper, name, key in selected_scrapers:
-                    future = executor.submit(run_scraper_trending, scraper, category, limit)
-                    futures[future] = {"name": name, "key": key}
+            all_articles_by_source = {}
+            
+            # 완료되는 대로 실시간 전송 (이벤트 루프에서 비동기로 대기)
+            async for spec, articles, error in fan_out(specs, lambda spec: spec.trending(category, limit)):
+                source_name = spec.name
+                source_key = spec.key
+                completed_scrapers += 1
+                progress = {
+                    "completed": completed_scrapers,
+                    "total": total_scrapers,
+                    "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
+                }
                 
-                # 완료되는 대로 실시간 전송 (진정한 비동기 처리)
-                for future in concurrent.futures.as_completed(futures):
-                    scraper_info = futures[future]
-                    source_name = scraper_info["name"]
-                    source_key = scraper_info["key"]
+                if isinstance(error, asyncio.TimeoutError):
+                    # 타임아웃 메시지 전송
+                    timeout_message = {
+                        "type": "source_timeout",
+                        "source": source_name,
+                        "source_key": source_key,
+                        "message": f"{source_name} 타임아웃 ({error})",
+                        "progress": progress,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    yield sse_event(timeout_message)
+                    logger.warning(f"스트리밍: {source_name} 타임아웃")
                     
-                    try:
-                        # as_completed에서 반환된 future는 이미 완료되었으므로 타임아웃 불필요
-                        articles = future.result()
-                        completed_scrapers += 1
-                        
-                        if articles:
-                            # 기사를 저장
-                            all_articles_by_source[source_name] = articles[:limit]
-                            
-                            # 성공 메시지 전송
-                            success_message = {
-                                "type": "source_complete",
-                                "source": source_name,
-                                "source_key": source_key,
-                                "articles": articles[:limit],
-                                "article_count": len(articles[:limit]),
-                                "progress": {
-                                    "completed": completed_scrapers,
-                                    "total": total_scrapers,
-                                    "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                                },
-                                "timestamp": datetime.now().isoformat()
-                            }
-                            yield f"data: {json.dumps(success_message)}\n\n"
-                            logger.info(f"스트리밍: {source_name}에서 {len(articles[:limit])}개 기사 전송 완료")
-                        else:
-                            # 빈 결과 메시지 전송
-                            empty_message = {
-                                "type": "source_empty",
-                                "source": source_name,
-                                "source_key": source_key,
-                                "message": f"{source_name}에서 기사를 찾을 수 없습니다",
-                                "progress": {
-                                    "completed": completed_scrapers,
-                                    "total": total_scrapers,
-                                    "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                                },
-                                "timestamp": datetime.now().isoformat()
-                            }
-                            yield f"data: {json.dumps(empty_message)}\n\n"
-                            
-                    except concurrent.futures.TimeoutError:
-                        completed_scrapers += 1
-                        # 타임아웃 메시지 전송
-                        timeout_message = {
-                            "type": "source_timeout",
-                            "source": source_name,
-                            "source_key": source_key,
-                            "message": f"{source_name} 타임아웃 ({scraper_timeout}초)",
-                            "progress": {
-                                "completed": completed_scrapers,
-                                "total": total_scrapers,
-                                "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                            },
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        yield f"data: {json.dumps(timeout_message)}\n\n"
-                        logger.warning(f"스트리밍: {source_name} 타임아웃")
-                        
-                    except Exception as e:
-                        completed_scrapers += 1
-                        # 에러 메시지 전송
-                        error_message = {
-                            "type": "source_error",
-                            "source": source_name,
-                            "source_key": source_key,
-                            "message": f"{source_name} 오류: {str(e)}",
-                            "progress": {
-                                "completed": completed_scrapers,
-                                "total": total_scrapers,
-                                "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                            },
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        yield f"data: {json.dumps(error_message)}\n\n"
-                        logger.error(f"스트리밍: {source_name} 오류: {e}")
+                elif error is not None:
+                    # 에러 메시지 전송
+                    error_message = {
+                        "type": "source_error",
+                        "source": source_name,
+                        "source_key": source_key,
+                        "message": f"{source_name} 오류: {str(error)}",
+                        "progress": progress,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    yield sse_event(error_message)
+                    logger.error(f"스트리밍: {source_name} 오류: {error}")
+                    
+                elif articles:
+                    # 기사를 저장
+                    all_articles_by_source[source_name] = articles[:limit]
+                    
+                    # 성공 메시지 전송
+                    success_message = {
+                        "type": "source_complete",
+                        "source": source_name,
+                        "source_key": source_key,
+                        "articles": articles[:limit],
+                        "article_count": len(articles[:limit]),
+                        "progress": progress,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    yield sse_event(success_message)
+                    logger.info(f"스트리밍: {source_name}에서 {len(articles[:limit])}개 기사 전송 완료")
+                    
+                else:
+                    # 빈 결과 메시지 전송
+                    empty_message = {
+                        "type": "source_empty",
+                        "source": source_name,
+                        "source_key": source_key,
+                        "message": f"{source_name}에서 기사를 찾을 수 없습니다",
+                        "progress": progress,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    yield sse_event(empty_message)
             
             # 총 기사 개수 계산
             total_articles = sum(len(articles) for articles in all_articles_by_source.values())
@@ -780,7 +436,7 @@ async def get_trending_news_stream(
                 "total_articles": total_articles,
                 "timestamp": datetime.now().isoformat()
             }
-            yield f"data: {json.dumps(complete_message)}\n\n"
+            yield sse_event(complete_message)
             logger.info(f"스트리밍 트렌딩 뉴스 완료: {completed_scrapers}/{total_scrapers} 사이트 처리, 총 {total_articles}개 기사")
             
         except Exception as e:
@@ -790,7 +446,7 @@ async def get_trending_news_stream(
                 "message": f"스트리밍 처리 중 오류 발생: {str(e)}",
                 "timestamp": datetime.now().isoformat()
             }
-            yield f"data: {json.dumps(error_message)}\n\n"
+            yield sse_event(error_message)
             logger.error(f"스트리밍 트렌딩 뉴스 실패: {e}")
     
     return StreamingResponse(
@@ -804,158 +460,14 @@ async def get_trending_news_stream(
     )
 
 @router.get("/categories")
-async def get_categories() -> Dict:
-    """사용 가능한 카테고리 목록 반환"""
-    categories = {
-        "all": "전체 뉴스",
-        "news": "일반 뉴스",
-        "sports": "스포츠",
-        "business": "비즈니스/경제", 
-        "technology": "기술/IT",
-        "entertainment": "엔터테인먼트",
-        "health": "건강",
-        "world": "국제"
-    }
-    
-    return {
-        "success": True,
-        "categories": list(categories.keys()),
-        "descriptions": categories
-    }
+async def get_categories(request: Request) -> Response:
+    """사용 가능한 카테고리 목록 반환 (시작 시 직렬화된 응답 재사용)"""
+    return payload_response(request, CATEGORIES_PAYLOAD, cache_control="public, max-age=3600")
 
 @router.get("/sources")
-async def get_available_sources() -> Dict:
-    """사용 가능한 뉴스 소스 목록과 그룹핑 정보 반환"""
-    sources = {
-        "all": {
-            "name": "모든 사이트",
-            "description": "전체 뉴스 사이트에서 검색",
-            "region": "global",
-            "language": "multi",
-            "status": "active"
-        },
-        "bbc": {
-            "name": "BBC News",
-            "description": "영국 공영방송 BBC 뉴스",
-            "region": "europe",
-            "language": "english",
-            "url": "https://www.bbc.com",
-            "status": "active"
-        },
-        "thesun": {
-            "name": "The Sun",
-            "description": "영국 대중지 더 선",
-            "region": "europe",
-            "language": "english",
-            "url": "https://www.thesun.co.uk",
-            "status": "active"
-        },
-        "nypost": {
-            "name": "NY Post",
-            "description": "미국 뉴욕포스트",
-            "region": "north_america",
-            "language": "english",
-            "url": "https://nypost.com",
-            "status": "active"
-        },
-        "dailymail": {
-            "name": "Daily Mail",
-            "description": "영국 데일리메일",
-            "region": "europe",
-            "language": "english",
-            "url": "https://www.dailymail.co.uk",
-            "status": "active"
-        },
-        "scmp": {
-            "name": "SCMP",
-            "description": "홍콩 사우스차이나모닝포스트",
-            "region": "asia",
-            "language": "english",
-            "url": "https://www.scmp.com",
-            "status": "active"
-        },
-        "vnexpress": {
-            "name": "VN Express",
-            "description": "베트남 VN익스프레스",
-            "region": "asia",
-            "language": "vietnamese",
-            "url": "https://vnexpress.net",
-            "status": "active"
-        },
-        "bangkokpost": {
-            "name": "Bangkok Post",
-            "description": "태국 방콕포스트",
-            "region": "asia",
-            "language": "english",
-            "url": "https://www.bangkokpost.com",
-            "status": "active"
-        },
-        "asahi": {
-            "name": "Asahi Shimbun",
-            "description": "일본 아사히신문",
-            "region": "asia",
-            "language": "japanese",
-            "url": "https://www.asahi.com",
-            "status": "active"
-        },
-        "yomiuri": {
-            "name": "Yomiuri Shimbun",
-            "description": "일본 요미우리신문",
-            "region": "asia",
-            "language": "japanese", 
-            "url": "https://www.yomiuri.co.jp",
-            "status": "active"
-        },
-        "thethaiger": {
-            "name": "The Thaiger",
-            "description": "태국 영문 뉴스 사이트",
-            "region": "asia",
-            "language": "english",
-            "url": "https://thethaiger.com",
-            "status": "active"
-        }
-    }
-    
-    # 지역별 그룹핑
-    regions = {
-        "asia": {
-            "name": "아시아",
-            "sources": ["scmp", "vnexpress", "bangkokpost", "asahi", "yomiuri", "thethaiger"],
-            "description": "아시아 지역 뉴스 소스"
-        },
-        "europe": {
-            "name": "유럽",
-            "sources": ["bbc", "thesun", "dailymail"],
-            "description": "유럽 지역 뉴스 소스"
-        },
-        "north_america": {
-            "name": "북미",
-            "sources": ["nypost"],
-            "description": "북미 지역 뉴스 소스"
-        }
-    }
-    
-    # 언어별 그룹핑
-    languages = {
-        "english": {
-            "name": "영어",
-            "sources": ["bbc", "thesun", "nypost", "dailymail", "scmp", "bangkokpost", "thethaiger"],
-            "description": "영어 뉴스 소스"
-        },
-        "asian": {
-            "name": "아시아 언어",
-            "sources": ["vnexpress", "asahi", "yomiuri"],
-            "description": "아시아 현지 언어 뉴스 소스"
-        }
-    }
-    
-    return {
-        "success": True,
-        "sources": sources,
-        "regions": regions,
-        "languages": languages,
-        "total_sources": len([k for k in sources.keys() if k != "all"])
-    }
+async def get_available_sources(request: Request) -> Response:
+    """사용 가능한 뉴스 소스 목록과 그룹핑 정보 반환 (시작 시 직렬화된 응답 재사용)"""
+    return payload_response(request, SOURCES_PAYLOAD, cache_control="public, max-age=3600")
 
 @router.get("/search/stream")
 async def search_news_stream(
@@ -967,7 +479,7 @@ async def search_news_stream(
 ) -> StreamingResponse:
     """스트리밍 방식으로 뉴스 검색 결과 실시간 전송"""
     
-    def generate_search_streaming_response() -> Generator[str, None, None]:
+    async def generate_search_streaming_response() -> AsyncIterator[bytes]:
         try:
             logger.info(f"스트리밍 검색 요청: query={query}, 페이지={page}, 사이트당={per_site_limit}개, 사이트={sources}")
             
@@ -981,160 +493,106 @@ async def search_news_stream(
                 "sort": sort,
                 "timestamp": datetime.now().isoformat()
             }
-            yield f"data: {json.dumps(start_message)}\n\n"
+            yield sse_event(start_message)
             
-            # 검색할 사이트 파싱
-            requested_sources = [s.strip().lower() for s in sources.split(",")] if sources != "all" else ["all"]
+            # 검색할 사이트 파싱 및 그룹 확장 (레지스트리 기반)
+            selected_sources = expand_sources(sources)
             
             # 각 사이트에서 페이지별로 가져올 기사 수 계산
             fetch_limit = page * per_site_limit
             
-            # 스크래퍼 매핑
-            scrapers_map = {
-                "bbc": (bbc_scraper, "BBC News"),
-                "vnexpress": (vnexpress_scraper, "VN Express"),
-                "bangkokpost": (bangkokpost_scraper, "Bangkok Post"),
-                "asahi": (asahi_scraper, "Asahi Shimbun"),
-                "yomiuri": (yomiuri_scraper, "Yomiuri Shimbun"),
-                "thesun": (thesun_scraper, "The Sun"),
-                "nypost": (nypost_scraper, "NY Post"),
-                "dailymail": (dailymail_scraper, "Daily Mail"),
-                "scmp": (scmp_scraper, "SCMP"),
-                "thethaiger": (thethaiger_scraper, "The Thaiger")
-            }
-            
-            # 선택된 스크래퍼들 필터링
-            selected_scrapers = []
-            for scraper_key, (scraper, name) in scrapers_map.items():
-                if sources == "all" or scraper_key in requested_sources:
-                    selected_scrapers.append((scraper, name, scraper_key))
+            # 선택된 소스의 스크래퍼 선언
+            specs = select_scrapers(selected_sources, CAP_SEARCH)
             
-            # 병렬 실행 설정
-            max_workers = int(os.getenv('MAX_WORKERS', '4'))
-            scraper_timeout = int(os.getenv('SCRAPER_TIMEOUT', '15'))  # 무료 서버를 고려해 넉넉하게
-            
-            total_scrapers = len(selected_scrapers)
+            total_scrapers = len(specs)
             completed_scrapers = 0
             all_articles = []
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # 모든 스크래퍼 실행
-                futures = {}
-                for scraper, name, key in selected_scrapers:
-                    future = executor.submit(run_scraper_search, scraper, query, fetch_limit)
-                    futures[future] = {"name": name, "key": key}
+            # 완료되는 대로 실시간 전송 (이벤트 루프에서 비동기로 대기)
+            async for spec, articles, error in fan_out(specs, lambda spec: spec.search(query, fetch_limit)):
+                source_name = spec.name
+                source_key = spec.key
+                completed_scrapers += 1
+                progress = {
+                    "completed": completed_scrapers,
+                    "total": total_scrapers,
+                    "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
+                }
                 
-                # 완료되는 대로 실시간 전송 (진정한 병렬 처리로 병목 제거)
-                for future in concurrent.futures.as_completed(futures):
-                    scraper_info = futures[future]
-                    source_name = scraper_info["name"]
-                    source_key = scraper_info["key"]
+                if isinstance(error, asyncio.TimeoutError):
+                    # 타임아웃 메시지 전송
+                    timeout_message = {
+                        "type": "source_timeout",
+                        "source": source_name,
+                        "source_key": source_key,
+                        "message": f"{source_name} 검색 타임아웃 ({error})",
+                        "progress": progress,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    yield sse_event(timeout_message)
+                    logger.warning(f"스트리밍 검색: {source_name} 타임아웃")
+                    
+                elif error is not None:
+                    # 에러 메시지 전송
+                    error_message = {
+                        "type": "source_error",
+                        "source": source_name,
+                        "source_key": source_key,
+                        "message": f"{source_name} 검색 오류: {str(error)}",
+                        "progress": progress,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    yield sse_event(error_message)
+                    logger.error(f"스트리밍 검색: {source_name} 오류: {error}")
                     
-                    try:
-                        # as_completed에서 반환된 future는 이미 완료되었으므로 타임아웃 불필요
-                        articles = future.result()
-                        completed_scrapers += 1
+                elif articles:
+                    # 페이지네이션 적용
+                    start_idx = (page - 1) * per_site_limit
+                    end_idx = start_idx + per_site_limit
+                    page_articles = articles[start_idx:end_idx]
+                    
+                    if page_articles:
+                        all_articles.extend(page_articles)
                         
-                        if articles:
-                            # 페이지네이션 적용
-                            start_idx = (page - 1) * per_site_limit
-                            end_idx = start_idx + per_site_limit
-                            page_articles = articles[start_idx:end_idx]
-                            
-                            if page_articles:
-                                all_articles.extend(page_articles)
-                                
-                                # 성공 메시지 전송
-                                success_message = {
-                                    "type": "source_complete",
-                                    "source": source_name,
-                                    "source_key": source_key,
-                                    "articles": page_articles,
-                                    "article_count": len(page_articles),
-                                    "progress": {
-                                        "completed": completed_scrapers,
-                                        "total": total_scrapers,
-                                        "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                                    },
-                                    "timestamp": datetime.now().isoformat()
-                                }
-                                yield f"data: {json.dumps(success_message)}\n\n"
-                                logger.info(f"스트리밍 검색: {source_name}에서 {len(page_articles)}개 기사 전송 완료")
-                            else:
-                                # 해당 페이지에 기사가 없는 경우
-                                empty_message = {
-                                    "type": "source_empty",
-                                    "source": source_name,
-                                    "source_key": source_key,
-                                    "message": f"{source_name}에서 해당 페이지에 기사가 없습니다",
-                                    "progress": {
-                                        "completed": completed_scrapers,
-                                        "total": total_scrapers,
-                                        "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                                    },
-                                    "timestamp": datetime.now().isoformat()
-                                }
-                                yield f"data: {json.dumps(empty_message)}\n\n"
-                        else:
-                            # 검색 결과가 없는 경우
-                            empty_message = {
-                                "type": "source_empty",
-                                "source": source_name,
-                                "source_key": source_key,
-                                "message": f"{source_name}에서 '{query}' 검색 결과가 없습니다",
-                                "progress": {
-                                    "completed": completed_scrapers,
-                                    "total": total_scrapers,
-                                    "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                                },
-                                "timestamp": datetime.now().isoformat()
-                            }
-                            yield f"data: {json.dumps(empty_message)}\n\n"
-                            
-                    except concurrent.futures.TimeoutError:
-                        completed_scrapers += 1
-                        # 타임아웃 메시지 전송
-                        timeout_message = {
-                            "type": "source_timeout",
+                        # 성공 메시지 전송
+                        success_message = {
+                            "type": "source_complete",
                             "source": source_name,
                             "source_key": source_key,
-                            "message": f"{source_name} 검색 타임아웃 ({scraper_timeout}초)",
-                            "progress": {
-                                "completed": completed_scrapers,
-                                "total": total_scrapers,
-                                "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                            },
+                            "articles": page_articles,
+                            "article_count": len(page_articles),
+                            "progress": progress,
                             "timestamp": datetime.now().isoformat()
                         }
-                        yield f"data: {json.dumps(timeout_message)}\n\n"
-                        logger.warning(f"스트리밍 검색: {source_name} 타임아웃")
-                        
-                    except Exception as e:
-                        completed_scrapers += 1
-                        # 에러 메시지 전송
-                        error_message = {
-                            "type": "source_error",
+                        yield sse_event(success_message)
+                        logger.info(f"스트리밍 검색: {source_name}에서 {len(page_articles)}개 기사 전송 완료")
+                    else:
+                        # 해당 페이지에 기사가 없는 경우
+                        empty_message = {
+                            "type": "source_empty",
                             "source": source_name,
                             "source_key": source_key,
-                            "message": f"{source_name} 검색 오류: {str(e)}",
-                            "progress": {
-                                "completed": completed_scrapers,
-                                "total": total_scrapers,
-                                "percentage": round((completed_scrapers / total_scrapers) * 100, 1)
-                            },
+                            "message": f"{source_name}에서 해당 페이지에 기사가 없습니다",
+                            "progress": progress,
                             "timestamp": datetime.now().isoformat()
                         }
-                        yield f"data: {json.dumps(error_message)}\n\n"
-                        logger.error(f"스트리밍 검색: {source_name} 오류: {e}")
+                        yield sse_event(empty_message)
+                        
+                else:
+                    # 검색 결과가 없는 경우
+                    empty_message = {
+                        "type": "source_empty",
+                        "source": source_name,
+                        "source_key": source_key,
+                        "message": f"{source_name}에서 '{query}' 검색 결과가 없습니다",
+                        "progress": progress,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    yield sse_event(empty_message)
             
             # 정렬 적용
             if all_articles:
-                if sort == "date_desc":
-                    all_articles.sort(key=lambda x: x.get('published_date', ''), reverse=True)
-                elif sort == "date_asc":
-                    all_articles.sort(key=lambda x: x.get('published_date', ''), reverse=False)
-                elif sort == "relevance":
-                    all_articles.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+                sort_articles(all_articles, sort)
             
             # 완료 메시지 전송
             complete_message = {
@@ -1144,7 +602,7 @@ async def search_news_stream(
                 "total_articles": len(all_articles),
                 "timestamp": datetime.now().isoformat()
             }
-            yield f"data: {json.dumps(complete_message)}\n\n"
+            yield sse_event(complete_message)
             logger.info(f"스트리밍 검색 완료: {completed_scrapers}/{total_scrapers} 사이트 처리, 총 {len(all_articles)}개 기사")
             
         except Exception as e:
@@ -1154,7 +612,7 @@ async def search_news_stream(
                 "message": f"스트리밍 검색 처리 중 오류 발생: {str(e)}",
                 "timestamp": datetime.now().isoformat()
             }
-            yield f"data: {json.dumps(error_message)}\n\n"
+            yield sse_event(error_message)
             logger.error(f"스트리밍 검색 실패: {e}")
     
     return StreamingResponse(
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from ..core.json_codec import encode
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (Article 인코딩 결과 재사용)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return encode(content)
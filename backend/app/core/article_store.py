@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from operator import attrgetter
+from typing import Callable, Dict, List
+
+from ..models.article import Article
+
+# 정렬 방식별 (키 함수, 역순 여부)
+SORT_KEYS = {
+    "date_desc": (attrgetter('published_date'), True),
+    "date_asc": (attrgetter('published_date'), False),
+    "relevance": (attrgetter('relevance_score'), True),
+}
+
+
+def sort_articles(articles: List[Article], sort: str) -> None:
+    """정렬 방식에 따라 기사 리스트를 제자리 정렬"""
+    if sort in SORT_KEYS:
+        key, reverse = SORT_KEYS[sort]
+        articles.sort(key=key, reverse=reverse)
+
+
+class ArticleStore:
+    """검색 결과 병합용 단일 기사 저장소
+
+    기사는 한 번만 저장하고 출처별 그룹은 인덱스 뷰로만 유지한다. 정렬과
+    날짜 필터링은 전체 순서(order)에 한 번만 적용되며, 응답이 요청한 형태
+    (통합 리스트 또는 출처별 그룹)만 마지막에 만들어진다.
+    """
+
+    def __init__(self):
+        self._articles: List[Article] = []
+        self._sources: List[str] = []  # 기사 인덱스별 출처 이름
+        self._source_order: List[str] = []  # 출처 등록 순서 (그룹 응답 순서)
+        self._order: List[int] = []
+
+    def add(self, source_name: str, articles: List[Article]) -> None:
+        """출처 하나의 기사들을 저장소에 추가"""
+        if source_name not in self._source_order:
+            self._source_order.append(source_name)
+        start = len(self._articles)
+        self._articles.extend(articles)
+        self._sources.extend([source_name] * len(articles))
+        self._order.extend(range(start, len(self._articles)))
+
+    def sort(self, sort: str) -> None:
+        """전체 순서를 한 번 정렬 (안정 정렬이므로 출처별 순서도 함께 결정됨)"""
+        if sort in SORT_KEYS:
+            key, reverse = SORT_KEYS[sort]
+            articles = self._articles
+            self._order.sort(key=lambda i: key(articles[i]), reverse=reverse)
+
+    def filter(self, predicate: Callable[[Article], bool]) -> None:
+        """조건에 맞는 기사만 남김"""
+        articles = self._articles
+        self._order = [i for i in self._order if predicate(articles[i])]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def flat(self) -> List[Article]:
+        """통합 리스트 형태로 반환"""
+        articles = self._articles
+        return [articles[i] for i in self._order]
+
+    def grouped(self) -> Dict[str, List[Article]]:
+        """출처별 그룹 형태로 반환 (기사가 남지 않은 출처는 제외)"""
+        groups: Dict[str, List[Article]] = {name: [] for name in self._source_order}
+        for i in self._order:
+            groups[self._sources[i]].append(self._articles[i])
+        return {name: items for name, items in groups.items() if items}
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json으로 동작
+    orjson = None
+
+
+class JsonFragment:
+    """미리 인코딩된 JSON 조각을 제공하는 객체의 기반 클래스"""
+
+    __slots__ = ()
+
+    def to_json(self) -> bytes:
+        raise NotImplementedError
+
+    def stable_json(self) -> bytes:
+        """내용 버전 계산용 인코딩 (수집 시각 등 매번 바뀌는 값 제외)"""
+        return self.to_json()
+
+
+def dumps(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def encode(obj: Any, stable: bool = False) -> bytes:
+    """Article 조각을 재사용하면서 응답 payload를 직렬화
+
+    dict/list 는 직접 이어 붙이고, Article 같은 JsonFragment 는 ``to_json()`` 에 캐시된
+    바이트를 그대로 끼워 넣는다. 같은 Article 이 응답 안에서 여러 번 등장해도
+    (예: ``articles`` 와 ``articles_by_source``) 인코딩은 한 번만 일어난다.
+    ``stable=True`` 이면 조각 대신 ``stable_json()`` 을 사용한다 (ETag 버전 계산용).
+    """
+    if isinstance(obj, JsonFragment):
+        return obj.stable_json() if stable else obj.to_json()
+    if isinstance(obj, dict):
+        if not any(isinstance(v, (JsonFragment, dict, list, tuple)) for v in obj.values()):
+            return dumps(obj)
+        parts = [dumps(str(key)) + b':' + encode(value, stable) for key, value in obj.items()]
+        return b'{' + b','.join(parts) + b'}'
+    if isinstance(obj, (list, tuple)):
+        if not any(isinstance(item, (JsonFragment, dict, list, tuple)) for item in obj):
+            return dumps(obj)
+        return b'[' + b','.join(encode(item, stable) for item in obj) + b']'
+    return dumps(obj)
+
+
+def sse_event(message: Any) -> bytes:
+    """스트리밍 응답용 이벤트 한 건 (data: {...}\\n\\n)"""
+    return b'data: ' + encode(message) + b'\n\n'
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""뉴스 소스 메타데이터 레지스트리
+
+소스 정보, 지역/언어 그룹, 카테고리 목록을 한 곳에서 정의한다. 모듈 로드 시
+한 번만 구성되며, 라우터는 여기서 그룹 확장과 메타데이터 응답을 가져간다.
+"""
+from typing import Dict, List, Tuple
+
+# 소스별 메타데이터 (/sources 응답 순서)
+SOURCES: Dict[str, Dict] = {
+    "bbc": {
+        "name": "BBC News",
+        "description": "영국 공영방송 BBC 뉴스",
+        "region": "europe",
+        "language": "english",
+        "url": "https://www.bbc.com",
+        "status": "active"
+    },
+    "thesun": {
+        "name": "The Sun",
+        "description": "영국 대중지 더 선",
+        "region": "europe",
+        "language": "english",
+        "url": "https://www.thesun.co.uk",
+        "status": "active"
+    },
+    "nypost": {
+        "name": "NY Post",
+        "description": "미국 뉴욕포스트",
+        "region": "north_america",
+        "language": "english",
+        "url": "https://nypost.com",
+        "status": "active"
+    },
+    "dailymail": {
+        "name": "Daily Mail",
+        "description": "영국 데일리메일",
+        "region": "europe",
+        "language": "english",
+        "url": "https://www.dailymail.co.uk",
+        "status": "active"
+    },
+    "scmp": {
+        "name": "SCMP",
+        "description": "홍콩 사우스차이나모닝포스트",
+        "region": "asia",
+        "language": "english",
+        "url": "https://www.scmp.com",
+        "status": "active"
+    },
+    "vnexpress": {
+        "name": "VN Express",
+        "description": "베트남 VN익스프레스",
+        "region": "asia",
+        "language": "vietnamese",
+        "url": "https://vnexpress.net",
+        "status": "active"
+    },
+    "bangkokpost": {
+        "name": "Bangkok Post",
+        "description": "태국 방콕포스트",
+        "region": "asia",
+        "language": "english",
+        "url": "https://www.bangkokpost.com",
+        "status": "active"
+    },
+    "asahi": {
+        "name": "Asahi Shimbun",
+        "description": "일본 아사히신문",
+        "region": "asia",
+        "language": "japanese",
+        "url": "https://www.asahi.com",
+        "status": "active"
+    },
+    "yomiuri": {
+        "name": "Yomiuri Shimbun",
+        "description": "일본 요미우리신문",
+        "region": "asia",
+        "language": "japanese",
+        "url": "https://www.yomiuri.co.jp",
+        "status": "active"
+    },
+    "thethaiger": {
+        "name": "The Thaiger",
+        "description": "태국 영문 뉴스 사이트",
+        "region": "asia",
+        "language": "english",
+        "url": "https://thethaiger.com",
+        "status": "active"
+    }
+}
+
+SOURCE_KEYS: Tuple[str, ...] = tuple(SOURCES)
+
+# 지역별 그룹핑
+REGIONS: Dict[str, Dict] = {
+    "asia": {
+        "name": "아시아",
+        "sources": ["scmp", "vnexpress", "bangkokpost", "asahi", "yomiuri", "thethaiger"],
+        "description": "아시아 지역 뉴스 소스"
+    },
+    "europe": {
+        "name": "유럽",
+        "sources": ["bbc", "thesun", "dailymail"],
+        "description": "유럽 지역 뉴스 소스"
+    },
+    "north_america": {
+        "name": "북미",
+        "sources": ["nypost"],
+        "description": "북미 지역 뉴스 소스"
+    }
+}
+
+# 언어별 그룹핑
+LANGUAGES: Dict[str, Dict] = {
+    "english": {
+        "name": "영어",
+        "sources": ["bbc", "thesun", "nypost", "dailymail", "scmp", "bangkokpost", "thethaiger"],
+        "description": "영어 뉴스 소스"
+    },
+    "asian": {
+        "name": "아시아 언어",
+        "sources": ["vnexpress", "asahi", "yomiuri"],
+        "description": "아시아 현지 언어 뉴스 소스"
+    }
+}
+
+# 카테고리 설명
+CATEGORIES: Dict[str, str] = {
+    "all": "전체 뉴스",
+    "news": "일반 뉴스",
+    "sports": "스포츠",
+    "business": "비즈니스/경제",
+    "technology": "기술/IT",
+    "entertainment": "엔터테인먼트",
+    "health": "건강",
+    "world": "국제"
+}
+
+# 그룹 이름 -> 소스 키 집합 (O(1) 확장용)
+SOURCE_GROUPS: Dict[str, frozenset] = {
+    "all": frozenset(SOURCE_KEYS),
+    **{name: frozenset(group["sources"]) for name, group in REGIONS.items()},
+    **{name: frozenset(group["sources"]) for name, group in LANGUAGES.items()},
+}
+
+
+def expand_sources(sources: str) -> List[str]:
+    """sources 파라미터(all, 그룹명, 사이트명 콤마 구분)를 소스 키 목록으로 확장
+
+    결과는 레지스트리 순서를 따르며 알 수 없는 이름은 무시한다.
+    """
+    selected = set()
+    for name in sources.split(","):
+        name = name.strip().lower()
+        group = SOURCE_GROUPS.get(name)
+        if group is not None:
+            selected.update(group)
+        elif name in SOURCES:
+            selected.add(name)
+    return [key for key in SOURCE_KEYS if key in selected]
+
+
+def display_name(key: str) -> str:
+    """소스 키의 표시 이름"""
+    return SOURCES[key]["name"]
+
+
+def sources_response() -> Dict:
+    """/sources 응답 본문"""
+    return {
+        "success": True,
+        "sources": {
+            "all": {
+                "name": "모든 사이트",
+                "description": "전체 뉴스 사이트에서 검색",
+                "region": "global",
+                "language": "multi",
+                "status": "active"
+            },
+            **SOURCES
+        },
+        "regions": REGIONS,
+        "languages": LANGUAGES,
+        "total_sources": len(SOURCES)
+    }
+
+
+def categories_response() -> Dict:
+    """/categories 응답 본문"""
+    return {
+        "success": True,
+        "categories": list(CATEGORIES.keys()),
+        "descriptions": CATEGORIES
+    }
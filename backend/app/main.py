@@ -3,6 +3,8 @@ from fastapi.middleware.cors import CORSMiddleware
 import os
 
 from .api.news_router import router as news_router
+from .scrapers.browser.pool import shutdown_pool, start_warmup
+from .scrapers.registry import start_sitemap_ingestion
 
 app = FastAPI(
     title="News Search API",
@@ -32,6 +34,20 @@ app.add_middleware(
 # 뉴스 API 라우터 추가
 app.include_router(news_router)
 
+@app.on_event("startup")
+async def warm_browser_pool():
+    # 하이브리드 스크래퍼용 Chrome 세션 미리 띄우기 (Selenium 설치 시에만)
+    start_warmup()
+
+@app.on_event("startup")
+async def start_news_sitemaps():
+    # 뉴스 사이트맵 백그라운드 증분 수집 (SITEMAP_POLL_INTERVAL 주기)
+    start_sitemap_ingestion()
+
+@app.on_event("shutdown")
+async def close_browser_pool():
+    shutdown_pool()
+
 @app.get("/")
 @app.head("/")  # Render health check를 위한 HEAD 메서드 지원
 async def root():
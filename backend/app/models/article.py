@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from ..core.json_codec import JsonFragment, dumps
+
+
+class Article(JsonFragment):
+    """스크래퍼가 생성하는 기사 레코드 (__slots__ 기반 경량 객체)
+
+    기존 dict 기반 코드와의 호환을 위해 ``article['title']``, ``article.get('url')``
+    형태의 접근을 그대로 지원한다. ``source``/``category`` 는 intern 처리되어
+    같은 문자열을 공유하고, ``scraped_at`` 은 숫자 타임스탬프로 보관하다가
+    JSON 변환 시점에만 ISO 문자열로 바꾼다. 인코딩된 JSON 바이트도 캐시해
+    한 응답 안에서 같은 기사가 여러 번 직렬화되지 않게 한다. 필드를 바꾸면
+    (``article.title = ...`` 또는 ``article['title'] = ...``) 캐시를 비운다.
+    """
+
+    __slots__ = (
+        'title', 'url', 'summary', 'published_date', 'source', 'category',
+        'scraped_at', 'relevance_score', 'image_url', '_dict', '_json',
+    )
+
+    # to_dict() 출력 순서 (기존 dict 키 순서와 동일)
+    FIELDS = (
+        'title', 'url', 'summary', 'published_date', 'source', 'category',
+        'scraped_at', 'relevance_score', 'image_url',
+    )
+
+    def __init__(self, title: str = '', url: str = '', summary: str = '',
+                 published_date: str = '', source: str = '', category: str = 'news',
+                 scraped_at: Optional[float] = None, relevance_score: float = 0,
+                 image_url: str = ''):
+        self.title = title
+        self.url = url
+        self.summary = summary
+        self.published_date = published_date
+        self.source = source
+        self.category = category
+        self.scraped_at = time.time() if scraped_at is None else scraped_at
+        self.relevance_score = relevance_score
+        self.image_url = image_url
+        self._dict = None
+        self._json = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Article':
+        """기존 dict 형태의 기사를 Article로 변환"""
+        scraped_at = data.get('scraped_at')
+        if isinstance(scraped_at, str):
+            try:
+                scraped_at = datetime.fromisoformat(scraped_at).timestamp()
+            except ValueError:
+                scraped_at = None
+        return cls(
+            title=data.get('title', ''),
+            url=data.get('url', ''),
+            summary=data.get('summary', ''),
+            published_date=data.get('published_date', ''),
+            source=data.get('source', ''),
+            category=data.get('category', 'news'),
+            scraped_at=scraped_at,
+            relevance_score=data.get('relevance_score', 0),
+            image_url=data.get('image_url', ''),
+        )
+
+    @classmethod
+    def coerce(cls, item) -> 'Article':
+        """Article 또는 dict를 Article로 통일"""
+        return item if isinstance(item, cls) else cls.from_dict(item)
+
+    def copy(self) -> 'Article':
+        """같은 내용의 새 Article (캐시된 결과를 호출한 쪽에서 수정할 때 사용)"""
+        article = Article.__new__(Article)
+        for name in self.__slots__:
+            setattr(article, name, getattr(self, name))
+        return article
+
+    def to_dict(self) -> Dict:
+        """JSON 응답용 dict (최초 호출 시 한 번만 생성 후 재사용)"""
+        if self._dict is None:
+            self._dict = {
+                'title': self.title,
+                'url': self.url,
+                'summary': self.summary,
+                'published_date': self.published_date,
+                'source': self.source,
+                'category': self.category,
+                'scraped_at': datetime.fromtimestamp(self.scraped_at).isoformat(),
+                'relevance_score': self.relevance_score,
+                'image_url': self.image_url,
+            }
+        return self._dict
+
+    def to_json(self) -> bytes:
+        """인코딩된 JSON 바이트 (응답 간 재사용)"""
+        if self._json is None:
+            self._json = dumps(self.to_dict())
+        return self._json
+
+    def stable_json(self) -> bytes:
+        """scraped_at을 제외한 인코딩 (같은 기사를 다시 수집해도 동일)"""
+        return dumps((self.title, self.url, self.summary, self.published_date, self.source,
+                      self.category, self.relevance_score, self.image_url))
+
+    # dict 호환 인터페이스 (기존 스크래퍼 코드용)
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        if key == 'scraped_at':
+            return self.to_dict()['scraped_at']
+        return getattr(self, key)
+
+    def __setattr__(self, name: str, value) -> None:
+        """필드를 바꾸면 캐시된 dict/JSON 을 비움 (source/category 는 intern)"""
+        if name in ('source', 'category') and value:
+            value = sys.intern(value)
+        object.__setattr__(self, name, value)
+        if name in self.FIELDS:
+            object.__setattr__(self, '_dict', None)
+            object.__setattr__(self, '_json', None)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def get(self, key: str, default=None):
+        if key not in self.FIELDS:
+            return default
+        value = self[key]
+        return default if value is None else value
+
+    def keys(self):
+        return self.FIELDS
+
+    def __repr__(self) -> str:
+        return f"Article(source={self.source!r}, title={self.title[:40]!r})"
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import logging
@@ -9,6 +8,12 @@ import re
 import time
 from urllib.parse import quote # Added for quote function
 
+from ..models.article import Article
+from .page_snapshot import get_page
+from .endpoint_strategy import get_selector
+from .hedged_fetch import hedged_get
+from .outbound import throttled_get
+
 logger = logging.getLogger(__name__)
 
 class AsahiScraper:
@@ -33,36 +38,29 @@ class AsahiScraper:
         try:
             logger.info(f"Asahi Shimbun 검색: {query}")
             
-            # 1. API 검색 시도
-            articles = self._search_with_api(query, limit)
-            if articles:
-                logger.info(f"Asahi API에서 {len(articles)}개 기사 발견")
-                return articles
-            
-            # 2. 일반 검색 URL 시도
+            # 일반 검색 URL (후보 URL 헤지 요청 - 먼저 결과를 준 URL 사용)
             search_urls = [
                 f"https://sitesearch.asahi.com/?Keywords={quote(query)}&start=0&sort=2",
                 f"https://www.asahi.com/search/?Keywords={quote(query)}",
                 f"https://www.asahi.com/search/result?q={quote(query)}"
             ]
             
-            for search_url in search_urls:
-                try:
-                    logger.info(f"Asahi 검색 시도: {search_url}")
-                    response = requests.get(search_url, headers=self.headers, timeout=10)
-                    response.raise_for_status()
-                    response.encoding = 'utf-8'
-                    
-                    articles = self._extract_search_results(response.text, limit, query)
-                    if articles:
-                        logger.info(f"Asahi 검색에서 {len(articles)}개 기사 발견")
-                        return articles
-                    else:
-                        logger.debug(f"검색 결과 없음: {search_url}")
-                        
-                except Exception as e:
-                    logger.debug(f"Asahi 검색 URL 실패 {search_url}: {e}")
-                    continue
+            def parse(response):
+                response.encoding = 'utf-8'
+                return self._extract_search_results(response.text, limit, query)
+            
+            def search_html():
+                return hedged_get([(url, parse) for url in search_urls],
+                                  headers=self.headers, timeout=10, label="Asahi")
+            
+            # 1. API / 2. 검색 페이지 - 최근 성과가 좋은 방법부터 시도
+            articles = get_selector('asahi', 'search').first([
+                ('api', lambda: self._search_with_api(query, limit)),
+                ('html', search_html),
+            ])
+            if articles:
+                logger.info(f"Asahi 검색에서 {len(articles)}개 기사 발견")
+                return articles
             
             # 3. 최신 뉴스로 fallback
             logger.info("Asahi 검색 실패, 최신 뉴스로 대체")
@@ -79,7 +77,7 @@ class AsahiScraper:
         try:
             api_url = f"https://sitesearch.asahi.com/sitesearch-api/?Keywords={quote(query)}&start=0&sort=2"
             
-            response = requests.get(api_url, headers=self.headers, timeout=5)
+            response = throttled_get(api_url, headers=self.headers, timeout=5)
             response.raise_for_status()
             response.encoding = 'utf-8'  # 인코딩 명시적 설정
             
@@ -123,17 +121,16 @@ class AsahiScraper:
                     # 날짜 추출 시도 (기본값 사용)
                     published_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
                     
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'summary': body[:300] if body else title[:200],
-                        'published_date': published_date,
-                        'source': 'Asahi Shimbun',
-                        'category': self._extract_category_from_url(url),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url  # 실제 이미지 URL 사용
-                    }
+                    article = Article(
+                        title=title,
+                        url=url,
+                        summary=body[:300] if body else title[:200],
+                        published_date=published_date,
+                        source='Asahi Shimbun',
+                        category=self._extract_category_from_url(url),
+                        relevance_score=1,
+                        image_url=image_url  # 실제 이미지 URL 사용
+                    )
                     
                     articles.append(article)
                     
@@ -250,17 +247,16 @@ class AsahiScraper:
                         # 카테고리 추출
                         category = self._extract_category_from_url(url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else title[:200],
-                            'published_date': published_date,
-                            'source': 'Asahi Shimbun',
-                            'category': category,
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else title[:200],
+                            published_date=published_date,
+                            source='Asahi Shimbun',
+                            category=category,
+                            relevance_score=1,
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
@@ -340,50 +336,46 @@ class AsahiScraper:
     def _get_asahi_dummy_articles(self, query: str, limit: int) -> List[Dict]:
         """아사히 신문 연결 문제 해결용 더미 데이터 (임시)"""
         dummy_articles = [
-            {
-                'title': '石川県で震度5弱の地震が発生、津波の心配なし',
-                'url': 'https://www.asahi.com/articles/AST7J7HDKT7JUTFK00PM.html',
-                'summary': '石川県能登半島で震度5弱の地震が発生しました。気象庁によると津波の心配はないとのことです。',
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'Asahi Shimbun',
-                'category': 'news',
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 1,
-                'image_url': 'https://www.asahicom.jp/articles/images/earthquake_news.jpg'
-            },
-            {
-                'title': '政府、AI規制法案を今国会に提出へ　安全基準を明確化',
-                'url': 'https://www.asahi.com/articles/AST7J8NFDT7JUTFK01QM.html',
-                'summary': '政府は人工知能（AI）の安全な利用を促進するため、規制法案を今国会に提出する方針を固めました。',
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'Asahi Shimbun', 
-                'category': 'technology',
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 1,
-                'image_url': 'https://www.asahicom.jp/articles/images/ai_regulation.jpg'
-            },
-            {
-                'title': '大谷翔平、本塁打50本目　メジャー史上最速ペース',
-                'url': 'https://www.asahi.com/articles/AST7J9KFLT7JUTFK02RM.html',
-                'summary': 'エンゼルスの大谷翔平選手が今季50本目の本塁打を放ち、メジャーリーグ史上最速ペースとなりました。',
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'Asahi Shimbun',
-                'category': 'sports',
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 1,
-                'image_url': 'https://www.asahicom.jp/articles/images/ohtani_homerun.jpg'
-            },
-            {
-                'title': '円安進行、一時150円台に　日銀の対応に注目',
-                'url': 'https://www.asahi.com/articles/AST7J10HFKT7JUTFK03SM.html',
-                'summary': '外国為替市場で円安が進行し、ドル円相場が一時150円台まで下落しました。日銀の対応が注目されています。',
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'Asahi Shimbun',
-                'category': 'business',
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 1,
-                'image_url': 'https://www.asahicom.jp/articles/images/yen_dollar.jpg'
-            }
+            Article(
+                title='石川県で震度5弱の地震が発生、津波の心配なし',
+                url='https://www.asahi.com/articles/AST7J7HDKT7JUTFK00PM.html',
+                summary='石川県能登半島で震度5弱の地震が発生しました。気象庁によると津波の心配はないとのことです。',
+                published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                source='Asahi Shimbun',
+                category='news',
+                relevance_score=1,
+                image_url='https://www.asahicom.jp/articles/images/earthquake_news.jpg'
+            ),
+            Article(
+                title='政府、AI規制法案を今国会に提出へ　安全基準を明確化',
+                url='https://www.asahi.com/articles/AST7J8NFDT7JUTFK01QM.html',
+                summary='政府は人工知能（AI）の安全な利用を促進するため、規制法案を今国会に提出する方針を固めました。',
+                published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                source='Asahi Shimbun', 
+                category='technology',
+                relevance_score=1,
+                image_url='https://www.asahicom.jp/articles/images/ai_regulation.jpg'
+            ),
+            Article(
+                title='大谷翔平、本塁打50本目　メジャー史上最速ペース',
+                url='https://www.asahi.com/articles/AST7J9KFLT7JUTFK02RM.html',
+                summary='エンゼルスの大谷翔平選手が今季50本目の本塁打を放ち、メジャーリーグ史上最速ペースとなりました。',
+                published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                source='Asahi Shimbun',
+                category='sports',
+                relevance_score=1,
+                image_url='https://www.asahicom.jp/articles/images/ohtani_homerun.jpg'
+            ),
+            Article(
+                title='円安進行、一時150円台に　日銀の対応に注目',
+                url='https://www.asahi.com/articles/AST7J10HFKT7JUTFK03SM.html',
+                summary='外国為替市場で円安が進行し、ドル円相場が一時150円台まで下落しました。日銀の対応が注目されています。',
+                published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                source='Asahi Shimbun',
+                category='business',
+                relevance_score=1,
+                image_url='https://www.asahicom.jp/articles/images/yen_dollar.jpg'
+            )
         ]
         
         # 쿼리에 따라 관련 기사 필터링
@@ -502,11 +494,9 @@ class AsahiScraper:
         """Asahi 홈페이지에서 메인 뉴스 추출"""
         try:
             url = 'https://www.asahi.com'
-            response = requests.get(url, headers=self.headers, timeout=8)
-            response.raise_for_status()
-            response.encoding = 'utf-8'  # 인코딩 명시적 설정
-            
-            articles = self._extract_search_results(response.text, limit)
+            # 검색/트렌딩/최신 뉴스가 공유하는 홈페이지 스냅샷 사용 (인코딩 명시적 설정)
+            articles = get_page(url, lambda html: self._extract_search_results(html, limit),
+                                headers=self.headers, timeout=8, encoding='utf-8', variant=('homepage', limit))
             logger.info(f"Asahi 홈페이지에서 {len(articles)}개 기사 추출")
             return articles
         except Exception as e:
@@ -537,11 +527,9 @@ class AsahiScraper:
                 return []
             
             logger.info(f"Asahi {category} 섹션 접근: {url}")
-            response = requests.get(url, headers=self.headers, timeout=12)
-            response.raise_for_status()
-            response.encoding = 'utf-8'  # 인코딩 명시적 설정
-            
-            articles = self._extract_asahi_category_articles(response.text, limit, category)
+            # 섹션 페이지 스냅샷 공유 (인코딩 명시적 설정)
+            articles = get_page(url, lambda html: self._extract_asahi_category_articles(html, limit, category),
+                                headers=self.headers, timeout=12, encoding='utf-8', variant=('latest', limit, category))
             logger.info(f"Asahi {category} 섹션에서 {len(articles)}개 기사 추출")
             return articles
             
@@ -634,17 +622,16 @@ class AsahiScraper:
                             # 날짜 추출
                             published_date = self._extract_asahi_date(context, url)
                             
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary[:300] if summary else title[:200],
-                                'published_date': published_date,
-                                'source': 'Asahi Shimbun',
-                                'category': category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url
-                            }
+                            article = Article(
+                                title=title,
+                                url=url,
+                                summary=summary[:300] if summary else title[:200],
+                                published_date=published_date,
+                                source='Asahi Shimbun',
+                                category=category,
+                                relevance_score=1,
+                                image_url=image_url
+                            )
                             
                             articles.append(article)
                             
@@ -8,6 +8,10 @@ import json
 import re
 import time
 
+from ..models.article import Article
+from .conditional_fetch import fetch_parsed
+from .outbound import ENRICHMENT, throttled_get
+
 logger = logging.getLogger(__name__)
 
 class BangkokPostScraper:
@@ -42,7 +46,7 @@ class BangkokPostScraper:
             for search_url in search_urls:
                 try:
                     logger.info(f"Bangkok Post 검색 시도: {search_url}")
-                    response = requests.get(search_url, headers=self.headers, timeout=15)
+                    response = throttled_get(search_url, headers=self.headers, timeout=15)
                     response.raise_for_status()
                     
                     articles = self._extract_search_results(response.text, limit, query)
@@ -200,17 +204,16 @@ class BangkokPostScraper:
                         # 카테고리 추출
                         category = self._extract_category_from_url(url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else title[:200],
-                            'published_date': published_date,
-                            'source': 'Bangkok Post',
-                            'category': category,
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url or self._get_fallback_image(category)
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else title[:200],
+                            published_date=published_date,
+                            source='Bangkok Post',
+                            category=category,
+                            relevance_score=1,
+                            image_url=image_url or self._get_fallback_image(category)
+                        )
                         
                         articles.append(article)
                         
@@ -342,7 +345,7 @@ class BangkokPostScraper:
     def _extract_image_from_article_page(self, article_url: str) -> str:
         """실제 기사 페이지에서 메인 이미지 추출"""
         try:
-            response = requests.get(article_url, headers=self.headers, timeout=5)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=5)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -562,17 +565,15 @@ class BangkokPostScraper:
                     timeout = 10 if url != self.base_url else 20
                     logger.info(f"Bangkok Post 최신 뉴스 시도: {url} (timeout: {timeout}s)")
                     
-                    response = requests.get(url, headers=self.headers, timeout=timeout)
-                    if response.status_code == 200:
-                        # 실제 웹사이트 구조에 맞게 기사 추출
-                        articles = self._extract_bangkokpost_articles(response.text, limit, category)
-                        if articles:
-                            logger.info(f"Bangkok Post {url}에서 {len(articles)}개 기사 수집 성공")
-                            return articles
-                        else:
-                            logger.debug(f"Bangkok Post {url}에서 기사 추출 실패")
+                    # 조건부 GET - 페이지가 바뀌지 않았으면 이전 추출 결과 재사용
+                    # 실제 웹사이트 구조에 맞게 기사 추출
+                    articles = fetch_parsed(url, lambda html: self._extract_bangkokpost_articles(html, limit, category),
+                                            headers=self.headers, timeout=timeout, variant=(limit, category))
+                    if articles:
+                        logger.info(f"Bangkok Post {url}에서 {len(articles)}개 기사 수집 성공")
+                        return articles
                     else:
-                        logger.debug(f"Bangkok Post {url} 응답 코드: {response.status_code}")
+                        logger.debug(f"Bangkok Post {url}에서 기사 추출 실패")
                 
                 except requests.exceptions.Timeout:
                     logger.debug(f"Bangkok Post {url} 타임아웃 (timeout: {timeout}s)")
@@ -697,17 +698,16 @@ class BangkokPostScraper:
                                 # sports나 business 등 특정 카테고리가 요청됐는데 다른 카테고리면 스킵
                                 continue
                             
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary[:300] if summary else title[:200],
-                                'published_date': published_date,
-                                'source': 'Bangkok Post',
-                                'category': article_category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url or self._get_fallback_image(article_category)
-                            }
+                            article = Article(
+                                title=title,
+                                url=url,
+                                summary=summary[:300] if summary else title[:200],
+                                published_date=published_date,
+                                source='Bangkok Post',
+                                category=article_category,
+                                relevance_score=1,
+                                image_url=image_url or self._get_fallback_image(article_category)
+                            )
                             
                             articles.append(article)
                             
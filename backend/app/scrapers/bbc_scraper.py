@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 # coding: utf-8
 
-import requests
 from bs4 import BeautifulSoup
 # from typing import List, Dict
 import logging
@@ -13,6 +12,11 @@ try:
 except ImportError:
     from urlparse import urljoin  # Python 2
 
+from ..models.article import Article
+from .conditional_fetch import fetch_parsed
+from .feed_cache import FeedEntryCache
+from .outbound import ENRICHMENT, throttled_get
+
 logger = logging.getLogger(__name__)
 
 class BBCNewsScraper:
@@ -34,13 +38,15 @@ class BBCNewsScraper:
             'sports': 'https://feeds.bbci.co.uk/sport/rss.xml?edition=uk',
             'politics': 'https://feeds.bbci.co.uk/news/politics/rss.xml'
         }
+        # RSS 엔트리별 추출 결과 캐시 (새로 바뀐 엔트리만 다시 추출)
+        self._rss_entries = FeedEntryCache()
         
     def search_news(self, query, limit=10):
         try:
             logger.info("BBC search: {}".format(query))
             
             params = {'q': query}
-            response = requests.get(self.search_url, params=params, headers=self.headers, timeout=15)
+            response = throttled_get(self.search_url, params=params, headers=self.headers, timeout=15)
             response.raise_for_status()
             
             articles = self._extract_search_results(response.text, limit)
@@ -194,17 +200,16 @@ class BBCNewsScraper:
                     # BBC 날짜 추출
                     published_date = self._extract_bbc_date(container, url)
                     
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'summary': summary[:300] if summary else '',
-                        'published_date': published_date,
-                        'source': 'BBC News',
-                        'category': self._extract_category_from_content(title, summary, url),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=url,
+                        summary=summary[:300] if summary else '',
+                        published_date=published_date,
+                        source='BBC News',
+                        category=self._extract_category_from_content(title, summary, url),
+                        relevance_score=1,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     
@@ -437,7 +442,7 @@ class BBCNewsScraper:
     def _extract_summary_from_article_page(self, article_url):
         """실제 BBC 기사 페이지에서 본문 추출"""
         try:
-            response = requests.get(article_url, headers=self.headers, timeout=5)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=5)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -760,17 +765,16 @@ class BBCNewsScraper:
                         # 날짜 추출 
                         published_date = self._extract_bbc_date(parent_container if parent_container else link_elem, url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary if summary else title[:200],
-                            'published_date': published_date,
-                            'source': 'BBC News',
-                            'category': self._extract_category_from_content(title, summary, url),
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary if summary else title[:200],
+                            published_date=published_date,
+                            source='BBC News',
+                            category=self._extract_category_from_content(title, summary, url),
+                            relevance_score=1,
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
@@ -826,7 +830,7 @@ class BBCNewsScraper:
             logger.error("=== BBC URL 접근 ERROR 로그: {} ===".format(url))
             logger.info("BBC 카테고리 페이지 접근: {}".format(url))
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = throttled_get(url, headers=self.headers, timeout=15)
             response.raise_for_status()
             print("=== BBC 응답 성공: 상태코드 {} ===".format(response.status_code))
             
@@ -1001,17 +1005,16 @@ class BBCNewsScraper:
                             # 카테고리 추출
                             article_category = self._extract_bbc_category_from_url(url) or category
                             
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary[:300] if summary else title[:200],
-                                'published_date': published_date,
-                                'source': 'BBC News',
-                                'category': article_category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url
-                            }
+                            article = Article(
+                                title=title,
+                                url=url,
+                                summary=summary[:300] if summary else title[:200],
+                                published_date=published_date,
+                                source='BBC News',
+                                category=article_category,
+                                relevance_score=1,
+                                image_url=image_url
+                            )
                             
                             articles.append(article)
                             
@@ -1172,17 +1175,16 @@ class BBCNewsScraper:
                 elif not url.startswith('http'):
                     url = 'https://www.bbc.com/' + url
                 
-                return {
-                    'title': title,
-                    'url': url,
-                    'summary': description[:300] if description else title[:200],
-                    'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                    'source': 'BBC News',
-                    'category': 'news',
-                    'scraped_at': datetime.now().isoformat(),
-                    'relevance_score': 1,
-                    'image_url': item.get('image', {}).get('src', '') if isinstance(item.get('image'), dict) else ''
-                }
+                return Article(
+                    title=title,
+                    url=url,
+                    summary=description[:300] if description else title[:200],
+                    published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                    source='BBC News',
+                    category='news',
+                    relevance_score=1,
+                    image_url=item.get('image', {}).get('src', '') if isinstance(item.get('image'), dict) else ''
+                )
                 
         except Exception as e:
             logger.debug("BBC JSON 아이템 파싱 실패: {}".format(e))
@@ -1403,17 +1405,16 @@ class BBCNewsScraper:
                         found_urls.add(url)
                         found_titles.add(title.lower())
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': "BBC Sport: {}".format(title[:150]),
-                            'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                            'source': 'BBC News',
-                            'category': 'sports',
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': ''
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary="BBC Sport: {}".format(title[:150]),
+                            published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                            source='BBC News',
+                            category='sports',
+                            relevance_score=1,
+                            image_url=''
+                        )
                         
                         articles.append(article)
                         print("=== BBC Sport 기사 추가: {}... ===".format(title[:50]))
@@ -1499,17 +1500,16 @@ class BBCNewsScraper:
                         found_titles.add(title_lower)
                         found_urls.add(url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': "BBC Sport coverage: {}".format(title[:150]),
-                            'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                            'source': 'BBC Sport',
-                            'category': 'sports',
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': ''
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary="BBC Sport coverage: {}".format(title[:150]),
+                            published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                            source='BBC Sport',
+                            category='sports',
+                            relevance_score=1,
+                            image_url=''
+                        )
                         
                         articles.append(article)
                         logger.info("BBC Sport 폴백 기사 추출: {}".format(title))
@@ -1617,7 +1617,10 @@ class BBCNewsScraper:
             for feed_url in feed_urls:
                 try:
                     logger.info("BBC RSS feed 액세스: {}".format(feed_url))
-                    feed = feedparser.parse(feed_url)
+                    # 조건부 GET - 피드가 바뀌지 않았으면 이전 파싱 결과 재사용 (타임아웃 적용)
+                    # bytes 를 넘겨 feedparser 가 XML 선언에서 인코딩을 직접 판단
+                    feed = fetch_parsed(feed_url, feedparser.parse, headers=self.headers, timeout=10,
+                                        variant='feed', raw=True)
                     
                     if feed.entries:
                         logger.info("BBC RSS에서 {}개 엔트리 발견".format(len(feed.entries)))
@@ -1630,9 +1633,6 @@ class BBCNewsScraper:
                                 # RSS 엔트리에서 데이터 추출
                                 title = entry.title.strip() if hasattr(entry, 'title') else ''
                                 url = entry.link.strip() if hasattr(entry, 'link') else ''
-                                summary = self._extract_rss_summary(entry)
-                                published_date = self._extract_rss_date(entry)
-                                image_url = self._extract_rss_image(entry)
                                 
                                 # 기본 검증
                                 if not title or len(title) < 10 or not url:
@@ -1644,20 +1644,20 @@ class BBCNewsScraper:
                                     
                                 seen_urls.add(url)
                                 
-                                # 카테고리 추출
-                                article_category = self._extract_category_from_content(title, summary, url)
+                                # 요약/날짜/이미지/카테고리 추출 (GUID와 내용이 같으면 이전 결과 재사용)
+                                summary, published_date, image_url, article_category = \
+                                    self._rss_entries.extract(entry, self._extract_rss_fields)
                                 
-                                article = {
-                                    'title': title,
-                                    'url': url,
-                                    'summary': summary[:300] if summary else title[:200],
-                                    'published_date': published_date,
-                                    'source': 'BBC News',
-                                    'category': article_category,
-                                    'scraped_at': datetime.now().isoformat(),
-                                    'relevance_score': 1,
-                                    'image_url': image_url
-                                }
+                                article = Article(
+                                    title=title,
+                                    url=url,
+                                    summary=summary[:300] if summary else title[:200],
+                                    published_date=published_date,
+                                    source='BBC News',
+                                    category=article_category,
+                                    relevance_score=1,
+                                    image_url=image_url
+                                )
                                 
                                 articles.append(article)
                                 logger.info("BBC RSS 기사 추가: {}".format(title))
@@ -1680,6 +1680,16 @@ class BBCNewsScraper:
             
         return articles[:limit]
     
+    def _extract_rss_fields(self, entry):
+        """RSS 엔트리에서 요약, 날짜, 이미지, 카테고리 추출"""
+        title = entry.title.strip() if hasattr(entry, 'title') else ''
+        url = entry.link.strip() if hasattr(entry, 'link') else ''
+        summary = self._extract_rss_summary(entry)
+        published_date = self._extract_rss_date(entry)
+        image_url = self._extract_rss_image(entry)
+        article_category = self._extract_category_from_content(title, summary, url)
+        return summary, published_date, image_url, article_category
+    
     def _extract_rss_summary(self, entry):
         """RSS 엔트리에서 요약 추출"""
         try:
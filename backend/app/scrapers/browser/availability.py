@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Selenium 사용 가능 여부 확인 (프로세스당 한 번)
+
+selenium import 는 수백 ms 가 걸리므로 스크래퍼 생성 시점에 하지 않는다.
+시작 직후 백그라운드 스레드에서 한 번 확인하고 결과를 캐시하며, 그 전에
+필요해지면 호출한 쪽에서 한 번 확인한다.
+"""
+import logging
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_available: Optional[bool] = None
+_lock = threading.Lock()
+
+
+def _probe() -> bool:
+    try:
+        from selenium import webdriver  # noqa: F401
+        return True
+    except ImportError:
+        logger.info("HTTP 방식 사용 (경량화 모드)")
+        return False
+
+
+def selenium_available() -> bool:
+    """Selenium 사용 가능 여부 (캐시됨)"""
+    global _available
+    if _available is None:
+        with _lock:
+            if _available is None:
+                _available = _probe()
+    return _available
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Selenium 결과 페이지 일괄 추출
+
+요소마다 find_element / get_attribute / .text 를 호출하면 필드 하나당
+chromedriver 왕복이 한 번씩 발생한다. 여기서는 주입 스크립트 한 번으로 모든
+셀렉터의 후보 기사(제목, 링크, 이미지, 시간)를 JSON 배열로 받아온다.
+"""
+import logging
+from typing import Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+# arguments[0]: 셀렉터 목록, arguments[1]: 셀렉터당 최대 후보 수
+# 반환: 셀렉터 순서대로 후보 리스트의 리스트
+_EXTRACT_JS = """
+var selectors = arguments[0], perSelector = arguments[1];
+function text(el) {
+    return ((el.innerText || el.textContent || '') + '').replace(/\\s+/g, ' ').trim();
+}
+function imageOf(el) {
+    var img = el.tagName === 'IMG' ? el : el.querySelector('img');
+    if (!img) { return ''; }
+    return img.getAttribute('data-src') || img.currentSrc || img.getAttribute('src') || '';
+}
+function timeOf(el) {
+    var t = el.tagName === 'TIME' ? el : el.querySelector('time');
+    if (!t && el.closest) { var box = el.closest('article'); if (box) { t = box.querySelector('time'); } }
+    if (!t) { return ''; }
+    return t.getAttribute('datetime') || text(t);
+}
+var results = [];
+for (var i = 0; i < selectors.length; i++) {
+    var items = [];
+    var nodes;
+    try { nodes = document.querySelectorAll(selectors[i]); } catch (e) { nodes = []; }
+    for (var j = 0; j < nodes.length && items.length < perSelector; j++) {
+        var el = nodes[j];
+        var link = el.tagName === 'A' ? el : el.querySelector('a[href]');
+        items.push({
+            title: text(el),
+            url: link ? link.href : '',
+            image: imageOf(el),
+            time: timeOf(el)
+        });
+    }
+    results.push(items);
+}
+return results;
+"""
+
+
+def extract_candidates(driver, selectors: Sequence[str], per_selector: int) -> List[List[Dict]]:
+    """셀렉터별 후보 기사 목록을 한 번의 스크립트 실행으로 수집
+
+    Returns:
+        셀렉터 순서와 같은 순서의 후보 리스트들. 각 후보는
+        ``{'title', 'url', 'image', 'time'}`` 문자열 dict.
+    """
+    try:
+        results = driver.execute_script(_EXTRACT_JS, list(selectors), per_selector)
+    except Exception as e:
+        logger.debug(f"일괄 추출 스크립트 실행 실패: {e}")
+        return []
+    return results if isinstance(results, list) else []
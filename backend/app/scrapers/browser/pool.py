@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""하이브리드 스크래퍼가 공유하는 헤드리스 Chrome 세션 풀
+
+검색마다 Chrome을 새로 띄우고 종료하던 방식 대신, 미리 띄워 둔 세션을
+빌려 쓰고(lease) 돌려준다. 세션은 대여 시 상태 점검을 거치고, 일정 횟수
+사용하거나 메모리 상한을 넘으면 재생성된다.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+from .availability import selenium_available
+from .profile import apply_resource_blocking, build_chrome_options
+
+logger = logging.getLogger(__name__)
+
+
+def _process_tree_rss_mb(pid: int) -> float:
+    """프로세스와 모든 하위 프로세스의 RSS 합계 (MB, /proc 기반)"""
+    total_kb = 0
+    stack = [pid]
+    seen = set()
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        try:
+            with open(f'/proc/{current}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+                        break
+            task_dir = f'/proc/{current}/task'
+            for tid in os.listdir(task_dir):
+                with open(f'{task_dir}/{tid}/children') as f:
+                    stack.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+class _BrowserSession:
+    """풀에 보관되는 Chrome 세션 하나"""
+
+    __slots__ = ('driver', 'uses', 'created_at')
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+    def is_healthy(self) -> bool:
+        try:
+            return self.driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def memory_mb(self) -> float:
+        try:
+            return _process_tree_rss_mb(self.driver.service.process.pid)
+        except Exception:
+            return 0.0
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.debug(f"브라우저 세션 종료 실패: {e}")
+
+
+class BrowserPool:
+    """크기 제한이 있는 헤드리스 Chrome 세션 풀"""
+
+    def __init__(self, size: Optional[int] = None, max_uses: Optional[int] = None,
+                 max_memory_mb: Optional[float] = None, page_load_timeout: int = 10):
+        self.size = size or int(os.getenv('BROWSER_POOL_SIZE', '1'))
+        self.max_uses = max_uses or int(os.getenv('BROWSER_MAX_USES', '20'))
+        self.max_memory_mb = max_memory_mb or float(os.getenv('BROWSER_MAX_MEMORY_MB', '512'))
+        self.page_load_timeout = page_load_timeout
+        self._idle: List[_BrowserSession] = []
+        self._active = 0  # 생성되어 살아 있는 세션 수 (대여 중 포함)
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def _create_session(self) -> _BrowserSession:
+        from selenium import webdriver
+
+        driver = webdriver.Chrome(options=build_chrome_options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        apply_resource_blocking(driver)
+        logger.info("브라우저 풀: 새 Chrome 세션 생성")
+        return _BrowserSession(driver)
+
+    def _total_memory_mb(self) -> float:
+        return sum(session.memory_mb() for session in self._idle)
+
+    def warm(self) -> None:
+        """풀 크기만큼 세션을 미리 생성 (백그라운드 스레드에서 호출)"""
+        while True:
+            with self._cond:
+                if self._closed or self._active >= self.size:
+                    return
+                self._active += 1
+            try:
+                session = self._create_session()
+            except Exception as e:
+                with self._cond:
+                    self._active -= 1
+                    self._cond.notify()
+                logger.warning(f"브라우저 풀 예열 실패: {e}")
+                return
+            with self._cond:
+                self._idle.append(session)
+                self._cond.notify()
+
+    def _acquire(self, timeout: float) -> _BrowserSession:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while not self._idle and self._active >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("브라우저 풀 대기 시간 초과")
+                    self._cond.wait(remaining)
+                if self._idle:
+                    session = self._idle.pop()
+                else:
+                    session = None
+                    self._active += 1
+
+            if session is None:
+                try:
+                    return self._create_session()
+                except Exception:
+                    with self._cond:
+                        self._active -= 1
+                        self._cond.notify()
+                    raise
+
+            # 대여 전 상태 점검 - 응답이 없는 세션은 폐기 후 다시 시도
+            if session.is_healthy():
+                return session
+            logger.info("브라우저 풀: 비정상 세션 폐기")
+            self._discard(session)
+
+    def _discard(self, session: _BrowserSession) -> None:
+        session.quit()
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def _release(self, session: _BrowserSession, failed: bool) -> None:
+        session.uses += 1
+        recycle = failed or self._closed or session.uses >= self.max_uses
+        if not recycle:
+            try:
+                # 다음 사용자를 위해 페이지와 쿠키 정리
+                session.driver.get('about:blank')
+                session.driver.delete_all_cookies()
+            except Exception:
+                recycle = True
+        if not recycle:
+            with self._cond:
+                pool_memory = self._total_memory_mb() + session.memory_mb()
+            if pool_memory > self.max_memory_mb:
+                logger.info(f"브라우저 풀: 메모리 상한 초과 ({pool_memory:.0f}MB), 세션 재생성")
+                recycle = True
+        if recycle:
+            self._discard(session)
+            return
+        with self._cond:
+            self._idle.append(session)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, user_agent: Optional[str] = None, timeout: float = 30):
+        """세션을 빌려 driver를 제공하고 블록 종료 시 반납"""
+        session = self._acquire(timeout)
+        failed = False
+        try:
+            if user_agent:
+                try:
+                    session.driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+                except Exception as e:
+                    logger.debug(f"User-Agent 설정 실패: {e}")
+            yield session.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._release(session, failed)
+
+    def shutdown(self) -> None:
+        """모든 유휴 세션 종료"""
+        with self._cond:
+            self._closed = True
+            sessions, self._idle = self._idle, []
+        for session in sessions:
+            self._discard(session)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """모든 하이브리드 스크래퍼가 공유하는 풀 인스턴스"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+
+def _probe_and_warm() -> None:
+    if selenium_available():
+        get_browser_pool().warm()
+
+
+def start_warmup() -> None:
+    """백그라운드에서 Selenium 확인 후 설치된 경우 풀 예열 (시작을 막지 않음)"""
+    threading.Thread(target=_probe_and_warm, name='browser-pool-warmup', daemon=True).start()
+
+
+def shutdown_pool() -> None:
+    """애플리케이션 종료 시 풀 정리"""
+    if _pool is not None:
+        _pool.shutdown()
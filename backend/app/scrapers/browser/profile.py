@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""스크래핑 전용 헤드리스 Chrome 프로필
+
+하이브리드 스크래퍼는 링크 텍스트와 href/src 속성만 읽으므로 이미지, 미디어,
+폰트, 광고/분석 스크립트는 내려받을 필요가 없다. 이미지와 알림 등은 Chrome
+설정(prefs)으로, 나머지는 CDP Network.setBlockedURLs 로 차단한다.
+BROWSER_BLOCK_RESOURCES=false 로 끌 수 있다.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36'
+
+BLOCK_RESOURCES = os.getenv('BROWSER_BLOCK_RESOURCES', 'true').lower() not in ('0', 'false', 'no')
+
+# 콘텐츠 설정 값 2 = 차단
+_BLOCKING_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+    'profile.managed_default_content_settings.notifications': 2,
+    'profile.managed_default_content_settings.popups': 2,
+    'profile.managed_default_content_settings.geolocation': 2,
+}
+
+# 요청 단계에서 차단할 URL 패턴 (폰트, 미디어, 이미지, 광고/분석 도메인)
+BLOCKED_URL_PATTERNS = [
+    # 폰트
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    # 미디어
+    '*.mp4', '*.webm', '*.m3u8', '*.ts', '*.mp3', '*.m4a',
+    # 이미지 (prefs 로 막히지 않는 CSS 배경 등)
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    # 광고/분석
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagservices.com*',
+    '*googletagmanager.com*', '*google-analytics.com*', '*adservice.google.*',
+    '*amazon-adsystem.com*', '*adnxs.com*', '*criteo.com*', '*criteo.net*',
+    '*taboola.com*', '*outbrain.com*', '*scorecardresearch.com*', '*chartbeat.com*',
+    '*chartbeat.net*', '*moatads.com*', '*permutive.com*', '*hotjar.com*',
+    '*facebook.net*', '*connect.facebook.*', '*quantserve.com*', '*rubiconproject.com*',
+    '*pubmatic.com*', '*openx.net*', '*casalemedia.com*', '*teads.tv*', '*krxd.net*',
+]
+
+
+def build_chrome_options():
+    """스크래핑용 Chrome 옵션 생성"""
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument(f'--user-agent={DEFAULT_USER_AGENT}')
+
+    if BLOCK_RESOURCES:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--autoplay-policy=user-gesture-required')
+        options.add_argument('--mute-audio')
+        options.add_experimental_option('prefs', _BLOCKING_PREFS)
+        # DOMContentLoaded 까지만 기다림 - 이후 준비 여부는 waits 모듈이 판단
+        options.page_load_strategy = 'eager'
+
+    return options
+
+
+def apply_resource_blocking(driver) -> None:
+    """세션에 요청 차단 규칙 적용 (CDP 미지원 드라이버는 무시)"""
+    if not BLOCK_RESOURCES:
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.debug(f"리소스 차단 설정 실패: {e}")
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Selenium 페이지 준비 대기 유틸리티
+
+고정 sleep 대신 결과 셀렉터 등장, URL 변경, DOM 안정화 같은 조건을 짧은
+간격으로 확인하고 조건이 만족되면 즉시 반환한다. 모든 대기는 상한 시간을
+넘기지 않는다.
+"""
+import logging
+import os
+import time
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAIT_TIMEOUT = float(os.getenv('BROWSER_WAIT_TIMEOUT', '10'))
+POLL_INTERVAL = 0.2
+
+# 셀렉터 목록 중 요소가 존재하는 첫 번째 인덱스 (없으면 -1)
+_FIRST_PRESENT_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    try {
+        if (document.querySelector(selectors[i])) { return i; }
+    } catch (e) {}
+}
+return -1;
+"""
+
+# DOM 크기 지표 (요소 수 + 텍스트 길이)
+_DOM_SIZE_JS = """
+var body = document.body;
+return [document.getElementsByTagName('*').length, body ? body.innerText.length : 0];
+"""
+
+
+def _run(driver, script, *args):
+    try:
+        return driver.execute_script(script, *args)
+    except Exception as e:
+        logger.debug(f"대기 스크립트 실행 실패: {e}")
+        return None
+
+
+def wait_for_selectors(driver, selectors: Sequence[str], timeout: float = DEFAULT_WAIT_TIMEOUT) -> Optional[str]:
+    """셀렉터 중 하나라도 요소가 나타날 때까지 대기
+
+    Returns:
+        처음 발견된 셀렉터 (상한 시간 내에 없으면 None)
+    """
+    deadline = time.monotonic() + timeout
+    selectors = list(selectors)
+    while True:
+        index = _run(driver, _FIRST_PRESENT_JS, selectors)
+        if isinstance(index, int) and index >= 0:
+            return selectors[index]
+        if time.monotonic() >= deadline:
+            logger.debug(f"셀렉터 대기 시간 초과: {selectors}")
+            return None
+        time.sleep(POLL_INTERVAL)
+
+
+def wait_for_url_change(driver, previous_url: str, timeout: float = DEFAULT_WAIT_TIMEOUT) -> bool:
+    """현재 URL이 previous_url 과 달라질 때까지 대기 (폼 제출 후 이동 확인용)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if driver.current_url != previous_url:
+                return True
+        except Exception:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+
+def wait_for_dom_stable(driver, timeout: float = 3.0, quiet_period: float = 0.5) -> bool:
+    """DOM 크기가 quiet_period 동안 변하지 않을 때까지 대기
+
+    결과 목록이 비동기로 채워지는 페이지에서 첫 요소 등장 이후 나머지가
+    렌더링되기를 기다리는 용도.
+    """
+    deadline = time.monotonic() + timeout
+    last_size = None
+    stable_since = time.monotonic()
+    while True:
+        size = _run(driver, _DOM_SIZE_JS)
+        now = time.monotonic()
+        if size != last_size:
+            last_size = size
+            stable_since = now
+        elif now - stable_since >= quiet_period:
+            return True
+        if now >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+
+def wait_for_results(driver, selectors: Sequence[str], timeout: float = DEFAULT_WAIT_TIMEOUT,
+                     settle_timeout: float = 2.0) -> Optional[str]:
+    """결과 셀렉터 등장 후 DOM이 안정될 때까지 대기 (전체 상한 timeout)"""
+    started = time.monotonic()
+    found = wait_for_selectors(driver, selectors, timeout)
+    if found is not None:
+        remaining = timeout - (time.monotonic() - started)
+        if remaining > 0:
+            wait_for_dom_stable(driver, min(settle_timeout, remaining))
+    return found
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""소스별 서킷 브레이커
+
+사이트가 막히거나 다운되면 그 소스를 부르는 모든 요청이 시간 예산을 다 쓰고
+공유 스레드와 동시 실행 슬롯(MAX_WORKERS)을 붙잡는다. 연속 실패/타임아웃이
+BREAKER_FAILURE_THRESHOLD 번 쌓이면 회로를 열어 그 소스 호출을 즉시 건너뛴다.
+스레드 풀에 작업을 넣기 전에 확인하므로 열린 동안에는 스레드를 쓰지 않는다
+(이미 타임아웃난 호출의 스레드는 끝날 때까지 계속 실행된다).
+
+스크래퍼는 403/429/차단 페이지를 받아도 예외 대신 빈 결과를 돌려주므로, 빈
+결과이면서 호출 안의 외부 요청(outbound.fetch_report)이 모두 실패했으면
+SourceFailure 로 바꿔 실패로 센다.
+
+- closed: 정상 호출, 성공하면 연속 실패 수 초기화
+- open: BREAKER_RESET_TIMEOUT 초 동안 호출하지 않음 (호출한 쪽은 캐시로 대체)
+- half_open: 대기 시간이 지나면 탐색 호출 하나만 허용, 성공하면 closed,
+  실패하면 다시 open
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 회로를 여는 연속 실패(타임아웃 포함) 횟수
+BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '3'))
+# 열린 뒤 탐색 호출을 허용하기까지의 대기 시간 (초)
+BREAKER_RESET_TIMEOUT = float(os.getenv('BREAKER_RESET_TIMEOUT', '60'))
+# 회로가 열렸을 때 대신 제공할 최근 성공 결과 보관 수 (소스별)
+BREAKER_FALLBACK_ENTRIES = 32
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 소스 호출을 건너뜀
+
+    retry_in: 탐색 호출까지 남은 초, cached: 같은 호출의 최근 성공 결과 (없으면 None)
+    """
+
+    def __init__(self, name: str, retry_in: float, cached: Optional[List] = None):
+        super().__init__(f"{name} 일시 중단 ({retry_in:.0f}초 후 재시도)")
+        self.retry_in = retry_in
+        self.cached = cached
+
+
+class SourceFailure(Exception):
+    """스크래퍼가 빈 결과를 돌려줬지만 외부 요청이 모두 실패함 (차단/다운)"""
+
+
+class CircuitBreaker:
+    """소스 하나의 회로 상태와 최근 성공 결과"""
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+        self._fallback: 'OrderedDict[Hashable, List]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """이번 호출을 실행해도 되는지 (half_open 에서는 탐색 호출 하나만 허용)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                self.probe_started_at = now
+                logger.info(f"{self.name} 서킷 브레이커 half-open: 탐색 호출 실행")
+                return True
+            # 탐색 호출이 결과를 남기지 못하고 끝난 경우(취소 등) 다음 탐색 허용
+            if now - self.probe_started_at >= self.reset_timeout:
+                self.probe_started_at = now
+                return True
+            return False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            started = self.opened_at if self.state == OPEN else self.probe_started_at
+            return max(0.0, self.reset_timeout - (time.monotonic() - started))
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"{self.name} 서킷 브레이커 closed: 소스 복구")
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                logger.warning(f"{self.name} 서킷 브레이커 open: 연속 실패 {self.failures}회, "
+                               f"{self.reset_timeout:.0f}초 동안 호출 중단")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def remember(self, key: Hashable, articles: List) -> None:
+        """회로가 열렸을 때 쓸 최근 성공 결과 저장 (빈 결과는 저장하지 않음)"""
+        if not articles:
+            return
+        with self._lock:
+            self._fallback[key] = list(articles)
+            self._fallback.move_to_end(key)
+            while len(self._fallback) > BREAKER_FALLBACK_ENTRIES:
+                self._fallback.popitem(last=False)
+
+    def fallback(self, key: Hashable) -> Optional[List]:
+        with self._lock:
+            articles = self._fallback.get(key)
+        return list(articles) if articles is not None else None
+
+    def status(self) -> Dict[str, object]:
+        with self._lock:
+            return {"state": self.state, "failures": self.failures}
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""조건부 GET (ETag/Last-Modified) 기반 페이지·피드 가져오기
+
+URL별로 서버가 준 ETag/Last-Modified 와 마지막 본문을 기억하고, 다음 요청에
+If-None-Match/If-Modified-Since 를 보낸다. 304 응답이거나 본문 해시가 이전과
+같으면 본문을 다시 파싱하지 않고 이전에 계산한 결과를 재사용한다.
+
+재사용한 결과는 여러 요청이 공유하므로 기사 목록은 항목까지 복사해서 돌려준다
+(호출한 쪽이 relevance_score, source 등을 바꿔도 캐시에 남지 않음).
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from ..models.article import Article
+from .outbound import throttled_get
+
+logger = logging.getLogger(__name__)
+
+
+def copy_result(result: Any) -> Any:
+    """캐시된 파싱 결과의 복사본 (리스트면 Article/dict 항목까지 복사)"""
+    if not isinstance(result, list):
+        return result
+    return [item.copy() if isinstance(item, (Article, dict)) else item for item in result]
+
+
+class _Entry:
+    __slots__ = ('etag', 'last_modified', 'digest', 'content', 'encoding', 'results')
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], digest: str,
+                 content: bytes, encoding: Optional[str]):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.content = content
+        self.encoding = encoding
+        self.results: Dict[Hashable, Any] = {}  # variant -> parse 결과
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class ConditionalFetcher:
+    """URL별 검증자와 파싱 결과를 보관하는 조건부 GET 클라이언트 (LRU)"""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_entry(self, url: str) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def _store_entry(self, url: str, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def fetch(self, url: str, parse: Callable[[Any], Any], headers: Optional[Dict[str, str]] = None,
+              timeout: float = 15, variant: Hashable = None, raw: bool = False) -> Any:
+        """url 을 조건부로 가져와 parse(본문) 결과 반환
+
+        Args:
+            parse: 본문을 받아 결과(기사 목록, 파싱된 피드 등)를 만드는 함수
+            variant: 같은 본문에서 다른 결과를 만드는 호출 구분용 키 (예: limit)
+            raw: True 면 본문을 디코딩하지 않고 bytes 로 전달 (XML 선언의 인코딩을
+                파서가 직접 읽도록, 예: feedparser)
+
+        HTTP 오류는 requests 예외로 그대로 전달된다.
+        """
+        entry = self._get_entry(url)
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                request_headers['If-Modified-Since'] = entry.last_modified
+
+        response = throttled_get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"304 Not Modified, 이전 파싱 결과 재사용: {url}")
+        else:
+            response.raise_for_status()
+            digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if entry is not None and entry.digest == digest:
+                # 검증자를 지원하지 않는 서버라도 본문이 같으면 재파싱하지 않음
+                entry.etag, entry.last_modified = etag, last_modified
+            else:
+                entry = _Entry(etag, last_modified, digest, response.content,
+                               response.encoding or response.apparent_encoding)
+                self._store_entry(url, entry)
+
+        key = (variant, raw)
+        if key in entry.results:
+            result = entry.results[key]
+        else:
+            result = parse(entry.content if raw else entry.text)
+            entry.results[key] = result
+        # 호출한 쪽에서 목록이나 기사를 수정하더라도 캐시가 바뀌지 않도록 복사본 반환
+        return copy_result(result)
+
+
+# 스크래퍼 간 공유 인스턴스
+fetcher = ConditionalFetcher()
+
+
+def fetch_parsed(url: str, parse: Callable[[Any], Any], headers: Optional[Dict[str, str]] = None,
+                 timeout: float = 15, variant: Hashable = None, raw: bool = False) -> Any:
+    """공유 fetcher 로 조건부 GET 후 파싱 결과 반환"""
+    return fetcher.fetch(url, parse, headers=headers, timeout=timeout, variant=variant, raw=raw)
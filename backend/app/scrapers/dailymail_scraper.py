@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import logging
@@ -7,6 +6,10 @@ from datetime import datetime
 import json
 import re
 
+from ..models.article import Article
+from .hedged_fetch import hedged_get
+from .outbound import ENRICHMENT, throttled_get
+
 logger = logging.getLogger(__name__)
 
 class DailyMailScraper:
@@ -23,7 +26,6 @@ class DailyMailScraper:
         """Daily Mail에서 뉴스 검색 (개선된 검색 기능)"""
         try:
             from urllib.parse import quote
-            import time
             
             logger.info(f"Daily Mail 검색: {query}")
             
@@ -37,50 +39,35 @@ class DailyMailScraper:
                 'Upgrade-Insecure-Requests': '1',
             }
             
-            # 여러 검색 URL 시도
-            search_urls = [
-                f"https://www.dailymail.co.uk/home/search.html?sel=site&searchPhrase={quote(query)}",
-                f"https://www.dailymail.co.uk/search?q={quote(query)}",
-                f"https://www.dailymail.co.uk/news/index.html",  # 뉴스 섹션
-                self.base_url  # 홈페이지 폴백
+            def parse_search(response):
+                return self._extract_search_results(response.text, limit, query)
+            
+            def parse_homepage(response):
+                return self._extract_articles_from_homepage(response.text, limit)
+            
+            # 같은 검색의 두 엔드포인트만 헤지 요청
+            candidates = [
+                (f"https://www.dailymail.co.uk/home/search.html?sel=site&searchPhrase={quote(query)}", parse_search),
+                (f"https://www.dailymail.co.uk/search?q={quote(query)}", parse_search),
             ]
             
-            for i, search_url in enumerate(search_urls):
+            articles = hedged_get(candidates, headers=improved_headers, timeout=15, label="Daily Mail")
+            if articles:
+                logger.info(f"Daily Mail 검색 결과: {len(articles)}개 기사 찾음")
+                return articles
+            
+            # 검색이 모두 실패했을 때만 뉴스 섹션, 홈페이지 순서로 폴백
+            for fallback_url in (f"{self.base_url}/news/index.html", self.base_url):
                 try:
-                    logger.info(f"Daily Mail 시도 {i+1}: {search_url}")
-                    
-                    # 점진적으로 타임아웃 늘리기
-                    timeout = 10 + (i * 5)
-                    
-                    response = requests.get(
-                        search_url, 
-                        headers=improved_headers, 
-                        timeout=timeout,
-                        allow_redirects=True
-                    )
+                    response = throttled_get(fallback_url, headers=improved_headers, timeout=15)
                     response.raise_for_status()
-                    
-                    if i < 2:  # 실제 검색 URL들
-                        articles = self._extract_search_results(response.text, limit, query)
-                    else:  # 홈페이지나 뉴스 섹션
-                        articles = self._extract_articles_from_homepage(response.text, limit)
-                    
-                    if articles:
-                        logger.info(f"Daily Mail 검색 결과: {len(articles)}개 기사 찾음")
-                        return articles
-                        
-                    # 짧은 대기 시간
-                    time.sleep(1)
-                    
-                except requests.exceptions.Timeout:
-                    logger.warning(f"Daily Mail 타임아웃: {search_url}")
-                    continue
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"Daily Mail 요청 실패: {search_url} - {e}")
-                    continue
+                    articles = parse_homepage(response)
                 except Exception as e:
-                    logger.debug(f"Daily Mail 파싱 실패: {search_url} - {e}")
+                    logger.debug(f"Daily Mail 폴백 실패 {fallback_url}: {e}")
                     continue
+                if articles:
+                    logger.info(f"Daily Mail 검색 폴백 ({fallback_url}): {len(articles)}개 기사")
+                    return articles
             
             logger.warning("Daily Mail에서 기사를 찾을 수 없음")
             return []
@@ -185,17 +172,16 @@ class DailyMailScraper:
                     published_date = self._extract_dailymail_date(link, href)
                     
                     # 기본 기사 정보 생성
-                    article = {
-                        'title': title,
-                        'url': href,
-                        'summary': '',
-                        'published_date': published_date,
-                        'source': 'Daily Mail',
-                        'category': self._extract_category_from_url(href),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=href,
+                        summary='',
+                        published_date=published_date,
+                        source='Daily Mail',
+                        category=self._extract_category_from_url(href),
+                        relevance_score=1,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     
@@ -352,7 +338,7 @@ class DailyMailScraper:
     def _extract_dailymail_date_from_page(self, article_url: str) -> str:
         """Daily Mail 기사 페이지에서 날짜 추출"""
         try:
-            response = requests.get(article_url, headers=self.headers, timeout=5)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=5)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -539,17 +525,16 @@ class DailyMailScraper:
                         # 날짜 추출 시도 (URL이나 텍스트에서)
                         published_date = self._extract_date(url, summary)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else '',
-                            'published_date': published_date,
-                            'source': 'Daily Mail',
-                            'category': self._extract_category_from_url(url),
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else '',
+                            published_date=published_date,
+                            source='Daily Mail',
+                            category=self._extract_category_from_url(url),
+                            relevance_score=1,
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
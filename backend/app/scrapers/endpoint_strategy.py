@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""소스·메서드별 대체 엔드포인트 적응형 선택
+
+스크래퍼마다 검색/최신 뉴스를 가져오는 방법(API, 검색 페이지, RSS, 섹션 페이지
+등)을 고정된 순서로 시도하면 이미 죽은 엔드포인트에 매번 시간을 쓴다.
+여기서는 엔드포인트별 최근 시도(성공 여부, 기사 수, 지연 시간)를 슬라이딩
+윈도우로 기록하고, 기대 효용(성공률 × 평균 기사 수 / 지연) 순서로 시도한다.
+
+- 아직 시도하지 않은 엔드포인트는 성과가 있는 엔드포인트 다음, 실패만 한
+  엔드포인트 앞에 선언 순서대로 둔다.
+- 결과가 없는 정상 응답(드문 검색어 등)은 기사 0개짜리 성공이다. 예외, HTTP
+  오류 응답(스크래퍼가 잡아 빈 결과로 돌려준 경우 포함)만 실패로 센다.
+- 연속 실패가 STRATEGY_FAILURE_THRESHOLD 회 이상이면 STRATEGY_PROBE_INTERVAL 초
+  동안 건너뛰고, 그 뒤 한 번 시도(프로브)해서 살아났으면 다시 순위에 넣는다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .outbound import fetch_report
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_WINDOW = int(os.getenv('STRATEGY_WINDOW', '20'))
+STRATEGY_FAILURE_THRESHOLD = int(os.getenv('STRATEGY_FAILURE_THRESHOLD', '3'))
+STRATEGY_PROBE_INTERVAL = float(os.getenv('STRATEGY_PROBE_INTERVAL', '300'))
+
+# (엔드포인트 이름, 인자 없이 기사 리스트를 반환하는 함수)
+Endpoint = Tuple[str, Callable[[], List[Any]]]
+
+
+class _EndpointStats:
+    __slots__ = ('samples', 'consecutive_failures', 'skip_until')
+
+    def __init__(self, window: int):
+        self.samples: deque = deque(maxlen=window)  # (성공 여부, 기사 수, 지연 초)
+        self.consecutive_failures = 0
+        self.skip_until = 0.0
+
+    def score(self) -> Optional[float]:
+        """기대 효용 (기록이 없으면 None)"""
+        if not self.samples:
+            return None
+        n = len(self.samples)
+        successes = sum(1 for ok, _, _ in self.samples if ok)
+        avg_yield = sum(count for _, count, _ in self.samples) / n
+        avg_latency = sum(latency for _, _, latency in self.samples) / n
+        return (successes / n) * avg_yield / (1.0 + avg_latency)
+
+
+class StrategySelector:
+    """소스 하나의 메서드(검색, 최신 뉴스 등)에 대한 엔드포인트 선택기"""
+
+    def __init__(self, name: str, window: int = STRATEGY_WINDOW,
+                 failure_threshold: int = STRATEGY_FAILURE_THRESHOLD,
+                 probe_interval: float = STRATEGY_PROBE_INTERVAL):
+        self.name = name
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self._stats: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _get_stats(self, key: str) -> _EndpointStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _EndpointStats(self.window)
+        return stats
+
+    def ranked(self, keys: Sequence[str]) -> List[str]:
+        """기대 효용 순서의 엔드포인트 목록 (건너뛰는 중인 엔드포인트 제외)"""
+        now = time.monotonic()
+        ranked = []
+        with self._lock:
+            for index, key in enumerate(keys):
+                stats = self._get_stats(key)
+                if stats.skip_until > now:
+                    continue
+                score = stats.score()
+                if score is None:
+                    tier = 1  # 미시도
+                elif score > 0:
+                    tier = 0
+                else:
+                    tier = 2
+                ranked.append(((tier, -(score or 0.0), index), key))
+        ranked.sort()
+        return [key for _, key in ranked]
+
+    def record(self, key: str, count: int, latency: float, ok: bool = True) -> None:
+        """시도 결과 기록 (빈 결과도 ok 면 성공)"""
+        with self._lock:
+            stats = self._get_stats(key)
+            stats.samples.append((ok, count, latency))
+            if ok:
+                if stats.consecutive_failures >= self.failure_threshold:
+                    logger.info(f"{self.name}: {key} 엔드포인트 복구됨")
+                stats.consecutive_failures = 0
+                stats.skip_until = 0.0
+            else:
+                stats.consecutive_failures += 1
+                if stats.consecutive_failures >= self.failure_threshold:
+                    stats.skip_until = time.monotonic() + self.probe_interval
+                    logger.info(f"{self.name}: {key} 엔드포인트 연속 {stats.consecutive_failures}회 실패, "
+                                f"{self.probe_interval:.0f}초 동안 건너뜀")
+
+    def call(self, key: str, func: Callable[[], List[Any]]) -> List[Any]:
+        """엔드포인트 하나를 실행하고 결과를 기록 (예외는 빈 결과로 처리)
+
+        빈 결과는 그 안의 외부 요청이 모두 실패했을 때만 실패로 기록한다.
+        """
+        start = time.monotonic()
+        with fetch_report() as report:
+            try:
+                result = func() or []
+            except Exception as e:
+                logger.debug(f"{self.name}: {key} 엔드포인트 실패 - {e}")
+                self.record(key, 0, time.monotonic() - start, ok=False)
+                return []
+        self.record(key, len(result), time.monotonic() - start, ok=bool(result) or not report.failed)
+        return result
+
+    def first(self, endpoints: Sequence[Endpoint],
+              accept: Callable[[List[Any]], bool] = bool) -> List[Any]:
+        """효용 순서로 시도해 accept 를 만족하는 첫 결과 반환
+
+        만족하는 결과가 없으면 가장 많은 기사를 준 결과(없으면 []) 반환.
+        """
+        funcs = dict(endpoints)
+        best: List[Any] = []
+        for key in self.ranked([key for key, _ in endpoints]):
+            result = self.call(key, funcs[key])
+            if accept(result):
+                return result
+            if len(result) > len(best):
+                best = result
+        return best
+
+
+_selectors: Dict[str, StrategySelector] = {}
+_selectors_lock = threading.Lock()
+
+
+def get_selector(source: str, method: str) -> StrategySelector:
+    """소스·메서드별 공유 선택기 (프로세스 수명 동안 유지)"""
+    name = f"{source}.{method}"
+    selector = _selectors.get(name)
+    if selector is None:
+        with _selectors_lock:
+            selector = _selectors.get(name)
+            if selector is None:
+                selector = _selectors[name] = StrategySelector(name)
+    return selector
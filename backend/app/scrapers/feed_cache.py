@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""RSS 엔트리 단위 추출 결과 캐시
+
+피드가 갱신되어도 대부분의 엔트리는 그대로이므로, 엔트리 GUID와 내용 해시가
+이전과 같으면 요약/날짜/이미지 추출(BeautifulSoup 파싱 포함)을 다시 하지 않고
+이전 결과를 재사용한다. 갱신 비용은 피드 크기가 아니라 새로 바뀐 엔트리 수에
+비례한다.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+# 내용 해시에 포함하는 엔트리 필드
+_HASH_FIELDS = ('title', 'link', 'summary', 'description', 'published', 'updated',
+                'content', 'enclosures', 'media_thumbnail', 'media_content')
+
+
+def entry_key(entry) -> Optional[str]:
+    """엔트리 식별자 (GUID 우선, 없으면 링크)"""
+    return entry.get('id') or entry.get('guid') or entry.get('link')
+
+
+def entry_digest(entry) -> str:
+    """추출 결과에 영향을 주는 필드들의 해시"""
+    h = hashlib.blake2b(digest_size=16)
+    for field in _HASH_FIELDS:
+        value = entry.get(field)
+        if value:
+            h.update(field.encode())
+            h.update(repr(value).encode('utf-8', 'replace'))
+    return h.hexdigest()
+
+
+class FeedEntryCache:
+    """GUID -> (내용 해시, 추출 결과) LRU 캐시"""
+
+    def __init__(self, max_entries: int = 2000):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def extract(self, entry, extract: Callable[[Any], Any]) -> Any:
+        """엔트리가 새로 생겼거나 바뀐 경우에만 extract(entry) 실행"""
+        key = entry_key(entry)
+        if not key:
+            return extract(entry)
+        digest = entry_digest(entry)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == digest:
+                self._entries.move_to_end(key)
+                return cached[1]
+        result = extract(entry)
+        with self._lock:
+            self._entries[key] = (digest, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
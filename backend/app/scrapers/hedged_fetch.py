@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""대체 URL 후보에 대한 헤지(hedged) 요청
+
+후보 URL을 하나씩 순서대로 시도하면 앞선 URL이 느리거나 실패할 때마다 타임아웃
+만큼 지연이 누적된다. 여기서는 첫 번째 후보를 시작하고, 짧은 지연(HEDGE_DELAY)이
+지나거나 실행 중인 시도가 빈 결과/오류로 끝나면 다음 후보를 바로 시작한다.
+처음으로 쓸 만한 결과(비어 있지 않은 결과)를 돌려준 시도가 이기고, 나머지는
+취소된다. 시작 전이면 실행하지 않고, 진행 중이면 응답 연결을 닫고 본문을 더
+받지 않는다 (연결/헤더 대기 중인 요청은 그 단계가 끝난 뒤 멈춤).
+
+후보는 서로 대체 가능한 URL(같은 검색의 다른 엔드포인트)이어야 한다. 홈페이지처럼
+결과 성격이 다른 폴백은 헤지 후보에 넣지 말고 모두 실패한 뒤 따로 시도한다.
+
+여러 엔드포인트 결과를 모두 모아야 할 때는 같은 풀에서 run_concurrently 를 쓴다.
+"""
+import concurrent.futures
+import contextvars
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from .outbound import throttled_get
+
+logger = logging.getLogger(__name__)
+
+HEDGE_DELAY = float(os.getenv('HEDGE_DELAY', '1.5'))
+STREAM_CHUNK_SIZE = 16384
+
+# 스크래퍼 스레드 안에서 호출되므로 별도 풀 사용 (스크래퍼 풀과의 교착 방지)
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv('HEDGE_THREADS', '16')),
+    thread_name_prefix='hedge'
+)
+
+# (URL, 응답 -> 결과 리스트 파서)
+Candidate = Tuple[str, Callable[[requests.Response], List[Any]]]
+
+
+class _Attempt:
+    __slots__ = ('url', 'response', 'cancelled', '_lock')
+
+    def __init__(self, url: str):
+        self.url = url
+        self.response: Optional[requests.Response] = None
+        self.cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def attach(self, response: requests.Response) -> bool:
+        """진행 중인 응답 등록 (이미 취소됐으면 False)"""
+        with self._lock:
+            if self.cancelled.is_set():
+                return False
+            self.response = response
+            return True
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled.set()
+            response = self.response
+        if response is not None:
+            try:
+                response.close()  # 본문 수신 중이면 연결을 끊어 읽기 중단
+            except Exception:
+                pass
+
+
+def _run_attempt(attempt: _Attempt, parse, headers: Optional[Dict[str, str]], timeout: float):
+    if attempt.cancelled.is_set():
+        return []
+    response = throttled_get(attempt.url, headers=headers, timeout=timeout, stream=True, allow_redirects=True)
+    try:
+        if not attempt.attach(response):
+            return []
+        response.raise_for_status()
+        chunks = []
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            if attempt.cancelled.is_set():
+                return []  # 다른 시도가 이겼으면 나머지 본문은 받지 않음
+            chunks.append(chunk)
+        # parse 가 response.text/json() 을 그대로 쓸 수 있도록 받은 본문을 채움
+        response._content = b''.join(chunks)
+        return parse(response)
+    finally:
+        response.close()
+
+
+def hedged_get(candidates: Sequence[Candidate], headers: Optional[Dict[str, str]] = None,
+               timeout: float = 15, delay: Optional[float] = None, label: str = '') -> List[Any]:
+    """후보 URL들에 헤지 요청을 보내 처음으로 비어 있지 않은 결과 반환 (모두 실패하면 [])"""
+    delay = HEDGE_DELAY if delay is None else delay
+    pending = list(candidates)
+    running: Dict[concurrent.futures.Future, _Attempt] = {}
+    attempts: List[_Attempt] = []
+
+    def launch() -> None:
+        url, parse = pending.pop(0)
+        attempt = _Attempt(url)
+        attempts.append(attempt)
+        logger.info(f"{label} 검색 시도: {url}")
+        # 호출한 쪽의 요청 우선순위(outbound_priority)를 풀 스레드로 전달
+        context = contextvars.copy_context()
+        running[_executor.submit(context.run, _run_attempt, attempt, parse, headers, timeout)] = attempt
+
+    try:
+        launch()
+        while running:
+            done, _ = concurrent.futures.wait(
+                running, timeout=delay if pending else None,
+                return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if not done:
+                # 지연 시간 안에 끝난 시도가 없으면 다음 후보를 추가로 시작
+                launch()
+                continue
+            for future in done:
+                attempt = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.debug(f"{label} 검색 URL 실패 {attempt.url}: {e}")
+                    result = None
+                if result:
+                    logger.info(f"{label} 헤지 요청 성공: {attempt.url} ({len(result)}개)")
+                    return result
+                logger.debug(f"{label} 검색 결과 없음: {attempt.url}")
+            # 실패/빈 결과로 끝났으면 기다리지 않고 다음 후보 시작
+            if pending:
+                launch()
+        return []
+    finally:
+        for attempt in attempts:
+            attempt.cancel()
+
+
+def run_concurrently(calls: Sequence[Callable[[], List[Any]]], timeout: Optional[float] = None,
+                     label: str = '') -> List[List[Any]]:
+    """블로킹 호출들을 동시에 실행하고 입력 순서대로 결과 반환
+
+    실패하거나 timeout(전체 마감 시간) 안에 끝나지 않은 호출의 결과는 [].
+    """
+    futures = [_executor.submit(contextvars.copy_context().run, call) for call in calls]
+    done, _ = concurrent.futures.wait(futures, timeout=timeout)
+    results = []
+    for future in futures:
+        if future not in done:
+            future.cancel()
+            logger.debug(f"{label} 동시 호출 마감 시간 초과")
+            results.append([])
+            continue
+        try:
+            results.append(future.result() or [])
+        except Exception as e:
+            logger.debug(f"{label} 동시 호출 실패: {e}")
+            results.append([])
+    return results
@@ -7,13 +7,22 @@ HTTP 우선 → 실패시 Selenium 자동 사용
 
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 import logging
 from urllib.parse import quote
 import re
 import time
 
+from ..models.article import Article
+from .page_snapshot import get_page, get_page_streamed
+from .stream_html import iter_links
+from .browser.extract import extract_candidates
+from .browser.availability import selenium_available
+from .browser.pool import get_browser_pool
+from .browser.waits import wait_for_results
+from .outbound import ENRICHMENT, throttled_get
+
 logger = logging.getLogger(__name__)
 
 class HybridDailyMailScraper:
@@ -31,17 +40,11 @@ class HybridDailyMailScraper:
             'Sec-Fetch-User': '?1',
             'Upgrade-Insecure-Requests': '1'
         }
-        self.selenium_available = self._check_selenium_availability()
     
-    def _check_selenium_availability(self) -> bool:
-        """Selenium 사용 가능 여부 확인"""
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            return True
-        except ImportError:
-            logger.info("HTTP 방식 사용 (경량화 모드)")
-            return False
+    @property
+    def selenium_available(self) -> bool:
+        """Selenium 사용 가능 여부 (프로세스당 한 번만 확인)"""
+        return selenium_available()
     
     def search_news(self, query: str, limit: int = 10) -> List[Dict]:
         """하이브리드 뉴스 검색: HTTP → Selenium"""
@@ -79,7 +82,7 @@ class HybridDailyMailScraper:
             headers_with_referer = self.headers.copy()
             headers_with_referer['Referer'] = search_url
             
-            response = requests.get(search_url, headers=headers_with_referer, timeout=15)
+            response = throttled_get(search_url, headers=headers_with_referer, timeout=15)
             response.raise_for_status()
             
             logger.info(f"Daily Mail 응답 성공: {response.status_code}, 길이: {len(response.text)}")
@@ -164,17 +167,16 @@ class HybridDailyMailScraper:
                         if summary_elem:
                             summary = summary_elem.get_text(strip=True)[:300]
                     
-                    article = {
-                        'title': text,
-                        'url': href,
-                        'summary': summary,
-                        'published_date': datetime.now().strftime('%Y-%m-%d'),
-                        'source': 'Daily Mail',
-                        'category': self._extract_category_from_url(href),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 0.7,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=text,
+                        url=href,
+                        summary=summary,
+                        published_date=datetime.now().strftime('%Y-%m-%d'),
+                        source='Daily Mail',
+                        category=self._extract_category_from_url(href),
+                        relevance_score=0.7,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     
@@ -191,22 +193,17 @@ class HybridDailyMailScraper:
             logger.error(f"Daily Mail HTML 파싱 실패: {e}")
             return []
     
-    def _extract_sport_section_articles(self, html_content: str, limit: int) -> List[Dict]:
-        """Daily Mail 스포츠 섹션에서 기사 추출"""
+    def _extract_sport_section_articles(self, chunks, limit: int) -> List[Dict]:
+        """Daily Mail 스포츠 섹션 본문 청크를 증분 파싱하며 기사 추출 (limit 개를 채우면 내려받기 중단)"""
         articles = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Daily Mail 스포츠 기사 링크 찾기
-            article_links = soup.find_all('a', href=True)
-            sport_links = [link for link in article_links 
-                          if '/sport/' in link.get('href', '') and 
-                             '/article-' in link.get('href', '')]
+            # Daily Mail 스포츠 기사 링크 찾기 (링크가 닫히는 즉시 처리)
+            sport_links = iter_links(chunks, lambda href: '/sport/' in href and '/article-' in href)
             
             found_urls = set()
             
-            for link in sport_links[:limit*2]:  # 여유분 확보
+            for link in sport_links:
                 try:
                     href = link.get('href')
                     title = link.get_text(strip=True)
@@ -228,17 +225,16 @@ class HybridDailyMailScraper:
                     # Daily Mail 날짜 추출  
                     published_date = self._extract_dailymail_date(link, href)
                     
-                    article = {
-                        'title': title,
-                        'url': href,
-                        'summary': '',  # 스포츠 섹션에서는 요약 생략
-                        'published_date': published_date,
-                        'source': 'Daily Mail',
-                        'category': 'Sports',
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,  # 스포츠 섹션이므로 높은 관련성
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=href,
+                        summary='',  # 스포츠 섹션에서는 요약 생략
+                        published_date=published_date,
+                        source='Daily Mail',
+                        category='sports',
+                        relevance_score=1,  # 스포츠 섹션이므로 높은 관련성
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     
@@ -258,7 +254,7 @@ class HybridDailyMailScraper:
         """개선된 Daily Mail 이미지 추출 - 메타 태그 우선"""
         try:
             # 1. 기사 페이지에서 메타 태그 이미지 추출
-            response = requests.get(article_url, headers=self.headers, timeout=5)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=5)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -460,30 +456,13 @@ class HybridDailyMailScraper:
     def _search_with_selenium(self, query: str, limit: int) -> List[Dict]:
         """Selenium 기반 검색"""
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.common.by import By
-            
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument(f'--user-agent={self.headers["User-Agent"]}')
-            
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(10)
-            
             articles = []
             
-            try:
+            # 공유 브라우저 풀에서 세션 대여 (매번 Chrome을 새로 띄우지 않음)
+            with get_browser_pool().lease(user_agent=self.headers["User-Agent"]) as driver:
                 search_url = f"https://www.dailymail.co.uk/search?q={quote(query)}"
                 driver.get(search_url)
                 
-                # 페이지 로딩 대기
-                time.sleep(3)
-                
                 # 검색 결과 찾기
                 selectors = [
                     'article',
@@ -495,55 +474,35 @@ class HybridDailyMailScraper:
                     'a[href*="/sport/"]'
                 ]
                 
-                for selector in selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        
-                        for element in elements[:limit*2]:
-                            article = self._extract_article_from_element(element, driver)
-                            if article and article not in articles:
-                                articles.append(article)
-                                
-                                if len(articles) >= limit:
-                                    break
-                        
-                        if articles:
-                            break
+                # 페이지 로딩 대기 (결과 요소 등장 + DOM 안정화, 고정 sleep 대신)
+                wait_for_results(driver, selectors)
+                
+                # 모든 셀렉터의 후보를 스크립트 한 번으로 수집 (요소별 WebDriver 왕복 없음)
+                seen_urls = set()
+                for candidates in extract_candidates(driver, selectors, limit*2):
+                    for candidate in candidates:
+                        article = self._article_from_candidate(candidate)
+                        if article and article.url not in seen_urls:
+                            seen_urls.add(article.url)
+                            articles.append(article)
                             
-                    except Exception as e:
-                        continue
+                            if len(articles) >= limit:
+                                break
+                    
+                    if articles:
+                        break
                 
                 return articles
                 
-            finally:
-                driver.quit()
-                
         except Exception as e:
             logger.error(f"Selenium 검색 실패: {e}")
             return []
     
-    def _extract_article_from_element(self, element, driver) -> Dict:
-        """Selenium 요소에서 기사 정보 추출"""
+    def _article_from_candidate(self, candidate: Dict) -> Optional[Article]:
+        """일괄 추출 스크립트가 돌려준 후보에서 기사 정보 생성"""
         try:
-            # 제목 추출
-            title = ""
-            try:
-                title = element.text.strip()
-                if not title:
-                    title = element.get_attribute('textContent').strip()
-            except:
-                pass
-            
-            # URL 추출
-            url = ""
-            try:
-                if element.tag_name == 'a':
-                    url = element.get_attribute('href')
-                else:
-                    link = element.find_element(By.TAG_NAME, 'a')
-                    url = link.get_attribute('href')
-            except:
-                pass
+            title = (candidate.get('title') or '').strip()
+            url = candidate.get('url') or ''
             
             # 기본 검증
             if not title or not url or len(title) < 10:
@@ -557,28 +516,47 @@ class HybridDailyMailScraper:
             if 'dailymail.co.uk' not in url:
                 return None
             
-            return {
-                'title': title[:200],
-                'url': url,
-                'summary': '',
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'Daily Mail',
-                'category': self._extract_category_from_url(url),
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 0.5,
-                'image_url': ''  # Selenium에서는 이미지 추출 생략
-            }
+            # 이미지 URL 정규화 및 검증
+            image_url = candidate.get('image') or ''
+            if image_url.startswith('//'):
+                image_url = 'https:' + image_url
+            elif image_url.startswith('/'):
+                image_url = self.base_url + image_url
+            if image_url and not self._is_valid_dailymail_image(image_url):
+                image_url = ''
+            
+            # 날짜 (ISO datetime 은 초 단위까지만 사용)
+            date_str = candidate.get('time') or ''
+            if re.match(r'\d{4}-\d{2}-\d{2}T', date_str):
+                date_str = date_str[:19]
+            
+            return Article(
+                title=title[:200],
+                url=url,
+                summary='',
+                published_date=self._format_date(date_str),
+                source='Daily Mail',
+                category=self._extract_category_from_url(url),
+                relevance_score=0.5,
+                image_url=image_url
+            )
             
         except Exception as e:
             return None
     
     def _get_homepage_articles(self, limit: int) -> List[Dict]:
-        """홈페이지에서 최신 뉴스 가져오기 (폴백)"""
+        """홈페이지에서 최신 뉴스 가져오기 (폴백) - 검색/트렌딩/최신 뉴스가 공유하는 스냅샷 사용"""
         try:
-            response = requests.get(self.base_url, headers=self.headers, timeout=5)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return get_page(self.base_url, lambda html: self._parse_homepage_articles(html, limit),
+                            headers=self.headers, timeout=5, variant=('homepage', limit))
+        except Exception as e:
+            logger.error(f"Daily Mail 홈페이지 가져오기 실패: {e}")
+            return []
+    
+    def _parse_homepage_articles(self, html_content: str, limit: int) -> List[Dict]:
+        """홈페이지 HTML에서 기사 추출"""
+        try:
+            soup = BeautifulSoup(html_content, 'html.parser')
             articles = []
             
             # Daily Mail 홈페이지에서 기사 링크 찾기
@@ -618,17 +596,16 @@ class HybridDailyMailScraper:
                     # Daily Mail 날짜 추출 개선
                     published_date = self._extract_dailymail_date(link, href)
                     
-                    article = {
-                        'title': title,
-                        'url': href,
-                        'summary': '',
-                        'published_date': published_date,
-                        'source': 'Daily Mail',
-                        'category': self._extract_category_from_url(href),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=href,
+                        summary='',
+                        published_date=published_date,
+                        source='Daily Mail',
+                        category=self._extract_category_from_url(href),
+                        relevance_score=1,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     if len(articles) >= limit:
@@ -689,11 +666,14 @@ class HybridDailyMailScraper:
             
             logger.info(f"Daily Mail 카테고리 페이지 접근: {url}")
             
-            # 실제 카테고리 페이지에서 기사 추출
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            articles = self._extract_dailymail_category_articles(response.text, limit, category)
+            # 실제 카테고리 페이지에서 기사 추출 (섹션 페이지 스냅샷 공유)
+            if category in ('sports', 'sport'):
+                # 스포츠 섹션은 큰 페이지라 스트리밍 파싱 (limit 개를 채우면 내려받기 중단)
+                articles = get_page_streamed(url, lambda chunks: self._extract_sport_section_articles(chunks, limit),
+                                             headers=self.headers, timeout=15, variant=('sport', limit))
+            else:
+                articles = get_page(url, lambda html: self._extract_dailymail_category_articles(html, limit, category),
+                                    headers=self.headers, timeout=15, variant=('latest', limit, category))
             
             if articles:
                 logger.info(f"Daily Mail {category} 카테고리에서 {len(articles)}개 기사 추출")
@@ -809,17 +789,16 @@ class HybridDailyMailScraper:
                             # 카테고리 추출
                             article_category = self._extract_category_from_url(url) or category
                             
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary[:300] if summary else title[:200],
-                                'published_date': published_date,
-                                'source': 'Daily Mail',
-                                'category': article_category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url
-                            }
+                            article = Article(
+                                title=title,
+                                url=url,
+                                summary=summary[:300] if summary else title[:200],
+                                published_date=published_date,
+                                source='Daily Mail',
+                                category=article_category,
+                                relevance_score=1,
+                                image_url=image_url
+                            )
                             
                             articles.append(article)
                             
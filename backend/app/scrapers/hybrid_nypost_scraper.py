@@ -5,34 +5,46 @@
 HTTP 우선 → 실패시 Selenium 자동 사용
 """
 
-import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import logging
 from urllib.parse import quote
 import re
 import time
+from itertools import islice
+
+from ..models.article import Article
+from .page_snapshot import get_page
+from .browser.extract import extract_candidates
+from .browser.availability import selenium_available
+from .browser.pool import get_browser_pool
+from .browser.waits import wait_for_results, wait_for_selectors, wait_for_url_change
+from .outbound import throttled_get
 
 logger = logging.getLogger(__name__)
 
 class HybridNYPostScraper:
+    # Selenium 검색 결과 셀렉터 (우선순위 순)
+    SELENIUM_RESULT_SELECTORS = [
+        'article',
+        '[class*="story"]',
+        '[class*="post"]',
+        'a[href*="nypost.com"]',
+        'h2 a',
+        'h3 a'
+    ]
+    
     def __init__(self):
         self.base_url = "https://nypost.com"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-        self.selenium_available = self._check_selenium_availability()
     
-    def _check_selenium_availability(self) -> bool:
-        """Selenium 사용 가능 여부 확인"""
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            return True
-        except ImportError:
-            logger.info("HTTP 방식 사용 (경량화 모드)")
-            return False
+    @property
+    def selenium_available(self) -> bool:
+        """Selenium 사용 가능 여부 (프로세스당 한 번만 확인)"""
+        return selenium_available()
     
     def search_news(self, query: str, limit: int = 10) -> List[Dict]:
         """하이브리드 뉴스 검색: HTTP → Selenium"""
@@ -70,7 +82,7 @@ class HybridNYPostScraper:
             
             for search_url in search_patterns:
                 try:
-                    response = requests.get(search_url, headers=self.headers, timeout=10)
+                    response = throttled_get(search_url, headers=self.headers, timeout=10)
                     response.raise_for_status()
                     
                     if len(response.text) > 5000:
@@ -194,17 +206,16 @@ class HybridNYPostScraper:
                         # NY Post 날짜 추출
                         published_date = self._extract_nypost_date(element, url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else '',
-                            'published_date': published_date,
-                            'source': 'NY Post',
-                            'category': self._extract_category_from_url(url),
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 0.5,  # 검색 결과이므로 관련도 점수
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else '',
+                            published_date=published_date,
+                            source='NY Post',
+                            category=self._extract_category_from_url(url),
+                            relevance_score=0.5,  # 검색 결과이므로 관련도 점수
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
@@ -390,28 +401,15 @@ class HybridNYPostScraper:
     def _search_with_selenium(self, query: str, limit: int) -> List[Dict]:
         """Selenium 기반 검색"""
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
             from selenium.webdriver.common.by import By
             from selenium.webdriver.common.keys import Keys
             
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument(f'--user-agent={self.headers["User-Agent"]}')
-            
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(10)
-            
             articles = []
             
-            try:
+            # 공유 브라우저 풀에서 세션 대여 (매번 Chrome을 새로 띄우지 않음)
+            with get_browser_pool().lease(user_agent=self.headers["User-Agent"]) as driver:
                 # NY Post 메인 페이지로 이동
                 driver.get(self.base_url)
-                time.sleep(2)
                 
                 # 검색창 찾기 및 검색어 입력
                 search_selectors = [
@@ -422,6 +420,9 @@ class HybridNYPostScraper:
                     '[placeholder*="Search"]'
                 ]
                 
+                # 검색창이 나타날 때까지 대기
+                wait_for_selectors(driver, search_selectors)
+                
                 search_input = None
                 for selector in search_selectors:
                     try:
@@ -432,19 +433,20 @@ class HybridNYPostScraper:
                         continue
                 
                 if search_input:
+                    previous_url = driver.current_url
                     search_input.clear()
                     search_input.send_keys(query)
                     search_input.send_keys(Keys.RETURN)
-                    time.sleep(3)
+                    
+                    # 결과 페이지 이동 후 결과 요소가 렌더링될 때까지 대기
+                    wait_for_url_change(driver, previous_url)
+                    wait_for_results(driver, self.SELENIUM_RESULT_SELECTORS)
                     
                     # 검색 결과 추출
                     articles = self._extract_selenium_results(driver, limit)
                 
                 return articles
                 
-            finally:
-                driver.quit()
-                
         except Exception as e:
             logger.error(f"Selenium 검색 실패: {e}")
             return []
@@ -454,33 +456,20 @@ class HybridNYPostScraper:
         articles = []
         
         try:
-            # 검색 결과 찾기
-            selectors = [
-                'article',
-                '[class*="story"]',
-                '[class*="post"]',
-                'a[href*="nypost.com"]',
-                'h2 a',
-                'h3 a'
-            ]
-            
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements[:limit*2]:
-                        article = self._extract_article_from_element(element, driver)
-                        if article and article not in articles:
-                            articles.append(article)
-                            
-                            if len(articles) >= limit:
-                                break
-                    
-                    if articles:
-                        break
+            # 모든 셀렉터의 후보를 스크립트 한 번으로 수집 (요소별 WebDriver 왕복 없음)
+            seen_urls = set()
+            for candidates in extract_candidates(driver, self.SELENIUM_RESULT_SELECTORS, limit*2):
+                for candidate in candidates:
+                    article = self._article_from_candidate(candidate)
+                    if article and article.url not in seen_urls:
+                        seen_urls.add(article.url)
+                        articles.append(article)
                         
-                except Exception as e:
-                    continue
+                        if len(articles) >= limit:
+                            break
+                
+                if articles:
+                    break
             
             return articles
             
@@ -488,28 +477,11 @@ class HybridNYPostScraper:
             logger.debug(f"Selenium 결과 추출 실패: {e}")
             return []
     
-    def _extract_article_from_element(self, element, driver) -> Dict:
-        """Selenium 요소에서 기사 정보 추출"""
+    def _article_from_candidate(self, candidate: Dict) -> Optional[Article]:
+        """일괄 추출 스크립트가 돌려준 후보에서 기사 정보 생성"""
         try:
-            # 제목 추출
-            title = ""
-            try:
-                title = element.text.strip()
-                if not title:
-                    title = element.get_attribute('textContent').strip()
-            except:
-                pass
-            
-            # URL 추출
-            url = ""
-            try:
-                if element.tag_name == 'a':
-                    url = element.get_attribute('href')
-                else:
-                    link = element.find_element(By.TAG_NAME, 'a')
-                    url = link.get_attribute('href')
-            except:
-                pass
+            title = (candidate.get('title') or '').strip()
+            url = candidate.get('url') or ''
             
             # 기본 검증
             if not title or not url or len(title) < 10:
@@ -523,28 +495,47 @@ class HybridNYPostScraper:
             if 'nypost.com' not in url:
                 return None
             
-            return {
-                'title': title[:200],
-                'url': url,
-                'summary': '',
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'NY Post',
-                'category': self._extract_category_from_url(url),
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 0.5,
-                'image_url': ''  # Selenium에서는 이미지 추출 생략
-            }
+            # 이미지 URL 정규화 및 검증
+            image_url = candidate.get('image') or ''
+            if image_url.startswith('//'):
+                image_url = 'https:' + image_url
+            elif image_url.startswith('/'):
+                image_url = self.base_url + image_url
+            if image_url and not self._is_valid_nypost_image(image_url):
+                image_url = ''
+            
+            # 날짜 (ISO datetime 은 초 단위까지만 사용)
+            date_str = candidate.get('time') or ''
+            if re.match(r'\d{4}-\d{2}-\d{2}T', date_str):
+                date_str = date_str[:19]
+            
+            return Article(
+                title=title[:200],
+                url=url,
+                summary='',
+                published_date=self._format_date(date_str),
+                source='NY Post',
+                category=self._extract_category_from_url(url),
+                relevance_score=0.5,
+                image_url=image_url
+            )
             
         except Exception as e:
             return None
     
     def _get_homepage_articles(self, limit: int) -> List[Dict]:
-        """홈페이지에서 최신 뉴스 가져오기 (폴백)"""
+        """홈페이지에서 최신 뉴스 가져오기 (폴백) - 검색/트렌딩/최신 뉴스가 공유하는 스냅샷 사용"""
         try:
-            response = requests.get(self.base_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return get_page(self.base_url, lambda html: self._parse_homepage_articles(html, limit),
+                            headers=self.headers, timeout=10, variant=('homepage', limit))
+        except Exception as e:
+            logger.error(f"NY Post 홈페이지 가져오기 실패: {e}")
+            return []
+    
+    def _parse_homepage_articles(self, html_content: str, limit: int) -> List[Dict]:
+        """홈페이지 HTML에서 기사 추출"""
+        try:
+            soup = BeautifulSoup(html_content, 'html.parser')
             articles = []
             
             # NY Post 홈페이지에서 기사 링크 찾기
@@ -588,17 +579,16 @@ class HybridNYPostScraper:
                     # NY Post 날짜 추출
                     published_date = self._extract_nypost_date(link, href)
                     
-                    article = {
-                        'title': title,
-                        'url': href,
-                        'summary': '',
-                        'published_date': published_date,
-                        'source': 'NY Post',
-                        'category': self._extract_category_from_url(href),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=href,
+                        summary='',
+                        published_date=published_date,
+                        source='NY Post',
+                        category=self._extract_category_from_url(href),
+                        relevance_score=1,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     if len(articles) >= limit:
@@ -658,11 +648,9 @@ class HybridNYPostScraper:
             url = category_urls.get(category, category_urls['news'])
             logger.info(f"NY Post 카테고리 페이지 접근: {url}")
             
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            # 실제 웹사이트 구조에 맞게 기사 추출
-            articles = self._extract_nypost_category_articles(response.text, limit, category)
+            # 실제 웹사이트 구조에 맞게 기사 추출 (섹션 페이지 스냅샷 공유)
+            articles = get_page(url, lambda html: self._extract_nypost_category_articles(html, limit, category),
+                                headers=self.headers, timeout=15, variant=('latest', limit, category))
             
             if articles:
                 logger.info(f"NY Post {category} 카테고리에서 {len(articles)}개 기사 추출")
@@ -692,130 +680,145 @@ class HybridNYPostScraper:
             return self._get_homepage_articles(limit)
     
     def _extract_nypost_category_articles(self, html_content: str, limit: int, category: str) -> List[Dict]:
-        """NY Post 카테고리 페이지에서 기사 추출 - 실제 구조 분석 기반"""
-        articles = []
+        """NY Post 카테고리 페이지에서 기사 추출 - 실제 구조 분석 기반
         
+        후보 링크 → 저비용 검증 → 중복 제거 → 요약/이미지/날짜 보강 순서의 지연
+        파이프라인. limit 개가 채워지면 나머지 선택자와 링크는 처리하지 않는다.
+        """
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
             
-            # NY Post 실제 기사 선택자들
-            article_selectors = [
-                # 메인 기사 링크들
-                'h2 a[href*="nypost.com"]',
-                'h3 a[href*="nypost.com"]',
-                'h4 a[href*="nypost.com"]',
-                # 기사 컨테이너들
-                'article a[href*="nypost.com"]',
-                '.story a[href*="nypost.com"]',
-                '.post a[href*="nypost.com"]',
-                '.entry-title a[href*="nypost.com"]',
-                '.story-headline a',
-                # 년도 기반 URL 패턴 (NY Post 특화)
-                'a[href*="/2025/"]',
-                'a[href*="/2024/"]',
-                # 일반적인 링크들
-                'a[href*="nypost.com"][href*="/"][href*="-"]'
-            ]
-            
-            found_urls = set()
-            
-            for selector in article_selectors:
-                try:
-                    links = soup.select(selector)
-                    logger.debug(f"NY Post {selector}: {len(links)}개 링크 발견")
-                    
-                    for link in links:
-                        try:
-                            title = link.get_text(strip=True)
-                            url = link.get('href', '')
-                            
-                            # 기본 검증
-                            if not title or len(title) < 15:
-                                continue
-                                
-                            if not url:
-                                continue
-                                
-                            # URL 정규화
-                            if url.startswith('/'):
-                                url = self.base_url + url
-                            elif not url.startswith('http'):
-                                url = self.base_url + '/' + url
-                            
-                            # NY Post URL 확인
-                            if 'nypost.com' not in url:
-                                continue
-                                
-                            # 중복 확인
-                            if url in found_urls:
-                                continue
-                            found_urls.add(url)
-                            
-                            # 불필요한 링크 필터링
-                            if any(skip in url.lower() for skip in [
-                                '/search', '/login', '/register', '/subscribe', 
-                                '/contact', '/about', '/terms', '/privacy',
-                                '/author/', '/tag/', '/feed/', '/rss'
-                            ]):
-                                continue
-                                
-                            # 불필요한 제목들 필터링
-                            if any(skip in title.lower() for skip in [
-                                'follow us', 'subscribe', 'newsletter', 'login',
-                                'register', 'contact us', 'privacy policy',
-                                'terms of service', 'cookie policy', 'sitemap',
-                                'read more', 'continue reading'
-                            ]):
-                                continue
-                            
-                            # 링크 주변에서 정보 추출
-                            parent = link.parent
-                            context = parent.parent if parent and parent.parent else parent if parent else link
-                            
-                            # 요약 추출
-                            summary = self._extract_nypost_summary(context, title)
-                            
-                            # 이미지 추출 (기존 로직 사용)
-                            image_url = self._extract_nypost_image(link, url)
-                            
-                            # 날짜 추출 (개선된 버전)
-                            published_date = self._extract_nypost_date_improved(context, url)
-                            
-                            # 카테고리 추출
-                            article_category = self._extract_category_from_url(url) or category
-                            
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary[:300] if summary else title[:200],
-                                'published_date': published_date,
-                                'source': 'NY Post',
-                                'category': article_category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url
-                            }
-                            
-                            articles.append(article)
-                            
-                            if len(articles) >= limit:
-                                break
-                                
-                        except Exception as e:
-                            logger.debug(f"NY Post 개별 기사 처리 실패: {e}")
-                            continue
-                    
-                    if len(articles) >= limit:
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"NY Post selector {selector} 처리 실패: {e}")
-                    continue
+            candidates = (
+                candidate for candidate in map(self._category_link_candidate, self._category_links(soup))
+                if candidate is not None
+            )
+            articles = (self._enrich_category_candidate(link, title, url, category)
+                        for link, title, url in self._dedupe_by_url(candidates))
+            return list(islice((article for article in articles if article is not None), limit))
                     
         except Exception as e:
             logger.error(f"NY Post 카테고리 HTML 파싱 실패: {e}")
+            return []
+    
+    def _category_links(self, soup):
+        """선택자 우선순위대로 후보 링크를 하나씩 전달 (다음 선택자는 필요할 때만 실행)"""
+        # NY Post 실제 기사 선택자들
+        article_selectors = [
+            # 메인 기사 링크들
+            'h2 a[href*="nypost.com"]',
+            'h3 a[href*="nypost.com"]',
+            'h4 a[href*="nypost.com"]',
+            # 기사 컨테이너들
+            'article a[href*="nypost.com"]',
+            '.story a[href*="nypost.com"]',
+            '.post a[href*="nypost.com"]',
+            '.entry-title a[href*="nypost.com"]',
+            '.story-headline a',
+            # 년도 기반 URL 패턴 (NY Post 특화)
+            'a[href*="/2025/"]',
+            'a[href*="/2024/"]',
+            # 일반적인 링크들
+            'a[href*="nypost.com"][href*="/"][href*="-"]'
+        ]
         
-        return articles[:limit]
+        for selector in article_selectors:
+            try:
+                links = soup.select(selector)
+            except Exception as e:
+                logger.debug(f"NY Post selector {selector} 처리 실패: {e}")
+                continue
+            logger.debug(f"NY Post {selector}: {len(links)}개 링크 발견")
+            yield from links
+    
+    def _category_link_candidate(self, link):
+        """링크의 제목/URL 정규화와 저비용 검증 (통과하면 (링크, 제목, URL))"""
+        try:
+            title = link.get_text(strip=True)
+            url = link.get('href', '')
+            
+            # 기본 검증
+            if not title or len(title) < 15:
+                return None
+                
+            if not url:
+                return None
+                
+            # URL 정규화
+            if url.startswith('/'):
+                url = self.base_url + url
+            elif not url.startswith('http'):
+                url = self.base_url + '/' + url
+            
+            # NY Post URL 확인
+            if 'nypost.com' not in url:
+                return None
+            
+            # 불필요한 링크 필터링
+            if any(skip in url.lower() for skip in [
+                '/search', '/login', '/register', '/subscribe', 
+                '/contact', '/about', '/terms', '/privacy',
+                '/author/', '/tag/', '/feed/', '/rss'
+            ]):
+                return None
+                
+            # 불필요한 제목들 필터링
+            if any(skip in title.lower() for skip in [
+                'follow us', 'subscribe', 'newsletter', 'login',
+                'register', 'contact us', 'privacy policy',
+                'terms of service', 'cookie policy', 'sitemap',
+                'read more', 'continue reading'
+            ]):
+                return None
+            
+            return link, title, url
+            
+        except Exception as e:
+            logger.debug(f"NY Post 개별 기사 처리 실패: {e}")
+            return None
+    
+    def _dedupe_by_url(self, candidates):
+        """URL 기준 중복 제거"""
+        found_urls = set()
+        for candidate in candidates:
+            url = candidate[2]
+            if url in found_urls:
+                continue
+            found_urls.add(url)
+            yield candidate
+    
+    def _enrich_category_candidate(self, link, title: str, url: str, category: str) -> Optional[Article]:
+        """검증된 링크 주변에서 요약/이미지/날짜를 추출해 Article 생성 (반환될 기사에만 실행)"""
+        try:
+            # 링크 주변에서 정보 추출
+            parent = link.parent
+            context = parent.parent if parent and parent.parent else parent if parent else link
+            
+            # 요약 추출
+            summary = self._extract_nypost_summary(context, title)
+            
+            # 이미지 추출 (기존 로직 사용)
+            image_url = self._extract_nypost_image(link, url)
+            
+            # 날짜 추출 (개선된 버전)
+            published_date = self._extract_nypost_date_improved(context, url)
+            
+            # 카테고리 추출
+            article_category = self._extract_category_from_url(url) or category
+            
+            return Article(
+                title=title,
+                url=url,
+                summary=summary[:300] if summary else title[:200],
+                published_date=published_date,
+                source='NY Post',
+                category=article_category,
+                relevance_score=1,
+                image_url=image_url
+            )
+            
+        except Exception as e:
+            logger.debug(f"NY Post 개별 기사 처리 실패: {e}")
+            return None
     
     def _extract_nypost_summary(self, element, title: str) -> str:
         """NY Post 기사에서 요약 추출"""
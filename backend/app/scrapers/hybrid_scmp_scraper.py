@@ -5,9 +5,8 @@
 HTTP 우선 → 실패시 Selenium 자동 사용
 """
 
-import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 import logging
 from urllib.parse import quote
@@ -15,6 +14,13 @@ import re
 import time
 import json
 
+from ..models.article import Article
+from .browser.extract import extract_candidates
+from .browser.availability import selenium_available
+from .browser.pool import get_browser_pool
+from .browser.waits import wait_for_results
+from .outbound import ENRICHMENT, throttled_get
+
 logger = logging.getLogger(__name__)
 
 class HybridSCMPScraper:
@@ -34,17 +40,11 @@ class HybridSCMPScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-        self.selenium_available = self._check_selenium_availability()
     
-    def _check_selenium_availability(self) -> bool:
-        """Selenium 사용 가능 여부 확인"""
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            return True
-        except ImportError:
-            logger.info("HTTP 방식 사용 (경량화 모드)")
-            return False
+    @property
+    def selenium_available(self) -> bool:
+        """Selenium 사용 가능 여부 (프로세스당 한 번만 확인)"""
+        return selenium_available()
     
     def search_news(self, query: str, limit: int = 10) -> List[Dict]:
         """하이브리드 뉴스 검색: GraphQL API → Selenium"""
@@ -114,7 +114,7 @@ class HybridSCMPScraper:
             
             logger.info(f"GraphQL 요청 URL: {full_url[:100]}...")
             
-            response = requests.get(full_url, headers=self.api_headers, timeout=10)
+            response = throttled_get(full_url, headers=self.api_headers, timeout=10)
             response.raise_for_status()
             
             # 응답 파싱
@@ -265,17 +265,16 @@ class HybridSCMPScraper:
                             # 관련성 점수 계산
                             relevance_score = self._calculate_relevance(title, summary, query)
                             
-                            article = {
-                                'title': title[:200],
-                                'url': url,
-                                'summary': summary[:300] if summary else '',
-                                'published_date': published_date,
-                                'source': 'SCMP',
-                                'category': category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': relevance_score,
-                                'image_url': image_url
-                            }
+                            article = Article(
+                                title=title[:200],
+                                url=url,
+                                summary=summary[:300] if summary else '',
+                                published_date=published_date,
+                                source='SCMP',
+                                category=category,
+                                relevance_score=relevance_score,
+                                image_url=image_url
+                            )
                             
                             articles.append(article)
                             
@@ -341,7 +340,7 @@ class HybridSCMPScraper:
             for search_url in search_patterns:
                 try:
                     logger.info(f"SCMP 검색 시도: {search_url}")
-                    response = requests.get(search_url, headers=self.headers, timeout=10)
+                    response = throttled_get(search_url, headers=self.headers, timeout=10)
                     response.raise_for_status()
                     
                     extracted_articles = self._extract_scmp_search_results(response.text, limit, query)
@@ -410,17 +409,16 @@ class HybridSCMPScraper:
                         # 카테고리 추출
                         category = self._extract_category_from_url(href)
                         
-                        article = {
-                            'title': title,
-                            'url': href,
-                            'summary': '',  # 검색 결과에서는 요약 생략
-                            'published_date': published_date,
-                            'source': 'SCMP',
-                            'category': category,
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=href,
+                            summary='',  # 검색 결과에서는 요약 생략
+                            published_date=published_date,
+                            source='SCMP',
+                            category=category,
+                            relevance_score=1,
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
@@ -476,7 +474,7 @@ class HybridSCMPScraper:
         """개선된 SCMP 이미지 추출 - 메타 태그 우선"""
         try:
             # 1. 기사 페이지에서 메타 태그 이미지 추출
-            response = requests.get(article_url, headers=self.headers, timeout=5)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=5)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -672,30 +670,13 @@ class HybridSCMPScraper:
     def _search_with_selenium(self, query: str, limit: int) -> List[Dict]:
         """Selenium 기반 검색"""
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.common.by import By
-            
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument(f'--user-agent={self.headers["User-Agent"]}')
-            
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(10)
-            
             articles = []
             
-            try:
+            # 공유 브라우저 풀에서 세션 대여 (매번 Chrome을 새로 띄우지 않음)
+            with get_browser_pool().lease(user_agent=self.headers["User-Agent"]) as driver:
                 search_url = f"https://www.scmp.com/search?query={quote(query)}"
                 driver.get(search_url)
                 
-                # JavaScript 로딩 대기
-                time.sleep(5)
-                
                 # 검색 결과 찾기
                 selectors = [
                     'article',
@@ -706,55 +687,35 @@ class HybridSCMPScraper:
                     'a[href*="/sport/"]'
                 ]
                 
-                for selector in selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        
-                        for element in elements[:limit]:
-                            article = self._extract_article_from_element(element, driver)
-                            if article and article not in articles:
-                                articles.append(article)
-                                
-                                if len(articles) >= limit:
-                                    break
-                        
-                        if articles:
-                            break
+                # JavaScript 렌더링 대기 (결과 요소 등장 + DOM 안정화, 고정 sleep 대신)
+                wait_for_results(driver, selectors)
+                
+                # 모든 셀렉터의 후보를 스크립트 한 번으로 수집 (요소별 WebDriver 왕복 없음)
+                seen_urls = set()
+                for candidates in extract_candidates(driver, selectors, limit):
+                    for candidate in candidates:
+                        article = self._article_from_candidate(candidate)
+                        if article and article.url not in seen_urls:
+                            seen_urls.add(article.url)
+                            articles.append(article)
                             
-                    except Exception as e:
-                        continue
+                            if len(articles) >= limit:
+                                break
+                    
+                    if articles:
+                        break
                 
                 return articles
                 
-            finally:
-                driver.quit()
-                
         except Exception as e:
             logger.error(f"Selenium 검색 실패: {e}")
             return []
     
-    def _extract_article_from_element(self, element, driver) -> Dict:
-        """Selenium 요소에서 기사 정보 추출"""
+    def _article_from_candidate(self, candidate: Dict) -> Optional[Article]:
+        """일괄 추출 스크립트가 돌려준 후보에서 기사 정보 생성"""
         try:
-            # 제목 추출
-            title = ""
-            try:
-                title = element.text.strip()
-                if not title:
-                    title = element.get_attribute('textContent').strip()
-            except:
-                pass
-            
-            # URL 추출
-            url = ""
-            try:
-                if element.tag_name == 'a':
-                    url = element.get_attribute('href')
-                else:
-                    link = element.find_element(By.TAG_NAME, 'a')
-                    url = link.get_attribute('href')
-            except:
-                pass
+            title = (candidate.get('title') or '').strip()
+            url = candidate.get('url') or ''
             
             # 기본 검증
             if not title or not url or len(title) < 10:
@@ -768,17 +729,30 @@ class HybridSCMPScraper:
             if 'scmp.com' not in url:
                 return None
             
-            return {
-                'title': title[:200],
-                'url': url,
-                'summary': '',
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'SCMP',
-                'category': self._extract_category_from_url(url),
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 0.5,
-                'image_url': ''  # Selenium에서는 이미지 추출 생략
-            }
+            # 이미지 URL 정규화 및 검증
+            image_url = candidate.get('image') or ''
+            if image_url.startswith('//'):
+                image_url = 'https:' + image_url
+            elif image_url.startswith('/'):
+                image_url = self.base_url + image_url
+            if image_url and not self._is_valid_scmp_image(image_url):
+                image_url = ''
+            
+            # 날짜 (ISO datetime 은 초 단위까지만 사용)
+            date_str = candidate.get('time') or ''
+            if re.match(r'\d{4}-\d{2}-\d{2}T', date_str):
+                date_str = date_str[:19]
+            
+            return Article(
+                title=title[:200],
+                url=url,
+                summary='',
+                published_date=self._format_date(date_str),
+                source='SCMP',
+                category=self._extract_category_from_url(url),
+                relevance_score=0.5,
+                image_url=image_url
+            )
             
         except Exception as e:
             return None
@@ -786,7 +760,7 @@ class HybridSCMPScraper:
     def _get_homepage_articles(self, limit: int) -> List[Dict]:
         """홈페이지에서 최신 뉴스 가져오기 (폴백)"""
         try:
-            response = requests.get(self.base_url, headers=self.headers, timeout=5)
+            response = throttled_get(self.base_url, headers=self.headers, timeout=5)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -829,17 +803,16 @@ class HybridSCMPScraper:
                         elif image_url.startswith('/'):
                             image_url = self.base_url + image_url
                     
-                    article = {
-                        'title': title,
-                        'url': href,
-                        'summary': '',
-                        'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                        'source': 'SCMP',
-                        'category': self._extract_category_from_url(href),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=href,
+                        summary='',
+                        published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                        source='SCMP',
+                        category=self._extract_category_from_url(href),
+                        relevance_score=1,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     if len(articles) >= limit:
@@ -903,7 +876,7 @@ class HybridSCMPScraper:
             
             # 실제 카테고리 페이지에서 기사 추출
             try:
-                response = requests.get(url, headers=self.headers, timeout=15)
+                response = throttled_get(url, headers=self.headers, timeout=15)
                 response.raise_for_status()
                 
                 articles = self._extract_scmp_category_articles(response.text, limit, category)
@@ -1023,17 +996,16 @@ class HybridSCMPScraper:
                             # 카테고리 추출
                             article_category = self._extract_category_from_url(url) or category
                             
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary[:300] if summary else title[:200],
-                                'published_date': published_date,
-                                'source': 'SCMP',
-                                'category': article_category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url
-                            }
+                            article = Article(
+                                title=title,
+                                url=url,
+                                summary=summary[:300] if summary else title[:200],
+                                published_date=published_date,
+                                source='SCMP',
+                                category=article_category,
+                                relevance_score=1,
+                                image_url=image_url
+                            )
                             
                             articles.append(article)
                             
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""소스별 응답 지연 추적과 적응형 타임아웃
+
+모든 소스에 같은 고정 타임아웃(SCRAPER_TIMEOUT)을 주면 BBC RSS 처럼 빠른 소스는
+실패를 늦게 알게 되고, 느린 하이브리드 소스는 정상 응답도 잘린다. 소스마다 최근
+호출 지연을 롤링 윈도우로 보관하고 p99 에 여유 배수를 곱해 다음 호출의 시간
+예산을 정한다.
+
+- 표본이 LATENCY_MIN_SAMPLES 개 미만이면 SCRAPER_TIMEOUT 을 그대로 사용한다.
+- 예산은 SCRAPER_TIMEOUT 을 넘지 않는다 (느린 소스에 기존보다 오래 기다리지 않음).
+- 지연 분포에는 성공한 호출만 넣는다. 타임아웃은 별도 횟수로만 센다 (잘린
+  호출을 예산 값으로 넣으면 타임아웃마다 예산이 커지는 톱니 효과가 생김).
+- 오류로 끝난 호출도 지연 분포를 왜곡하므로 기록하지 않는다.
+- 타임아웃이 LATENCY_TIMEOUT_RESET 번 연달아 나면 소스가 느려진 것으로 보고
+  이전 표본을 버린다. 예산이 SCRAPER_TIMEOUT 으로 돌아가고, 그 뒤 성공한 호출로
+  새 분포를 다시 배운다 (작게 배운 예산에 갇혀 계속 타임아웃나는 것 방지).
+
+요청 하나가 여러 소스를 기다리는 전체 시간은 SCRAPER_REQUEST_DEADLINE 으로 묶는다.
+"""
+import os
+import threading
+from collections import deque
+from typing import Dict
+
+# 표본이 부족할 때의 기본 예산 (초)
+DEFAULT_TIMEOUT = float(os.getenv('SCRAPER_TIMEOUT', '15'))
+MIN_TIMEOUT = float(os.getenv('SCRAPER_TIMEOUT_MIN', '3'))
+# 상한은 고정 타임아웃 이하로만 낮출 수 있음
+MAX_TIMEOUT = min(float(os.getenv('SCRAPER_TIMEOUT_MAX', str(DEFAULT_TIMEOUT))), DEFAULT_TIMEOUT)
+# p99 에 곱하는 여유 배수
+TIMEOUT_HEADROOM = float(os.getenv('SCRAPER_TIMEOUT_HEADROOM', '1.5'))
+LATENCY_WINDOW = int(os.getenv('LATENCY_WINDOW', '100'))
+LATENCY_MIN_SAMPLES = int(os.getenv('LATENCY_MIN_SAMPLES', '5'))
+# 이 횟수만큼 연속 타임아웃나면 표본을 버리고 기본 예산으로 복귀
+LATENCY_TIMEOUT_RESET = int(os.getenv('LATENCY_TIMEOUT_RESET', '2'))
+# 요청 하나가 모든 소스 결과를 기다리는 전체 마감 시간 (초)
+REQUEST_DEADLINE = float(os.getenv('SCRAPER_REQUEST_DEADLINE', '20'))
+
+
+def _percentile(sorted_values, q: float) -> float:
+    """정렬된 값에서 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class LatencyTracker:
+    """소스 하나의 최근 성공 호출 지연 롤링 윈도우와 타임아웃 횟수"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque = deque(maxlen=window)
+        self.timeouts = 0
+        self.consecutive_timeouts = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """성공한 호출의 지연 기록"""
+        with self._lock:
+            self._samples.append(seconds)
+            self.consecutive_timeouts = 0
+
+    def record_timeout(self) -> None:
+        """예산을 넘긴 호출 (지연 분포에는 넣지 않음, 연속되면 오래된 표본 폐기)"""
+        with self._lock:
+            self.timeouts += 1
+            self.consecutive_timeouts += 1
+            if self.consecutive_timeouts >= LATENCY_TIMEOUT_RESET:
+                self._samples.clear()
+
+    def percentiles(self) -> Dict[str, float]:
+        """p50/p95/p99, 표본 수, 타임아웃 횟수"""
+        with self._lock:
+            values = sorted(self._samples)
+            timeouts = self.timeouts
+        return {
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+            "samples": len(values),
+            "timeouts": timeouts,
+        }
+
+    def budget(self) -> float:
+        """다음 호출의 시간 예산 (초)"""
+        with self._lock:
+            if len(self._samples) < LATENCY_MIN_SAMPLES:
+                return DEFAULT_TIMEOUT
+            values = sorted(self._samples)
+        return max(MIN_TIMEOUT, min(MAX_TIMEOUT, _percentile(values, 0.99) * TIMEOUT_HEADROOM))
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_tracker(key: str) -> LatencyTracker:
+    """소스 키별 공유 추적기"""
+    tracker = _trackers.get(key)
+    if tracker is None:
+        with _trackers_lock:
+            tracker = _trackers.get(key)
+            if tracker is None:
+                tracker = _trackers[key] = LatencyTracker()
+    return tracker
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""섹션 크롤링 결과로 유지하는 로컬 기사 검색 인덱스
+
+사이트 자체 검색이 없어 외부 검색엔진을 거쳐야 하는 소스를 위해, 최신 뉴스
+수집 때 받은 기사들을 URL 기준으로 모아 두고 단어 단위 역색인으로 검색한다.
+오래된 기사(max_age 초 초과)와 용량 초과분은 먼저 들어온 순서대로 밀려난다.
+
+불용어("of", "the" 등)는 색인하지 않고, 기본적으로 검색어의 모든 단어가 들어간
+기사만 결과로 낸다 ("cost of living" 이 "of" 하나로 모든 기사와 맞지 않도록).
+"""
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Set
+
+from ..models.article import Article
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+STOPWORDS = frozenset("""
+a about after against all also an and are as at be been before but by can could did do does
+for from had has have he her his how if in into is it its may more most new no not of off on
+one or our out over says she should so than that the their them then there these they this
+those to up was we were what when where which who why will with would you your
+""".split())
+
+
+def tokenize(text: str) -> Set[str]:
+    """검색용 단어 집합 (소문자, 두 글자 이상, 불용어 제외)"""
+    return {token for token in _TOKEN_RE.findall(text.lower())
+            if len(token) > 1 and token not in STOPWORDS}
+
+
+class LocalArticleIndex:
+    """URL 기준 기사 저장 + 단어 역색인"""
+
+    def __init__(self, max_articles: int = 2000, max_age: float = 6 * 3600):
+        self.max_articles = max_articles
+        self.max_age = max_age
+        self._articles: 'OrderedDict[str, tuple]' = OrderedDict()  # url -> (추가 시각, 기사, 제목 단어, 전체 단어)
+        self._postings: Dict[str, Set[str]] = {}  # 단어 -> url 집합
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def _remove(self, url: str) -> None:
+        _, _, _, tokens = self._articles.pop(url)
+        for token in tokens:
+            urls = self._postings.get(token)
+            if urls is not None:
+                urls.discard(url)
+                if not urls:
+                    del self._postings[token]
+
+    def _evict(self, now: float) -> None:
+        while self._articles:
+            url, (added_at, _, _, _) = next(iter(self._articles.items()))
+            if len(self._articles) > self.max_articles or now - added_at > self.max_age:
+                self._remove(url)
+            else:
+                break
+
+    def add(self, articles: Iterable) -> int:
+        """기사 추가 (같은 URL은 최신 내용으로 교체), 추가된 기사 수 반환"""
+        now = time.monotonic()
+        count = 0
+        with self._lock:
+            for item in articles:
+                article = Article.coerce(item)
+                if not article.url or not article.title:
+                    continue
+                if article.url in self._articles:
+                    self._remove(article.url)
+                title_tokens = tokenize(article.title)
+                tokens = title_tokens | tokenize(article.summary or '')
+                self._articles[article.url] = (now, article, title_tokens, tokens)
+                for token in tokens:
+                    self._postings.setdefault(token, set()).add(article.url)
+                count += 1
+            self._evict(now)
+        return count
+
+    def search(self, query: str, limit: int, min_match: float = 1.0) -> List[Article]:
+        """검색어 단어가 많이 겹치는 순(제목 일치 가중), 같으면 최신 발행일 순
+
+        Args:
+            min_match: 기사에 들어 있어야 하는 검색어 단어 비율 (1.0 이면 모든 단어)
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+        required = max(1, math.ceil(len(query_tokens) * min_match))
+        with self._lock:
+            self._evict(time.monotonic())
+            matched = Counter()
+            for token in query_tokens:
+                matched.update(self._postings.get(token, ()))
+            scored = []
+            for url, count in matched.items():
+                if count < required:
+                    continue
+                _, article, title_tokens, _ = self._articles[url]
+                score = count + len(query_tokens & title_tokens)
+                scored.append((score, article.published_date or '', article))
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [article for _, _, article in scored[:limit]]
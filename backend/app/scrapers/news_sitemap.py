@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Google News 사이트맵(news-sitemap) 증분 수집
+
+홈페이지/섹션 페이지는 크고 셀렉터도 많아 새 기사 발견 비용이 크다. 대부분의
+언론사가 제공하는 뉴스 사이트맵은 작고 구조화되어 있으며 발행 시각도 담고 있다.
+
+- 조건부 GET(ETag/Last-Modified) 으로 바뀌지 않은 사이트맵은 본문을 받지 않는다.
+- 응답을 청크 단위로 XMLPullParser 에 넣어 <url> 요소가 닫힐 때마다 처리하고
+  바로 비운다 (전체 트리를 만들지 않음).
+- 이미 본 URL 은 Article 을 다시 만들지 않고 새 항목만 소스별 저장소에 추가한다.
+  본 URL 목록은 보관 기사 수보다 큰 별도 LRU 로 유지해, 보관 범위에서 밀려난
+  기사가 다음 조회 때 새 기사로 다시 들어오지 않게 한다.
+
+사이트맵 항목에는 요약이 없고 이미지도 드물어서, 여기서 수집한 기사는 스크래퍼
+결과를 대신하지 않고 부족한 자리를 채우는 데만 쓴다. 수집은 백그라운드 폴러만
+하며 요청 경로에서는 하지 않는다.
+"""
+import logging
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from ..models.article import Article
+from .outbound import PREFETCH, outbound_priority, throttled_get
+
+logger = logging.getLogger(__name__)
+
+# 사이트맵 재조회 간격 (초), 0 이하면 사이트맵 수집을 하지 않음
+SITEMAP_POLL_INTERVAL = float(os.getenv('SITEMAP_POLL_INTERVAL', '120'))
+# 소스별로 보관하는 최근 기사 수
+SITEMAP_MAX_ENTRIES = 500
+# 소스별로 기억하는 이미 본 URL 수 (사이트맵 한 개 항목 수와 보관 기사 수보다 커야 함)
+SITEMAP_SEEN_ENTRIES = 5000
+
+_SM = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+_NEWS = '{http://www.google.com/schemas/sitemap-news/0.9}'
+_IMAGE = '{http://www.google.com/schemas/sitemap-image/1.1}'
+
+# URL 첫 경로 구간 -> 공통 카테고리
+_PATH_CATEGORIES = {
+    'news': 'news', 'world': 'world', 'politics': 'politics',
+    'sport': 'sports', 'sports': 'sports',
+    'business': 'business', 'money': 'business', 'economy': 'business',
+    'tech': 'technology', 'technology': 'technology', 'sciencetech': 'technology',
+    'entertainment': 'entertainment', 'tvshowbiz': 'entertainment', 'showbiz': 'entertainment',
+    'health': 'health', 'travel': 'travel', 'lifestyle': 'lifestyle', 'opinion': 'opinion',
+}
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+
+def published_sort_key(value: str) -> datetime:
+    """발행 시각 정렬 키 (시간대 오프셋 반영, 읽을 수 없으면 가장 오래된 값)"""
+    try:
+        published = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return datetime.min.replace(tzinfo=timezone.utc)
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published
+
+
+def category_from_path(url: str) -> str:
+    """기사 URL 경로로 카테고리 추정 (모르면 'news')"""
+    segments = [segment for segment in urlparse(url).path.lower().split('/') if segment]
+    return _PATH_CATEGORIES.get(segments[0], 'news') if segments else 'news'
+
+
+class NewsSitemapFeed:
+    """소스 하나의 뉴스 사이트맵과 지금까지 수집한 최근 기사"""
+
+    def __init__(self, url: str, source_name: str,
+                 category_of: Callable[[str], str] = category_from_path,
+                 max_entries: int = SITEMAP_MAX_ENTRIES, seen_entries: int = SITEMAP_SEEN_ENTRIES):
+        self.url = url
+        self.source_name = source_name
+        self.category_of = category_of
+        self.max_entries = max_entries
+        self.seen_entries = max(seen_entries, max_entries)
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.polled_at = 0.0
+        self._articles: 'OrderedDict[str, Article]' = OrderedDict()
+        # 이미 처리한 URL (LRU, poll 안에서만 사용하므로 _poll_lock 으로 보호)
+        self._seen: 'OrderedDict[str, None]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+
+    def is_stale(self, interval: float = SITEMAP_POLL_INTERVAL) -> bool:
+        return time.monotonic() - self.polled_at >= interval
+
+    def _entry_to_article(self, loc: str, elem) -> Optional[Article]:
+        news = elem.find(f'{_NEWS}news')
+        if news is None:
+            return None
+        title = (news.findtext(f'{_NEWS}title') or '').strip()
+        if not title:
+            return None
+        published = (news.findtext(f'{_NEWS}publication_date') or '').strip()
+        image_url = (elem.findtext(f'{_IMAGE}image/{_IMAGE}loc') or '').strip()
+        return Article(
+            title=title,
+            url=loc,
+            summary='',
+            published_date=published,  # 시간대 오프셋을 포함한 ISO 8601 그대로
+            source=self.source_name,
+            category=self.category_of(loc),
+            image_url=image_url
+        )
+
+    def poll(self, timeout: float = 10) -> int:
+        """사이트맵을 조건부로 가져와 새 기사만 추가, 추가된 기사 수 반환"""
+        # 동시에 같은 사이트맵을 두 번 받지 않음
+        with self._poll_lock:
+            headers = dict(_HEADERS)
+            if self.etag:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified:
+                headers['If-Modified-Since'] = self.last_modified
+
+            with throttled_get(self.url, headers=headers, timeout=timeout, stream=True) as response:
+                self.polled_at = time.monotonic()
+                if response.status_code == 304:
+                    logger.debug(f"{self.source_name} 뉴스 사이트맵 변경 없음")
+                    return 0
+                response.raise_for_status()
+                self.etag = response.headers.get('ETag')
+                self.last_modified = response.headers.get('Last-Modified')
+
+                parser = ET.XMLPullParser(events=('end',))
+                new_articles = []
+                locs = []  # 이번 사이트맵의 URL (끝까지 처리한 뒤에만 본 목록에 반영)
+                fresh = set()
+                for chunk in response.iter_content(chunk_size=16384):
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        if elem.tag != f'{_SM}url':
+                            continue
+                        loc = (elem.findtext(f'{_SM}loc') or '').strip()
+                        if loc:
+                            locs.append(loc)
+                        if loc and loc not in self._seen and loc not in fresh:
+                            fresh.add(loc)
+                            article = self._entry_to_article(loc, elem)
+                            if article is not None:
+                                new_articles.append(article)
+                        elem.clear()  # 처리한 요소는 바로 비움
+                parser.close()
+
+            with self._lock:
+                for article in new_articles:
+                    self._articles[article.url] = article
+                while len(self._articles) > self.max_entries:
+                    self._articles.popitem(last=False)
+            for loc in locs:
+                self._seen[loc] = None
+                self._seen.move_to_end(loc)  # 사이트맵에 남아 있는 동안 잊지 않음
+            while len(self._seen) > self.seen_entries:
+                self._seen.popitem(last=False)
+            if new_articles:
+                logger.info(f"{self.source_name} 뉴스 사이트맵에서 새 기사 {len(new_articles)}개 수집")
+            return len(new_articles)
+
+    def latest(self, limit: int) -> List[Article]:
+        """발행 시각 최신순 기사"""
+        with self._lock:
+            articles = list(self._articles.values())
+        articles.sort(key=lambda article: published_sort_key(article.published_date), reverse=True)
+        return articles[:limit]
+
+
+def poll_feeds(feeds: Iterable[NewsSitemapFeed], interval: float = SITEMAP_POLL_INTERVAL) -> None:
+    """오래된 사이트맵만 다시 조회 (실패는 로그만 남김)"""
+    for feed in feeds:
+        if not feed.is_stale(interval):
+            continue
+        try:
+            feed.poll()
+        except Exception as e:
+            feed.polled_at = time.monotonic()  # 실패해도 다음 주기까지 재시도하지 않음
+            logger.warning(f"{feed.source_name} 뉴스 사이트맵 수집 실패: {e}")
+
+
+_poller: Optional[threading.Thread] = None
+_poller_lock = threading.Lock()
+
+
+def start_polling(feeds: List[NewsSitemapFeed], interval: float = SITEMAP_POLL_INTERVAL) -> None:
+    """백그라운드 스레드에서 주기적으로 사이트맵 수집 (interval 이 0 이하면 시작하지 않음)"""
+    global _poller
+    if interval <= 0 or not feeds:
+        return
+    with _poller_lock:
+        if _poller is not None:
+            return
+
+        def run():
+            # 백그라운드 수집은 사용자 요청보다 뒤에 호스트 토큰을 받음
+            with outbound_priority(PREFETCH):
+                while True:
+                    poll_feeds(feeds, interval)
+                    time.sleep(interval)
+
+        _poller = threading.Thread(target=run, name='news-sitemap', daemon=True)
+        _poller.start()
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import logging
@@ -7,6 +6,9 @@ from datetime import datetime
 import json
 import re
 
+from ..models.article import Article
+from .outbound import throttled_get
+
 logger = logging.getLogger(__name__)
 
 class NYPostScraper:
@@ -25,7 +27,7 @@ class NYPostScraper:
             logger.info(f"NY Post 검색: {query} (최신 뉴스 방식)")
             
             # 간단하게 최신 뉴스를 가져오는 방식 사용
-            response = requests.get(self.base_url, headers=self.headers, timeout=10)
+            response = throttled_get(self.base_url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             articles = self._extract_articles_from_homepage(response.text, limit)
@@ -136,17 +138,16 @@ class NYPostScraper:
                     published_date = self._extract_date(href, title)
                     
                     # 기본 기사 정보 생성
-                    article = {
-                        'title': title,
-                        'url': href,
-                        'summary': '',
-                        'published_date': published_date,
-                        'source': 'NY Post',
-                        'category': self._extract_category_from_url(href),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=href,
+                        summary='',
+                        published_date=published_date,
+                        source='NY Post',
+                        category=self._extract_category_from_url(href),
+                        relevance_score=1,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     
@@ -301,17 +302,16 @@ class NYPostScraper:
                     # 날짜 추출
                     published_date = self._extract_date(url, summary)
                     
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'summary': summary[:300] if summary else '',
-                        'published_date': published_date,
-                        'source': 'NY Post',
-                        'category': self._extract_category_from_url(url),
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url
-                    }
+                    article = Article(
+                        title=title,
+                        url=url,
+                        summary=summary[:300] if summary else '',
+                        published_date=published_date,
+                        source='NY Post',
+                        category=self._extract_category_from_url(url),
+                        relevance_score=1,
+                        image_url=image_url
+                    )
                     
                     articles.append(article)
                     
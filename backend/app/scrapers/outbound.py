@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""호스트별 토큰 버킷 기반 외부 요청 스케줄러
+
+동시 실행, 캐시 갱신, 사전 수집이 늘면서 같은 호스트(bbc.com, scmp.com,
+yomiuri.co.jp 등)에 여러 경로가 한꺼번에 요청을 보내게 된다. 429 나 차단은
+아낀 지연보다 훨씬 비싸므로, 모든 외부 요청은 여기서 호스트별 토큰을 받은
+뒤에 나간다.
+
+- 호스트마다 초당 OUTBOUND_RATE 개, 최대 OUTBOUND_BURST 개까지 모아 둔 토큰 버킷
+- 토큰을 기다리는 요청은 우선순위(INTERACTIVE > PREFETCH > ENRICHMENT), 같은
+  우선순위 안에서는 도착 순서로 처리한다. 사용자 요청은 백그라운드 작업 뒤에
+  줄 서지 않는다.
+- 우선순위별 최대 대기 시간을 넘기면 RateLimited 를 낸다 (보강 요청은 짧게
+  기다리고 포기).
+- 429/503 응답의 Retry-After 동안 그 호스트로는 요청을 보내지 않는다.
+
+우선순위는 throttled_get(priority=...) 로 직접 주거나 outbound_priority() 블록으로
+정한다. 지정하지 않으면 INTERACTIVE.
+
+스크래퍼는 대부분 HTTP 오류를 잡아 빈 결과를 돌려주므로, 호출한 쪽이 "결과 없음"과
+"차단/오류"를 구분할 수 있도록 fetch_report() 블록 안의 요청 성공/실패 수를 센다.
+"""
+import contextlib
+import contextvars
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (작을수록 먼저)
+INTERACTIVE = 0   # 사용자 검색/최신 뉴스 요청
+PREFETCH = 1      # 사이트맵 폴링, 로컬 인덱스 갱신 등 백그라운드 수집
+ENRICHMENT = 2    # 기사 상세 페이지 보강 (이미지/날짜/요약)
+
+# 호스트별 초당 요청 수와 버스트 크기
+OUTBOUND_RATE = float(os.getenv('OUTBOUND_RATE', '2'))
+OUTBOUND_BURST = float(os.getenv('OUTBOUND_BURST', '4'))
+# 호스트별 초당 요청 수 재정의 (예: "bbc.com=4,scmp.com=1")
+OUTBOUND_HOST_RATES = os.getenv('OUTBOUND_HOST_RATES', '')
+
+# 우선순위별 최대 토큰 대기 시간 (초)
+MAX_WAIT = {
+    INTERACTIVE: float(os.getenv('OUTBOUND_MAX_WAIT', '10')),
+    PREFETCH: float(os.getenv('OUTBOUND_PREFETCH_MAX_WAIT', '30')),
+    ENRICHMENT: float(os.getenv('OUTBOUND_ENRICHMENT_MAX_WAIT', '2')),
+}
+
+# Retry-After 가 없거나 읽을 수 없을 때의 호스트 중단 시간 (초)
+DEFAULT_BACKOFF = 30.0
+MAX_BACKOFF = 300.0
+
+_priority: contextvars.ContextVar = contextvars.ContextVar('outbound_priority', default=INTERACTIVE)
+_tickets = itertools.count()
+_report: contextvars.ContextVar = contextvars.ContextVar('outbound_report', default=None)
+
+
+class RateLimited(requests.exceptions.RequestException):
+    """호스트 요청 예산 안에서 최대 대기 시간 내에 토큰을 받지 못함"""
+
+
+def _parse_host_rates(spec: str) -> Dict[str, float]:
+    rates = {}
+    for item in spec.split(','):
+        host, _, rate = item.partition('=')
+        try:
+            rates[host.strip().lower()] = float(rate)
+        except ValueError:
+            if item.strip():
+                logger.warning(f"OUTBOUND_HOST_RATES 항목 무시: {item}")
+    return rates
+
+
+_HOST_RATES = _parse_host_rates(OUTBOUND_HOST_RATES)
+
+
+def host_key(url: str) -> str:
+    """버킷을 나누는 호스트 이름 (www. 제외)"""
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class _HostBucket:
+    """호스트 하나의 토큰 버킷과 우선순위 대기열"""
+
+    def __init__(self, host: str, rate: float, burst: float):
+        self.host = host
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._waiters = []  # (우선순위, 도착 순번) 힙
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def acquire(self, priority: int, max_wait: float) -> bool:
+        """토큰 하나를 받을 때까지 대기 (max_wait 안에 못 받으면 False)"""
+        if self.rate <= 0:
+            return True
+        ticket = (priority, next(_tickets))
+        deadline = time.monotonic() + max_wait
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    first = self._waiters[0] == ticket
+                    if first and now >= self.blocked_until and self.tokens >= 1:
+                        self.tokens -= 1
+                        return True
+                    if now >= deadline:
+                        return False
+                    if first:
+                        wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+                    else:
+                        wait = deadline - now  # 앞 요청이 토큰을 받으면 깨워 줌
+                    self._cond.wait(min(wait, deadline - now))
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def back_off(self, seconds: float) -> None:
+        with self._cond:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+            self.updated = self.blocked_until  # 중단이 끝난 뒤부터 다시 채움
+            self._cond.notify_all()
+
+
+_buckets: Dict[str, _HostBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _bucket(url: str) -> _HostBucket:
+    host = host_key(url)
+    bucket = _buckets.get(host)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(host)
+            if bucket is None:
+                bucket = _buckets[host] = _HostBucket(host, _HOST_RATES.get(host, OUTBOUND_RATE), OUTBOUND_BURST)
+    return bucket
+
+
+class FetchReport:
+    """블록 안에서 나간 외부 요청의 성공/실패 수 (바깥 블록에도 함께 집계)"""
+
+    def __init__(self, parent: Optional['FetchReport'] = None):
+        self.parent = parent
+        self.ok = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def add(self, ok: bool) -> None:
+        report = self
+        while report is not None:
+            with report._lock:
+                if ok:
+                    report.ok += 1
+                else:
+                    report.errors += 1
+            report = report.parent
+
+    @property
+    def failed(self) -> bool:
+        """요청이 있었고 모두 실패 (예외, 4xx/5xx 응답)"""
+        return self.errors > 0 and self.ok == 0
+
+
+@contextlib.contextmanager
+def fetch_report() -> Iterator[FetchReport]:
+    """블록 안(풀 스레드로 전달된 컨텍스트 포함)의 외부 요청 결과 집계"""
+    report = FetchReport(_report.get())
+    token = _report.set(report)
+    try:
+        yield report
+    finally:
+        _report.reset(token)
+
+
+def record_fetch(ok: bool) -> None:
+    """현재 fetch_report 블록에 요청 결과 하나 기록"""
+    report = _report.get()
+    if report is not None:
+        report.add(ok)
+
+
+@contextlib.contextmanager
+def outbound_priority(priority: int) -> Iterator[None]:
+    """블록 안의 외부 요청 기본 우선순위 지정"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def throttle(url: str, priority: Optional[int] = None) -> None:
+    """url 호스트의 토큰을 받을 때까지 대기 (시간 안에 못 받으면 RateLimited)"""
+    priority = _priority.get() if priority is None else priority
+    bucket = _bucket(url)
+    if not bucket.acquire(priority, MAX_WAIT.get(priority, MAX_WAIT[INTERACTIVE])):
+        raise RateLimited(f"{bucket.host} 요청 한도 대기 시간 초과: {url}")
+
+
+def note_response(url: str, response: requests.Response) -> None:
+    """429/503 응답이면 Retry-After 동안 그 호스트 요청 중단"""
+    if response.status_code not in (429, 503):
+        return
+    try:
+        delay = float(response.headers.get('Retry-After', DEFAULT_BACKOFF))
+    except (TypeError, ValueError):
+        delay = DEFAULT_BACKOFF  # HTTP 날짜 형식은 기본값 사용
+    delay = min(max(delay, 1.0), MAX_BACKOFF)
+    bucket = _bucket(url)
+    bucket.back_off(delay)
+    logger.warning(f"{bucket.host} 응답 {response.status_code}, {delay:.0f}초 동안 요청 중단")
+
+
+def throttled_get(url: str, priority: Optional[int] = None, **kwargs) -> requests.Response:
+    """호스트별 요청 예산을 지키는 requests.get"""
+    try:
+        throttle(url, priority)
+        response = requests.get(url, **kwargs)
+    except requests.exceptions.RequestException:
+        record_fetch(False)
+        raise
+    record_fetch(response.status_code < 400)
+    note_response(url, response)
+    return response
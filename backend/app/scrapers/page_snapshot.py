@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""홈페이지·섹션 페이지 스냅샷 저장소
+
+검색 폴백, 트렌딩, 최신 뉴스가 같은 홈페이지/섹션 페이지를 각자 내려받지
+않도록 URL별로 마지막으로 받은 본문과 파싱 결과를 SNAPSHOT_TTL 초 동안
+보관한다. 같은 URL을 동시에 요청하면 한 번만 내려받고 나머지는 그 결과를
+기다린다.
+
+get_streamed 는 본문을 청크 단위로 파서에 넘겨 필요한 만큼만 내려받는다. 파서가
+본문 끝까지 읽었으면 받은 본문으로 전체 스냅샷도 채워 다른 호출(get/get_streamed)이
+다시 내려받지 않게 하고, 일찍 멈췄으면 파싱 결과만 variant 별로 TTL 동안 보관한다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from .conditional_fetch import copy_result
+from .outbound import throttled_get
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TTL = float(os.getenv('SNAPSHOT_TTL', '60'))
+STREAM_CHUNK_SIZE = 16384
+
+# 본문 청크 이터러블 -> 결과 (필요한 만큼 읽으면 반복을 멈춰도 됨)
+ChunkParser = Callable[[Iterable[Union[bytes, str]]], Any]
+
+
+class _Snapshot:
+    __slots__ = ('text', 'fetched_at', 'results', 'streamed', 'lock')
+
+    def __init__(self):
+        self.text: Optional[str] = None
+        self.fetched_at = 0.0
+        self.results: Dict[Hashable, Any] = {}  # variant -> parse 결과
+        self.streamed: Dict[Hashable, Tuple[float, Any]] = {}  # variant -> (시각, 스트리밍 파싱 결과)
+        self.lock = threading.Lock()  # 내려받기/파싱 단일 실행용
+
+
+class PageSnapshotStore:
+    """URL별 짧은 TTL 페이지 스냅샷 (LRU)"""
+
+    def __init__(self, ttl: float = SNAPSHOT_TTL, max_entries: int = 64):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._snapshots: 'OrderedDict[str, _Snapshot]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _snapshot(self, url: str) -> _Snapshot:
+        with self._lock:
+            snapshot = self._snapshots.get(url)
+            if snapshot is None:
+                snapshot = self._snapshots[url] = _Snapshot()
+                while len(self._snapshots) > self.max_entries:
+                    self._snapshots.popitem(last=False)
+            else:
+                self._snapshots.move_to_end(url)
+            return snapshot
+
+    def get(self, url: str, parse: Callable[[str], Any], headers: Optional[Dict[str, str]] = None,
+            timeout: float = 15, variant: Hashable = None, encoding: Optional[str] = None) -> Any:
+        """TTL 안의 스냅샷이 있으면 재사용하고, 없으면 내려받아 parse(본문) 결과 반환
+
+        Args:
+            parse: 본문 텍스트를 받아 결과(기사 목록 등)를 만드는 함수
+            variant: 같은 본문에서 다른 결과를 만드는 호출 구분용 키 (예: 용도, limit)
+            encoding: 응답 인코딩을 직접 지정할 때 (예: 'utf-8')
+
+        HTTP 오류는 requests 예외로 그대로 전달된다.
+        """
+        snapshot = self._snapshot(url)
+        with snapshot.lock:
+            if snapshot.text is None or time.monotonic() - snapshot.fetched_at > self.ttl:
+                response = throttled_get(url, headers=headers, timeout=timeout)
+                response.raise_for_status()
+                if encoding:
+                    response.encoding = encoding
+                snapshot.text = response.text
+                snapshot.fetched_at = time.monotonic()
+                snapshot.results = {}
+            else:
+                logger.debug(f"페이지 스냅샷 재사용: {url}")
+            if variant in snapshot.results:
+                result = snapshot.results[variant]
+            else:
+                result = snapshot.results[variant] = parse(snapshot.text)
+        # 호출한 쪽에서 목록이나 기사를 수정하더라도 스냅샷이 바뀌지 않도록 복사본 반환
+        return copy_result(result)
+
+    def get_streamed(self, url: str, parse_chunks: ChunkParser, headers: Optional[Dict[str, str]] = None,
+                     timeout: float = 15, variant: Hashable = None) -> Any:
+        """스트리밍 파싱 결과 반환 (TTL 안의 전체 본문 스냅샷이 있으면 그 본문을 파싱)
+
+        parse_chunks 가 청크 반복을 일찍 멈추면 남은 본문은 내려받지 않고 연결을 닫는다.
+        """
+        snapshot = self._snapshot(url)
+        with snapshot.lock:
+            now = time.monotonic()
+            if snapshot.text is not None and now - snapshot.fetched_at <= self.ttl:
+                key = ('stream', variant)
+                if key not in snapshot.results:
+                    snapshot.results[key] = parse_chunks([snapshot.text])
+                result = snapshot.results[key]
+            else:
+                cached = snapshot.streamed.get(variant)
+                if cached is not None and now - cached[0] <= self.ttl:
+                    logger.debug(f"스트리밍 파싱 결과 재사용: {url}")
+                    result = cached[1]
+                else:
+                    body = []
+                    complete = False
+
+                    def chunks():
+                        nonlocal complete
+                        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                            body.append(chunk)
+                            yield chunk
+                        complete = True
+
+                    with throttled_get(url, headers=headers, timeout=timeout, stream=True) as response:
+                        response.raise_for_status()
+                        result = parse_chunks(chunks())
+                        if complete:
+                            # 끝까지 읽었으면 전체 본문 스냅샷으로 저장 (response.text 디코딩 규칙 그대로)
+                            response._content = b''.join(body)
+                            snapshot.text = response.text
+                            snapshot.fetched_at = time.monotonic()
+                            snapshot.results = {('stream', variant): result}
+                    if not complete:
+                        snapshot.streamed[variant] = (time.monotonic(), result)
+        return copy_result(result)
+
+
+# 스크래퍼 간 공유 인스턴스
+snapshots = PageSnapshotStore()
+
+
+def get_page(url: str, parse: Callable[[str], Any], headers: Optional[Dict[str, str]] = None,
+             timeout: float = 15, variant: Hashable = None, encoding: Optional[str] = None) -> Any:
+    """공유 스냅샷 저장소에서 페이지 파싱 결과 반환"""
+    return snapshots.get(url, parse, headers=headers, timeout=timeout, variant=variant, encoding=encoding)
+
+
+def get_page_streamed(url: str, parse_chunks: ChunkParser, headers: Optional[Dict[str, str]] = None,
+                      timeout: float = 15, variant: Hashable = None) -> Any:
+    """공유 스냅샷 저장소를 거쳐 스트리밍 파싱 결과 반환"""
+    return snapshots.get_streamed(url, parse_chunks, headers=headers, timeout=timeout, variant=variant)
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""스크래퍼 레지스트리
+
+소스마다 키, 스크래퍼 클래스 위치, 카테고리 매핑, 지원 기능(검색/최신/RSS)을
+선언한다. 표시 이름, 지역, 언어는 core.source_registry 의 메타데이터를 따른다.
+
+스크래퍼 모듈은 bs4, feedparser 등 무거운 의존성을 import 하므로 라우터 로드
+시점에 모두 생성하지 않는다. 소스가 처음 요청될 때 모듈을 import 하고
+인스턴스를 만든 뒤 프로세스 수명 동안 재사용한다.
+
+라우터는 ScraperSpec 의 async 인터페이스(search/latest/trending)와
+gather_sources/fan_out 만 사용하므로, 새 소스는 여기에 등록만 하면 된다.
+
+뉴스 사이트맵 URL 을 선언한 소스는 백그라운드에서 사이트맵을 증분 수집해 두고,
+전체('all') 최신 뉴스에서 스크래퍼 결과가 부족할 때 그 기사로 채운다 (요약과
+이미지가 있는 스크래퍼 카드가 우선).
+
+소스별 시간 예산은 latency 모듈이 최근 응답 지연 분포로 정한다. 연속으로
+실패하는 소스는 circuit_breaker 가 잠시 건너뛰고 최근 성공 결과로 대체한다.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ..core.source_registry import SOURCES
+from ..models.article import Article
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, SourceFailure
+from .latency import REQUEST_DEADLINE, get_tracker
+from .news_sitemap import NewsSitemapFeed, start_polling
+from .outbound import fetch_report
+
+logger = logging.getLogger(__name__)
+
+# 지원 기능
+CAP_SEARCH = "search"
+CAP_LATEST = "latest"
+
+# 동시에 실행하는 스크래퍼 수
+MAX_WORKERS = int(os.getenv('MAX_WORKERS', '4'))
+
+# 블로킹 스크래퍼 호출을 실행하는 공유 스레드 풀 (요청 간 공유)
+# 타임아웃난 호출도 스레드는 끝까지 실행되므로, 풀 크기가 곧 실제 동시 실행(메모리) 상한
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv('SCRAPER_THREADS', str(MAX_WORKERS))),
+    thread_name_prefix='scraper'
+)
+
+_instances: Dict[str, object] = {}
+_lock = threading.Lock()
+
+# _run_source 가 넘겨주는 "스레드에서 실행 시작" 알림 Future (풀 대기 시간을 지연/예산에서 빼기 위함)
+_call_started: contextvars.ContextVar[Optional[asyncio.Future]] = contextvars.ContextVar('_call_started', default=None)
+
+
+def to_articles(items) -> List[Article]:
+    """스크래퍼 결과를 Article 리스트로 통일 (dict 결과 호환)"""
+    return [Article.coerce(item) for item in items] if items else []
+
+
+class ScraperSpec:
+    """소스 하나의 스크래퍼 선언과 통일된 async 인터페이스"""
+
+    __slots__ = ('key', 'module_name', 'class_name', 'category_map', 'capabilities', 'sitemap', 'breaker')
+
+    def __init__(self, key: str, module_name: str, class_name: str,
+                 category_map: Optional[Dict[str, str]] = None,
+                 capabilities: Iterable[str] = (CAP_SEARCH, CAP_LATEST),
+                 sitemap_url: Optional[str] = None):
+        self.key = key
+        self.module_name = module_name
+        self.class_name = class_name
+        self.category_map = category_map or {}
+        self.capabilities: FrozenSet[str] = frozenset(capabilities)
+        self.sitemap: Optional[NewsSitemapFeed] = (
+            NewsSitemapFeed(sitemap_url, SOURCES[key]["name"]) if sitemap_url else None
+        )
+        self.breaker = CircuitBreaker(SOURCES[key]["name"])
+
+    @property
+    def name(self) -> str:
+        return SOURCES[self.key]["name"]
+
+    @property
+    def region(self) -> str:
+        return SOURCES[self.key]["region"]
+
+    @property
+    def language(self) -> str:
+        return SOURCES[self.key]["language"]
+
+    @property
+    def scraper(self):
+        return get_scraper(self.key)
+
+    def supports(self, capability: str) -> bool:
+        return capability in self.capabilities
+
+    def map_category(self, category: str) -> str:
+        """공통 카테고리 이름을 스크래퍼가 쓰는 이름으로 변환"""
+        return self.category_map.get(category, category)
+
+    def search_sync(self, query: str, limit: int) -> List[Article]:
+        return to_articles(self.scraper.search_news(query, limit))
+
+    def latest_sync(self, category: str, limit: int) -> List[Article]:
+        articles = to_articles(self.scraper.get_latest_news(self.map_category(category), limit))
+        if category == 'all' and self.sitemap is not None and len(articles) < limit:
+            # 사이트맵은 백그라운드 수집분만 사용 (요청 경로에서 조회하지 않음)
+            seen_urls = {article.url for article in articles}
+            for article in self.sitemap.latest(limit):
+                if len(articles) >= limit:
+                    break
+                if article.url not in seen_urls:
+                    seen_urls.add(article.url)
+                    articles.append(article)
+        return articles
+
+    def _checked(self, func, *args) -> List[Article]:
+        """블로킹 호출 실행, 빈 결과인데 외부 요청이 모두 실패했으면 SourceFailure"""
+        with fetch_report() as report:
+            articles = func(*args)
+        if not articles and report.failed:
+            raise SourceFailure(f"{self.name} 외부 요청 {report.errors}건 모두 실패")
+        return articles
+
+    async def _guarded(self, key: tuple, func, *args) -> List[Article]:
+        """서킷 브레이커를 거쳐 블로킹 호출 실행
+
+        회로가 열려 있으면 스레드 풀에 작업을 넣지 않고 CircuitOpenError(같은
+        호출의 최근 성공 결과 포함)를 낸다. 성공/실패/타임아웃 기록은 _run_source 가 한다.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.name, self.breaker.retry_in(), self.breaker.fallback(key))
+        articles = await _run_blocking(self._checked, func, *args)
+        self.breaker.remember(key, articles)
+        return articles
+
+    async def search(self, query: str, limit: int) -> List[Article]:
+        """키워드 검색"""
+        return await self._guarded(('search', query, limit), self.search_sync, query, limit)
+
+    async def latest(self, category: str, limit: int) -> List[Article]:
+        """카테고리별 최신 뉴스"""
+        return await self._guarded(('latest', category, limit), self.latest_sync, category, limit)
+
+    async def trending(self, category: str, limit: int) -> List[Article]:
+        """트렌딩 뉴스 (최신 뉴스 미지원 소스는 카테고리 검색으로 대체)"""
+        if self.supports(CAP_LATEST):
+            return await self.latest(category, limit)
+        return await self.search(category, limit)
+
+    def timeout_budget(self) -> float:
+        """최근 지연 분포로 정한 이번 호출의 시간 예산 (초)"""
+        return get_tracker(self.key).budget()
+
+    def __repr__(self) -> str:
+        return f"ScraperSpec({self.key!r})"
+
+
+def _mark_started(started: asyncio.Future, at: float) -> None:
+    if not started.done():
+        started.set_result(at)
+
+
+async def _run_blocking(func, *args):
+    """공유 스레드 풀에서 블로킹 호출 실행 (스레드가 실제로 시작한 시각을 _run_source 에 알림)"""
+    loop = asyncio.get_running_loop()
+    started = _call_started.get()
+    if started is None:
+        return await loop.run_in_executor(_executor, func, *args)
+
+    def run():
+        try:
+            loop.call_soon_threadsafe(_mark_started, started, time.monotonic())
+        except RuntimeError:
+            pass  # 기다리던 이벤트 루프가 이미 닫힘
+        return func(*args)
+    return await loop.run_in_executor(_executor, run)
+
+
+# 등록 순서가 검색/트렌딩 결과의 출처 순서가 된다
+SCRAPERS: Dict[str, ScraperSpec] = {}
+
+
+def register(spec: ScraperSpec) -> ScraperSpec:
+    """스크래퍼 등록 (메타데이터는 core.source_registry 에 있어야 함)"""
+    if spec.key not in SOURCES:
+        raise ValueError(f"소스 메타데이터가 없는 스크래퍼: {spec.key}")
+    SCRAPERS[spec.key] = spec
+    return spec
+
+
+register(ScraperSpec("bbc", "bbc_scraper", "BBCNewsScraper",
+                     category_map={"sports": "sport"},  # BBC는 sport로 통일
+                     capabilities=(CAP_SEARCH, CAP_LATEST)))
+register(ScraperSpec("vnexpress", "vnexpress_scraper", "VNExpressScraper"))
+register(ScraperSpec("bangkokpost", "bangkokpost_scraper", "BangkokPostScraper"))
+register(ScraperSpec("asahi", "asahi_scraper", "AsahiScraper"))
+register(ScraperSpec("yomiuri", "yomiuri_scraper", "YomiuriScraper"))
+register(ScraperSpec("thesun", "thesun_scraper", "TheSunScraper",
+                     sitemap_url="https://www.thesun.co.uk/news-sitemap.xml"))
+register(ScraperSpec("nypost", "hybrid_nypost_scraper", "HybridNYPostScraper",
+                     sitemap_url="https://nypost.com/news-sitemap.xml"))
+register(ScraperSpec("dailymail", "hybrid_dailymail_scraper", "HybridDailyMailScraper",
+                     sitemap_url="https://www.dailymail.co.uk/google-news-sitemap.xml"))
+register(ScraperSpec("scmp", "scmp_scraper", "SCMPScraper",
+                     sitemap_url="https://www.scmp.com/sitemap_news.xml"))
+register(ScraperSpec("thethaiger", "thethaiger_scraper", "TheThaigerScraper",
+                     sitemap_url="https://thethaiger.com/news-sitemap.xml"))
+
+
+def get_scraper(key: str):
+    """소스 키에 해당하는 스크래퍼 인스턴스 (첫 호출 시 생성)"""
+    scraper = _instances.get(key)
+    if scraper is None:
+        with _lock:
+            scraper = _instances.get(key)
+            if scraper is None:
+                spec = SCRAPERS[key]
+                module = importlib.import_module(f".{spec.module_name}", __package__)
+                scraper = getattr(module, spec.class_name)()
+                _instances[key] = scraper
+    return scraper
+
+
+def start_sitemap_ingestion() -> None:
+    """뉴스 사이트맵을 선언한 소스들의 백그라운드 증분 수집 시작"""
+    start_polling([spec.sitemap for spec in SCRAPERS.values() if spec.sitemap is not None])
+
+
+def select_scrapers(keys: Iterable[str], capability: Optional[str] = None) -> List[ScraperSpec]:
+    """소스 키 목록을 등록 순서의 스크래퍼 선언 목록으로 변환"""
+    keys = set(keys)
+    return [spec for key, spec in SCRAPERS.items()
+            if key in keys and (capability is None or spec.supports(capability))]
+
+
+class SourceTimeout(asyncio.TimeoutError):
+    """소스 호출이 시간 예산을 넘김 (budget: 적용된 예산 초, 0이면 전체 마감 시간 초과)"""
+
+    def __init__(self, budget: float):
+        super().__init__(f"{budget:.1f}초" if budget > 0 else "전체 마감 시간 초과")
+        self.budget = budget
+
+
+# (스크래퍼, 기사 목록, 오류) - 오류는 None, SourceTimeout 또는 예외
+SourceResult = Tuple[ScraperSpec, List[Article], Optional[BaseException]]
+
+
+def _release_when_done(task: asyncio.Future, semaphore: asyncio.Semaphore) -> None:
+    """호출이 실제로 끝나면(스레드 종료) 동시 실행 슬롯 반환"""
+    def done(finished: asyncio.Future) -> None:
+        if not finished.cancelled():
+            finished.exception()  # 늦게 끝난 호출의 예외는 결과로 쓰지 않음
+        semaphore.release()
+    task.add_done_callback(done)
+
+
+async def _run_source(spec: ScraperSpec, call: Callable[[ScraperSpec], Awaitable[List[Article]]],
+                      timeout: Optional[float], semaphore: asyncio.Semaphore, deadline: float) -> SourceResult:
+    loop = asyncio.get_running_loop()
+    try:
+        # 슬롯은 앞 호출의 스레드가 끝나야 비므로 전체 마감 시간까지만 기다림
+        await asyncio.wait_for(semaphore.acquire(), max(0.0, deadline - loop.time()))
+    except asyncio.TimeoutError:
+        return spec, [], SourceTimeout(0.0)
+    task = None
+    try:
+        budget = spec.timeout_budget() if timeout is None else timeout
+        tracker = get_tracker(spec.key)
+        # 공유 스레드 풀이 다른 요청/타임아웃난 호출로 차 있으면 큐에서 기다릴 수 있음.
+        # 풀 대기는 소스 지연이 아니므로 스레드가 실행을 시작한 뒤부터 예산과 지연을 잼
+        # (_run_blocking 을 거치지 않는 호출은 전체 마감 시간으로만 묶임)
+        started = loop.create_future()
+        token = _call_started.set(started)
+        try:
+            # wait_for 처럼 취소하지 않음: 취소해도 스레드는 계속 돌므로 끝날 때까지 슬롯을 잡아 둠
+            task = asyncio.ensure_future(call(spec))
+        finally:
+            _call_started.reset(token)
+        await asyncio.wait({task, started}, timeout=max(0.0, deadline - loop.time()),
+                           return_when=asyncio.FIRST_COMPLETED)
+        if not task.done() and not started.done():
+            # 전체 마감 시간까지 스레드를 받지 못함 (소스 탓이 아니므로 기록하지 않음)
+            return spec, [], SourceTimeout(0.0)
+        start = started.result() if started.done() else time.monotonic()
+        # 앞 소스를 기다리느라 늦게 시작한 소스는 전체 마감 시간까지만 기다림
+        remaining = min(start + budget - time.monotonic(), deadline - loop.time())
+        done, _ = await asyncio.wait({task}, timeout=max(0.0, remaining))
+        if not done:
+            if time.monotonic() - start >= budget:
+                tracker.record_timeout()
+                spec.breaker.record_failure()
+                return spec, [], SourceTimeout(budget)
+            # 자기 예산 전에 전체 마감 시간에 걸림
+            return spec, [], SourceTimeout(0.0)
+        try:
+            articles = task.result()
+        except CircuitOpenError as e:
+            if e.cached is not None:
+                logger.debug(f"{spec.name} 회로 열림, 최근 결과 {len(e.cached)}개로 대체")
+                return spec, e.cached, None
+            logger.info(f"{spec.name} 건너뜀: {e}")
+            return spec, [], e
+        except Exception as e:
+            spec.breaker.record_failure()
+            logger.error(f"{spec.name} 스크래퍼 실패: {e}")
+            return spec, [], e
+        spec.breaker.record_success()
+        tracker.record(time.monotonic() - start)
+        return spec, articles, None
+    finally:
+        if task is None or task.done():
+            semaphore.release()
+        else:
+            _release_when_done(task, semaphore)
+
+
+async def gather_sources(specs: List[ScraperSpec], call: Callable[[ScraperSpec], Awaitable[List[Article]]],
+                         timeout: Optional[float] = None, max_concurrency: int = MAX_WORKERS,
+                         deadline: float = REQUEST_DEADLINE) -> List[SourceResult]:
+    """모든 소스에 call 을 병렬 실행하고 specs 순서대로 결과 반환
+
+    timeout 을 생략하면 소스마다 최근 지연 분포로 정한 예산을 쓴다. 전체 호출은
+    deadline 초 안에 끝나며, 그때까지 끝나지 않은 소스는 SourceTimeout 이 된다.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    until = asyncio.get_running_loop().time() + deadline
+    return list(await asyncio.gather(*(_run_source(spec, call, timeout, semaphore, until) for spec in specs)))
+
+
+async def fan_out(specs: List[ScraperSpec], call: Callable[[ScraperSpec], Awaitable[List[Article]]],
+                  timeout: Optional[float] = None, max_concurrency: int = MAX_WORKERS,
+                  deadline: float = REQUEST_DEADLINE) -> AsyncIterator[SourceResult]:
+    """모든 소스에 call 을 병렬 실행하고 완료되는 순서대로 결과 전달 (스트리밍용, 전체 deadline 초)"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    until = asyncio.get_running_loop().time() + deadline
+    tasks = [asyncio.ensure_future(_run_source(spec, call, timeout, semaphore, until)) for spec in specs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트 연결 종료 등으로 중단되면 남은 작업 취소
+        for task in tasks:
+            task.cancel()
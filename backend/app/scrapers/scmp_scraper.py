@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime
 import json
 import re
+from itertools import chain, islice
+
+from ..models.article import Article
+from .endpoint_strategy import get_selector
+from .hedged_fetch import run_concurrently
+from .page_snapshot import get_page, get_page_streamed
+from .stream_html import iter_links
+from .outbound import ENRICHMENT, throttled_get
 
 logger = logging.getLogger(__name__)
 
@@ -27,51 +34,54 @@ class SCMPScraper:
             logger.info(f"SCMP 검색: {query}")
             
             # SCMP 실제 검색 API 사용 - 다양한 URL 패턴 시도
-            search_urls = [
-                f"https://www.scmp.com/rss/2/feed",  # RSS 피드
-                f"https://www.scmp.com/search?q={quote(query)}",  # 수정된 파라미터
-                f"https://www.scmp.com/news",  # 뉴스 섹션
-                f"https://www.scmp.com/topics/{quote(query)}"  # 토픽 검색
-            ]
+            search_urls = {
+                'rss': f"https://www.scmp.com/rss/2/feed",  # RSS 피드
+                'search': f"https://www.scmp.com/search?q={quote(query)}",  # 수정된 파라미터
+                'news': f"https://www.scmp.com/news",  # 뉴스 섹션
+                'topics': f"https://www.scmp.com/topics/{quote(query)}"  # 토픽 검색
+            }
+            
+            def fetch_relevant(search_url):
+                logger.info(f"시도 중: {search_url}")
+                response = throttled_get(search_url, headers=self.headers, timeout=10)
+                response.raise_for_status()
+                extracted_articles = self._extract_search_results(response.text, limit, query)
+                # 쿼리와 관련성이 높은 기사들만 필터링
+                return self._filter_relevant_articles(extracted_articles, query) if extracted_articles else []
             
+            selector = get_selector('scmp', 'search')
+            keys = selector.ranked(list(search_urls))
+            
+            # 쿼리 관련 URL 동시 요청 (계속 실패하는 URL은 프로브 전까지 건너뜀)
+            results = run_concurrently(
+                [lambda key=key: selector.call(key, lambda: fetch_relevant(search_urls[key])) for key in keys],
+                timeout=15, label="SCMP"
+            )
+            
+            # 효용 순서대로 병합, URL 기준 중복 제거
             articles = []
+            seen_urls = set()
+            for result in results:
+                for article in result:
+                    if article['url'] not in seen_urls:
+                        seen_urls.add(article['url'])
+                        articles.append(article)
             
-            for search_url in search_urls:
-                try:
-                    logger.info(f"시도 중: {search_url}")
-                    response = requests.get(search_url, headers=self.headers, timeout=10)
-                    response.raise_for_status()
-                    
-                    extracted_articles = self._extract_search_results(response.text, limit, query)
-                    
-                    if extracted_articles:
-                        # 쿼리와 관련성이 높은 기사들만 필터링
-                        relevant_articles = self._filter_relevant_articles(extracted_articles, query)
-                        articles.extend(relevant_articles)
-                        
-                        if len(articles) >= limit:
-                            articles = articles[:limit]
-                            break
-                            
-                except Exception as e:
-                    logger.debug(f"검색 URL 시도 실패: {search_url} - {e}")
-                    continue
+            if articles:
+                logger.info("SCMP 검색 결과 {}개 사용".format(min(len(articles), limit)))
+                return articles[:limit]
             
-            # 검색 결과보다 홈페이지를 우선 사용 (이미지가 더 잘 추출됨)
-            logger.info("SCMP 홈페이지 직접 사용하여 이미지 포함 기사 추출")
-            response = requests.get(self.base_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            homepage_articles = self._extract_articles_from_homepage(response.text, limit)
+            # 검색 결과가 없을 때만 홈페이지 스냅샷 사용 (이미지 포함 기사)
+            logger.info("SCMP 검색 결과 없음, 홈페이지 기사로 대체")
+            homepage_articles = get_page(self.base_url, lambda html: self._extract_articles_from_homepage(html, limit),
+                                         headers=self.headers, timeout=10, variant=('homepage', limit, 'all'))
             
             if homepage_articles:
                 logger.info("SCMP 홈페이지에서 {}개 기사 추출 (이미지 포함)".format(len(homepage_articles)))
                 return homepage_articles
-            elif articles:
-                logger.info("SCMP 홈페이지 실패, 검색 결과 {}개 사용".format(len(articles)))
-                return articles
-            else:
-                logger.warning("SCMP 모든 방법 실패")
-                return []
+            
+            logger.warning("SCMP 모든 방법 실패")
+            return []
             
         except Exception as e:
             logger.error(f"SCMP 접근 실패: {e}")
@@ -119,195 +129,9 @@ class SCMPScraper:
             
             for link in article_links:
                 try:
-                    href = link.get('href', '')
-                    title = link.get_text(strip=True)
-                    
-                    # 제목 추출 로직 개선 - 빈 제목이나 JSON 스키마 처리
-                    original_title = title
-                    title_found = False
-                    
-                    # 방법 1: 기존 제목이 유효한지 확인
-                    if title and len(title) > 10 and len(title) < 200 and not title.startswith('{') and '"@context"' not in title:
-                        title_found = True
-                    
-                    # 방법 2: 제목이 없거나 유효하지 않으면 부모 요소에서 찾기
-                    if not title_found:
-                        parent = link.find_parent()
-                        if parent:
-                            title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.headline', '[class*="title"]']
-                            for selector in title_selectors:
-                                title_elem = parent.find(selector)
-                                if title_elem and title_elem != link:  # 자기 자신은 제외
-                                    new_title = title_elem.get_text(strip=True)
-                                    if new_title and len(new_title) > 10 and len(new_title) < 200 and not new_title.startswith('{'):
-                                        title = new_title
-                                        title_found = True
-                                        break
-                    
-                    # 방법 3: 형제 요소에서 찾기
-                    if not title_found:
-                        for sibling in [link.find_previous_sibling(), link.find_next_sibling()]:
-                            if sibling and hasattr(sibling, 'get_text'):
-                                sibling_text = sibling.get_text(strip=True)
-                                if sibling_text and len(sibling_text) > 10 and len(sibling_text) < 200 and not sibling_text.startswith('{'):
-                                    title = sibling_text
-                                    title_found = True
-                                    break
-                    
-                    # 방법 4: URL에서 제목 추출 (개선된 방법)
-                    if not title_found and href:
-                        url_parts = href.split('/')
-                        # SCMP URL 구조: /category/subcategory/article/ID/title-slug
-                        for part in reversed(url_parts):
-                            clean_part = part.split('?')[0]  # 쿼리 파라미터 제거
-                            if (len(clean_part) > 15 and '-' in clean_part and 
-                                not clean_part.startswith('article') and 
-                                not clean_part.isdigit() and  # 숫자 ID 제외
-                                not clean_part in ['news', 'economy', 'china', 'world', 'lifestyle', 'sport']):  # 카테고리 제외
-                                
-                                potential_title = clean_part.replace('-', ' ')
-                                # 첫 글자만 대문자로, 나머지는 자연스럽게
-                                words = potential_title.split()
-                                if len(words) > 3:  # 최소 4단어 이상
-                                    formatted_words = []
-                                    for i, word in enumerate(words):
-                                        if i == 0:  # 첫 번째 단어는 대문자
-                                            formatted_words.append(word.capitalize())
-                                        elif word.lower() in ['and', 'or', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'as', 'is']:
-                                            formatted_words.append(word.lower())
-                                        elif word.lower() in ['us', 'uk', 'eu', 'china', 'covid', 'ai']:  # 약어나 고유명사
-                                            formatted_words.append(word.upper())
-                                        else:
-                                            formatted_words.append(word.lower())
-                                    
-                                    title = ' '.join(formatted_words)
-                                    # 첫 글자를 대문자로
-                                    title = title[0].upper() + title[1:] if title else title
-                                    title_found = True
-                                    break
-                    
-                    # 방법 5: 이미지 alt 텍스트 사용 (마지막 수단으로 사용)
-                    if not title_found:
-                        img_elem = link.find('img')
-                        if img_elem:
-                            alt_text = img_elem.get('alt', '')
-                            # alt 텍스트가 실제 기사 제목인지 확인 (illustration, photo 등은 제외)
-                            if (alt_text and len(alt_text) > 15 and len(alt_text) < 150 and 
-                                not alt_text.lower().startswith(('illustration', 'photo', 'image', 'handout')) and
-                                not alt_text.startswith('{') and
-                                not any(word in alt_text.lower() for word in ['photo:', 'image:', 'getty', 'reuters', 'afp', 'drawing', 'shows'])):
-                                title = alt_text[:100] + '...' if len(alt_text) > 100 else alt_text
-                                title_found = True
-                    
-                    # URL 검증 및 정규화
-                    if not href:
-                        continue
-                    
-                    # 마지막 수단: 여전히 제목을 찾지 못했다면 기본값 사용 (이미지가 있는 경우만)
-                    if not title_found or not title or len(title) < 5:
-                        img_elem = link.find('img')
-                        if img_elem:
-                            # 이미지가 있으면 URL에서 최대한 추출 시도 (더 관대하게)
-                            if href:
-                                url_parts = href.split('/')
-                                for part in reversed(url_parts):
-                                    if len(part) > 10 and '-' in part and not part.startswith('article'):
-                                        clean_part = part.split('?')[0]
-                                        if len(clean_part) > 10:
-                                            title = clean_part.replace('-', ' ').title()
-                                            title_found = True
-                                            break
-                            
-                            # 정말 마지막 수단
-                            if not title_found:
-                                title = "SCMP News Article"
-                        else:
-                            continue
-                    
-                    # 최종 길이 체크
-                    if len(title) < 3:
-                        continue
-                    
-                    if href.startswith('/'):
-                        href = self.base_url + href
-                    elif not href.startswith('http'):
-                        continue
-                    
-                    if 'scmp.com' not in href:
-                        continue
-                    
-                    # 중복 제거
-                    if href in found_urls:
+                    article = self._article_from_homepage_link(link, requested_category, found_urls)
+                    if article is None:
                         continue
-                    found_urls.add(href)
-                    
-                    # SCMP 이미지 추출 개선
-                    image_url = self._extract_scmp_image(link, href)
-                    
-                    # 이미지 URL 정규화
-                    if image_url:
-                        if image_url.startswith('//'):
-                            image_url = 'https:' + image_url
-                        elif image_url.startswith('/'):
-                            image_url = self.base_url + image_url
-                        elif not image_url.startswith('http'):
-                            image_url = self.base_url + '/' + image_url
-                    
-                    # SCMP 날짜 추출 개선
-                    published_date = self._extract_scmp_date(link, href)
-                    
-                    # 요약 생성 (제목 기반)
-                    summary = title[:100] + "..." if len(title) > 100 else title
-                    
-                    # 유니코드 문제 해결을 위한 인코딩 처리
-                    try:
-                        # 제목과 요약에서 문제가 있는 문자 정리
-                        title = title.encode('utf-8', 'ignore').decode('utf-8')
-                        summary = summary.encode('utf-8', 'ignore').decode('utf-8')
-                    except:
-                        # 인코딩 실패시 ASCII 안전 버전 사용
-                        title = ''.join(c for c in title if ord(c) < 128)
-                        summary = ''.join(c for c in summary if ord(c) < 128)
-                    
-                    # 기본 기사 정보 생성
-                    # 카테고리 추출
-                    article_category = self._extract_category_from_url(href)
-                    
-                    # 특정 카테고리가 요청된 경우 필터링
-                    if (requested_category and requested_category != 'all' and 
-                        requested_category != 'news' and article_category != requested_category):
-                        # 특별 케이스들
-                        skip_article = True
-                        if requested_category == 'entertainment' and article_category == 'culture':
-                            skip_article = False
-                        elif requested_category == 'politics' and article_category == 'news':
-                            # politics 요청 시 china/news도 허용 (URL 확인)
-                            if '/china/' in href.lower() or 'politics' in href.lower() or 'government' in href.lower():
-                                skip_article = False
-                        
-                        if skip_article:
-                            continue
-                    
-                    # 특별 케이스 카테고리 재할당
-                    final_category = article_category
-                    if requested_category == 'entertainment' and article_category == 'culture':
-                        final_category = 'entertainment'
-                    elif requested_category == 'politics' and article_category == 'news':
-                        if '/china/' in href.lower() or 'politics' in href.lower() or 'government' in href.lower():
-                            final_category = 'politics'
-                    
-                    article = {
-                        'title': title,
-                        'url': href,
-                        'summary': summary,
-                        'published_date': published_date,
-                        'source': 'SCMP',
-                        'category': final_category,
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 1,
-                        'image_url': image_url or self._get_fallback_image(final_category)
-                    }
-                    
                     articles.append(article)
                     
                     if len(articles) >= limit:
@@ -322,6 +146,219 @@ class SCMPScraper:
         
         return articles[:limit]
     
+    def _stream_articles_from_homepage(self, chunks, limit: int, requested_category: str = 'all') -> List[Dict]:
+        """홈페이지/섹션 본문 청크를 증분 파싱하며 기사 추출 (limit 개를 채우면 내려받기 중단)"""
+        articles = []
+        found_urls = set()
+        
+        try:
+            for link in iter_links(chunks, lambda href: '/news/' in href or '/article/' in href):
+                try:
+                    article = self._article_from_homepage_link(link, requested_category, found_urls)
+                except Exception as e:
+                    logger.debug(f"SCMP 홈페이지 링크 파싱 실패: {e}")
+                    continue
+                if article is not None:
+                    articles.append(article)
+                    if len(articles) >= limit:
+                        break
+        except Exception as e:
+            logger.error(f"SCMP 홈페이지 스트리밍 파싱 실패: {e}")
+        
+        return articles
+    
+    def _article_from_homepage_link(self, link, requested_category: str, found_urls: set) -> Optional[Article]:
+        """홈페이지 기사 링크 하나를 Article 로 변환 (유효하지 않거나 중복이면 None)"""
+        href = link.get('href', '')
+        title = link.get_text(strip=True)
+        
+        # 제목 추출 로직 개선 - 빈 제목이나 JSON 스키마 처리
+        original_title = title
+        title_found = False
+        
+        # 방법 1: 기존 제목이 유효한지 확인
+        if title and len(title) > 10 and len(title) < 200 and not title.startswith('{') and '"@context"' not in title:
+            title_found = True
+        
+        # 방법 2: 제목이 없거나 유효하지 않으면 부모 요소에서 찾기
+        if not title_found:
+            parent = link.find_parent()
+            if parent:
+                title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.headline', '[class*="title"]']
+                for selector in title_selectors:
+                    title_elem = parent.find(selector)
+                    if title_elem and title_elem != link:  # 자기 자신은 제외
+                        new_title = title_elem.get_text(strip=True)
+                        if new_title and len(new_title) > 10 and len(new_title) < 200 and not new_title.startswith('{'):
+                            title = new_title
+                            title_found = True
+                            break
+        
+        # 방법 3: 형제 요소에서 찾기
+        if not title_found:
+            for sibling in [link.find_previous_sibling(), link.find_next_sibling()]:
+                if sibling and hasattr(sibling, 'get_text'):
+                    sibling_text = sibling.get_text(strip=True)
+                    if sibling_text and len(sibling_text) > 10 and len(sibling_text) < 200 and not sibling_text.startswith('{'):
+                        title = sibling_text
+                        title_found = True
+                        break
+        
+        # 방법 4: URL에서 제목 추출 (개선된 방법)
+        if not title_found and href:
+            url_parts = href.split('/')
+            # SCMP URL 구조: /category/subcategory/article/ID/title-slug
+            for part in reversed(url_parts):
+                clean_part = part.split('?')[0]  # 쿼리 파라미터 제거
+                if (len(clean_part) > 15 and '-' in clean_part and 
+                    not clean_part.startswith('article') and 
+                    not clean_part.isdigit() and  # 숫자 ID 제외
+                    not clean_part in ['news', 'economy', 'china', 'world', 'lifestyle', 'sport']):  # 카테고리 제외
+        
+                    potential_title = clean_part.replace('-', ' ')
+                    # 첫 글자만 대문자로, 나머지는 자연스럽게
+                    words = potential_title.split()
+                    if len(words) > 3:  # 최소 4단어 이상
+                        formatted_words = []
+                        for i, word in enumerate(words):
+                            if i == 0:  # 첫 번째 단어는 대문자
+                                formatted_words.append(word.capitalize())
+                            elif word.lower() in ['and', 'or', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'as', 'is']:
+                                formatted_words.append(word.lower())
+                            elif word.lower() in ['us', 'uk', 'eu', 'china', 'covid', 'ai']:  # 약어나 고유명사
+                                formatted_words.append(word.upper())
+                            else:
+                                formatted_words.append(word.lower())
+        
+                        title = ' '.join(formatted_words)
+                        # 첫 글자를 대문자로
+                        title = title[0].upper() + title[1:] if title else title
+                        title_found = True
+                        break
+        
+        # 방법 5: 이미지 alt 텍스트 사용 (마지막 수단으로 사용)
+        if not title_found:
+            img_elem = link.find('img')
+            if img_elem:
+                alt_text = img_elem.get('alt', '')
+                # alt 텍스트가 실제 기사 제목인지 확인 (illustration, photo 등은 제외)
+                if (alt_text and len(alt_text) > 15 and len(alt_text) < 150 and 
+                    not alt_text.lower().startswith(('illustration', 'photo', 'image', 'handout')) and
+                    not alt_text.startswith('{') and
+                    not any(word in alt_text.lower() for word in ['photo:', 'image:', 'getty', 'reuters', 'afp', 'drawing', 'shows'])):
+                    title = alt_text[:100] + '...' if len(alt_text) > 100 else alt_text
+                    title_found = True
+        
+        # URL 검증 및 정규화
+        if not href:
+            return None
+        
+        # 마지막 수단: 여전히 제목을 찾지 못했다면 기본값 사용 (이미지가 있는 경우만)
+        if not title_found or not title or len(title) < 5:
+            img_elem = link.find('img')
+            if img_elem:
+                # 이미지가 있으면 URL에서 최대한 추출 시도 (더 관대하게)
+                if href:
+                    url_parts = href.split('/')
+                    for part in reversed(url_parts):
+                        if len(part) > 10 and '-' in part and not part.startswith('article'):
+                            clean_part = part.split('?')[0]
+                            if len(clean_part) > 10:
+                                title = clean_part.replace('-', ' ').title()
+                                title_found = True
+                                break
+        
+                # 정말 마지막 수단
+                if not title_found:
+                    title = "SCMP News Article"
+            else:
+                return None
+        
+        # 최종 길이 체크
+        if len(title) < 3:
+            return None
+        
+        if href.startswith('/'):
+            href = self.base_url + href
+        elif not href.startswith('http'):
+            return None
+        
+        if 'scmp.com' not in href:
+            return None
+        
+        # 중복 제거
+        if href in found_urls:
+            return None
+        found_urls.add(href)
+        
+        # SCMP 이미지 추출 개선
+        image_url = self._extract_scmp_image(link, href)
+        
+        # 이미지 URL 정규화
+        if image_url:
+            if image_url.startswith('//'):
+                image_url = 'https:' + image_url
+            elif image_url.startswith('/'):
+                image_url = self.base_url + image_url
+            elif not image_url.startswith('http'):
+                image_url = self.base_url + '/' + image_url
+        
+        # SCMP 날짜 추출 개선
+        published_date = self._extract_scmp_date(link, href)
+        
+        # 요약 생성 (제목 기반)
+        summary = title[:100] + "..." if len(title) > 100 else title
+        
+        # 유니코드 문제 해결을 위한 인코딩 처리
+        try:
+            # 제목과 요약에서 문제가 있는 문자 정리
+            title = title.encode('utf-8', 'ignore').decode('utf-8')
+            summary = summary.encode('utf-8', 'ignore').decode('utf-8')
+        except:
+            # 인코딩 실패시 ASCII 안전 버전 사용
+            title = ''.join(c for c in title if ord(c) < 128)
+            summary = ''.join(c for c in summary if ord(c) < 128)
+        
+        # 기본 기사 정보 생성
+        # 카테고리 추출
+        article_category = self._extract_category_from_url(href)
+        
+        # 특정 카테고리가 요청된 경우 필터링
+        if (requested_category and requested_category != 'all' and 
+            requested_category != 'news' and article_category != requested_category):
+            # 특별 케이스들
+            skip_article = True
+            if requested_category == 'entertainment' and article_category == 'culture':
+                skip_article = False
+            elif requested_category == 'politics' and article_category == 'news':
+                # politics 요청 시 china/news도 허용 (URL 확인)
+                if '/china/' in href.lower() or 'politics' in href.lower() or 'government' in href.lower():
+                    skip_article = False
+        
+            if skip_article:
+                return None
+        
+        # 특별 케이스 카테고리 재할당
+        final_category = article_category
+        if requested_category == 'entertainment' and article_category == 'culture':
+            final_category = 'entertainment'
+        elif requested_category == 'politics' and article_category == 'news':
+            if '/china/' in href.lower() or 'politics' in href.lower() or 'government' in href.lower():
+                final_category = 'politics'
+        
+        article = Article(
+            title=title,
+            url=href,
+            summary=summary,
+            published_date=published_date,
+            source='SCMP',
+            category=final_category,
+            relevance_score=1,
+            image_url=image_url or self._get_fallback_image(final_category)
+        )
+        
+        return article
+    
     def _filter_relevant_articles(self, articles: List[Dict], query: str) -> List[Dict]:
         """검색어와 관련성이 높은 기사들만 필터링"""
         if not query or not articles:
@@ -466,7 +503,7 @@ class SCMPScraper:
     def _extract_image_from_article_page(self, article_url: str) -> str:
         """실제 기사 페이지에서 메인 이미지 추출"""
         try:
-            response = requests.get(article_url, headers=self.headers, timeout=5)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=5)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -632,7 +669,7 @@ class SCMPScraper:
     def _extract_date_from_article_page(self, article_url: str) -> str:
         """실제 기사 페이지에서 날짜 추출"""
         try:
-            response = requests.get(article_url, headers=self.headers, timeout=5)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=5)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -725,230 +762,201 @@ class SCMPScraper:
         return has_extension or has_keyword
     
     def _extract_search_results(self, html_content: str, limit: int, query: str = '') -> List[Dict]:
-        """HTML에서 검색 결과 추출 (개선됨 - 이미지 우선)"""
-        articles = []
+        """HTML에서 검색 결과 추출 (개선됨 - 이미지 우선)
         
+        후보 링크 → 저비용 검증 → 중복 제거 → 이미지/날짜 보강 순서의 지연 파이프라인.
+        limit 개가 채워지면 나머지 후보는 검증하거나 보강하지 않는다.
+        """
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
             
             logger.info("SCMP 검색 결과 HTML 크기: {} 문자".format(len(html_content)))
             
-            # 먼저 이미지가 있는 링크들을 우선적으로 찾기 (홈페이지와 동일한 로직)
-            image_links = []
-            for img_elem in soup.find_all('img'):
-                parent_link = img_elem.find_parent('a')
-                if parent_link:
-                    href = parent_link.get('href', '')
-                    if '/news/' in href or '/article/' in href or '/business/' in href or '/tech/' in href or '/sport/' in href:
-                        image_links.append(parent_link)
-            
-            logger.info("SCMP 검색 페이지에서 이미지가 있는 링크: {}개".format(len(image_links)))
+            # 이미지가 있는 링크 우선 (홈페이지와 동일한 로직), 부족하면 일반 검색 결과 패턴
+            candidates = chain(self._image_link_candidates(soup), self._selector_candidates(soup))
+            unique_candidates = self._dedupe_candidates(candidates)
+            articles = (self._enrich_search_candidate(candidate) for candidate in unique_candidates)
+            return list(islice((article for article in articles if article is not None), limit))
             
-            # 이미지 링크들을 우선 처리
-            found_items = set()
-            for link in image_links:
-                try:
-                    article = self._process_search_link(link, found_items, query)
-                    if article:
-                        articles.append(article)
-                        if len(articles) >= limit:
+        except Exception as e:
+            logger.error(f"SCMP HTML 파싱 실패: {e}")
+            return []
+    
+    def _image_link_candidates(self, soup):
+        """이미지를 감싼 기사 링크 후보 (링크, 제목, URL, 요약, 이미지)"""
+        for img_elem in soup.find_all('img'):
+            link = img_elem.find_parent('a')
+            if not link:
+                continue
+            href = link.get('href', '')
+            if not ('/news/' in href or '/article/' in href or '/business/' in href or '/tech/' in href or '/sport/' in href):
+                continue
+            try:
+                candidate = self._search_link_candidate(link)
+            except Exception as e:
+                logger.debug("SCMP 이미지 링크 처리 실패: {}".format(e))
+                continue
+            if candidate:
+                yield candidate
+    
+    def _search_link_candidate(self, link):
+        """검색 결과 링크의 제목/URL 정리와 저비용 검증 (이미지·날짜는 보강 단계에서)"""
+        href = link.get('href', '')
+        title = link.get_text(strip=True)
+        
+        # 제목 정리 - JSON 스키마나 잘못된 데이터 제거
+        if title and (title.startswith('{') or '"@context"' in title or '"@type"' in title):
+            parent = link.find_parent()
+            if parent:
+                title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.headline', '[class*="title"]']
+                for selector in title_selectors:
+                    title_elem = parent.find(selector)
+                    if title_elem:
+                        new_title = title_elem.get_text(strip=True)
+                        if new_title and not new_title.startswith('{') and len(new_title) > 10 and len(new_title) < 200:
+                            title = new_title
                             break
+        
+        # 기본 검증
+        if not title or not href or len(title) < 10:
+            return None
+        
+        # JSON 스키마나 잘못된 제목 필터링
+        if title.startswith('{') or '"@context"' in title or '"@type"' in title:
+            return None
+        
+        # URL 정규화
+        if href.startswith('/'):
+            href = self.base_url + href
+        elif not href.startswith('http'):
+            return None
+        
+        # SCMP URL인지 확인
+        if 'scmp.com' not in href:
+            return None
+        
+        return link, title, href, '', ''
+    
+    def _selector_candidates(self, soup):
+        """일반 검색 결과 패턴 후보 (이미지 링크만으로 부족할 때만 소비됨)"""
+        logger.info("SCMP 이미지 링크만으로 부족, 일반 선택자 추가 시도")
+        
+        selectors = [
+            '.search-result',
+            '.article-item',
+            '.story-item',
+            'article',
+            '.item',
+            '[class*="search"]',
+            '[class*="article"]',
+            '[class*="story"]',
+            'a[href*="/news/"]',
+            'a[href*="/business/"]',
+            'a[href*="/tech/"]',
+            'a[href*="/sport/"]'
+        ]
+        
+        for selector in selectors:
+            for element in soup.select(selector):
+                try:
+                    candidate = self._search_element_candidate(element)
                 except Exception as e:
-                    logger.debug("SCMP 이미지 링크 처리 실패: {}".format(e))
+                    logger.debug(f"SCMP 요소 파싱 실패: {e}")
                     continue
-            
-            # 아직 부족하면 일반 검색 결과 패턴도 시도
-            if len(articles) < limit:
-                logger.info("SCMP 이미지 링크만으로 부족, 일반 선택자 추가 시도")
+                if candidate:
+                    yield candidate
+    
+    def _search_element_candidate(self, element):
+        """검색 결과 요소에서 제목/URL/요약/이미지 추출과 저비용 검증"""
+        title = ''
+        url = ''
+        summary = ''
+        image_url = ''
+        
+        # 요소 타입에 따른 처리
+        if element.name == 'a':
+            # 링크 요소인 경우
+            url = element.get('href', '')
+            title = element.get_text(strip=True)
+            
+            # 부모 요소에서 더 많은 정보 가져오기
+            parent = element.find_parent(['article', 'div'])
+            if parent:
+                # 더 나은 제목 찾기
+                title_elem = parent.find(['h1', 'h2', 'h3', 'h4'])
+                if title_elem and len(title_elem.get_text(strip=True)) > len(title):
+                    title = title_elem.get_text(strip=True)
                 
-                selectors = [
-                    '.search-result',
-                    '.article-item',
-                    '.story-item',
-                    'article',
-                    '.item',
-                    '[class*="search"]',
-                    '[class*="article"]',
-                    '[class*="story"]',
-                    'a[href*="/news/"]',
-                    'a[href*="/business/"]',
-                    'a[href*="/tech/"]',
-                    'a[href*="/sport/"]'
-                ]
-            
-            found_items = set()  # 중복 제거용
-            
-            for selector in selectors:
-                elements = soup.select(selector)
+                # 요약 찾기
+                summary_elem = parent.find(['p', '.excerpt', '.summary', '.description'])
+                if summary_elem:
+                    summary = summary_elem.get_text(strip=True)
                 
-                for element in elements:
-                    try:
-                        title = ''
-                        url = ''
-                        summary = ''
-                        image_url = ''
-                        
-                        # 요소 타입에 따른 처리
-                        if element.name == 'a':
-                            # 링크 요소인 경우
-                            url = element.get('href', '')
-                            title = element.get_text(strip=True)
-                            
-                            # 부모 요소에서 더 많은 정보 가져오기
-                            parent = element.find_parent(['article', 'div'])
-                            if parent:
-                                # 더 나은 제목 찾기
-                                title_elem = parent.find(['h1', 'h2', 'h3', 'h4'])
-                                if title_elem and len(title_elem.get_text(strip=True)) > len(title):
-                                    title = title_elem.get_text(strip=True)
-                                
-                                # 요약 찾기
-                                summary_elem = parent.find(['p', '.excerpt', '.summary', '.description'])
-                                if summary_elem:
-                                    summary = summary_elem.get_text(strip=True)
-                                
-                                # 이미지 찾기
-                                img_elem = parent.find('img')
-                                if img_elem:
-                                    image_url = img_elem.get('src', '') or img_elem.get('data-src', '') or img_elem.get('data-lazy-src', '')
-                        
-                        else:
-                            # article, div 등의 컨테이너 요소인 경우
-                            # 제목과 링크 찾기
-                            link_elem = element.find('a', href=True)
-                            if link_elem:
-                                url = link_elem.get('href', '')
-                                
-                                # 제목 찾기
-                                title_elem = element.find(['h1', 'h2', 'h3', 'h4']) or link_elem
-                                title = title_elem.get_text(strip=True) if title_elem else ''
-                                
-                                # 요약 찾기
-                                summary_elem = element.find(['p', '.excerpt', '.summary', '.description'])
-                                if summary_elem:
-                                    summary = summary_elem.get_text(strip=True)
-                                
-                                # 이미지 찾기
-                                img_elem = element.find('img')
-                                if img_elem:
-                                    image_url = img_elem.get('src', '') or img_elem.get('data-src', '') or img_elem.get('data-lazy-src', '')
-                        
-                        # 기본 검증
-                        if not title or not url or len(title) < 10:
-                            continue
-                        
-                        # JSON 스키마나 잘못된 제목 필터링
-                        if title.startswith('{') or '"@context"' in title or '"@type"' in title:
-                            continue
-                        
-                        # URL 정규화
-                        if url.startswith('/'):
-                            url = self.base_url + url
-                        elif not url.startswith('http'):
-                            continue
-                        
-                        # SCMP URL인지 확인
-                        if 'scmp.com' not in url:
-                            continue
-                        
-                        # 이미지 URL 정규화
-                        if image_url and not image_url.startswith('http'):
-                            if image_url.startswith('//'):
-                                image_url = 'https:' + image_url
-                            elif image_url.startswith('/'):
-                                image_url = self.base_url + image_url
-                        
-                        # 중복 체크
-                        item_key = (title, url)
-                        if item_key in found_items:
-                            continue
-                        found_items.add(item_key)
-                        
-                        # 날짜 추출 시도 (URL이나 텍스트에서)
-                        published_date = self._extract_date(url, summary)
-                        
-                        # 유니코드 문제 해결을 위한 인코딩 처리
-                        try:
-                            title = title.encode('utf-8', 'ignore').decode('utf-8')
-                            summary = summary.encode('utf-8', 'ignore').decode('utf-8')
-                        except:
-                            title = ''.join(c for c in title if ord(c) < 128)
-                            summary = ''.join(c for c in summary if ord(c) < 128)
-                        
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else '',
-                            'published_date': published_date,
-                            'source': 'SCMP',
-                            'category': self._extract_category_from_url(url),
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url or ''
-                        }
-                        
-                        articles.append(article)
-                        
-                        if len(articles) >= limit:
-                            break
-                            
-                    except Exception as e:
-                        logger.debug(f"SCMP 요소 파싱 실패: {e}")
-                        continue
+                # 이미지 찾기
+                img_elem = parent.find('img')
+                if img_elem:
+                    image_url = img_elem.get('src', '') or img_elem.get('data-src', '') or img_elem.get('data-lazy-src', '')
+        
+        else:
+            # article, div 등의 컨테이너 요소인 경우
+            # 제목과 링크 찾기
+            link_elem = element.find('a', href=True)
+            if link_elem:
+                url = link_elem.get('href', '')
                 
-                if len(articles) >= limit:
-                    break
-                    
-        except Exception as e:
-            logger.error(f"SCMP HTML 파싱 실패: {e}")
+                # 제목 찾기
+                title_elem = element.find(['h1', 'h2', 'h3', 'h4']) or link_elem
+                title = title_elem.get_text(strip=True) if title_elem else ''
+                
+                # 요약 찾기
+                summary_elem = element.find(['p', '.excerpt', '.summary', '.description'])
+                if summary_elem:
+                    summary = summary_elem.get_text(strip=True)
+                
+                # 이미지 찾기
+                img_elem = element.find('img')
+                if img_elem:
+                    image_url = img_elem.get('src', '') or img_elem.get('data-src', '') or img_elem.get('data-lazy-src', '')
         
-        return articles[:limit]
+        # 기본 검증
+        if not title or not url or len(title) < 10:
+            return None
+        
+        # JSON 스키마나 잘못된 제목 필터링
+        if title.startswith('{') or '"@context"' in title or '"@type"' in title:
+            return None
+        
+        # URL 정규화
+        if url.startswith('/'):
+            url = self.base_url + url
+        elif not url.startswith('http'):
+            return None
+        
+        # SCMP URL인지 확인
+        if 'scmp.com' not in url:
+            return None
+        
+        return None, title, url, summary, image_url
     
-    def _process_search_link(self, link, found_items, query):
-        """검색 결과 링크를 처리하여 기사 객체 생성"""
-        try:
-            href = link.get('href', '')
-            title = link.get_text(strip=True)
-            
-            # 제목 정리 - JSON 스키마나 잘못된 데이터 제거
-            if title and (title.startswith('{') or '"@context"' in title or '"@type"' in title):
-                parent = link.find_parent()
-                if parent:
-                    title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.headline', '[class*="title"]']
-                    for selector in title_selectors:
-                        title_elem = parent.find(selector)
-                        if title_elem:
-                            new_title = title_elem.get_text(strip=True)
-                            if new_title and not new_title.startswith('{') and len(new_title) > 10 and len(new_title) < 200:
-                                title = new_title
-                                break
-            
-            # 기본 검증
-            if not title or not href or len(title) < 10:
-                return None
-            
-            # JSON 스키마나 잘못된 제목 필터링
-            if title.startswith('{') or '"@context"' in title or '"@type"' in title:
-                return None
-            
-            # URL 정규화
-            if href.startswith('/'):
-                href = self.base_url + href
-            elif not href.startswith('http'):
-                return None
-            
-            # SCMP URL인지 확인
-            if 'scmp.com' not in href:
-                return None
-            
-            # 중복 체크
-            item_key = (title, href)
+    def _dedupe_candidates(self, candidates):
+        """(제목, URL) 기준 중복 제거"""
+        found_items = set()
+        for candidate in candidates:
+            item_key = (candidate[1], candidate[2])
             if item_key in found_items:
-                return None
+                continue
             found_items.add(item_key)
-            
-            # 이미지 추출 (개선된 방법 사용)
-            image_url = self._extract_scmp_image(link, href)
+            yield candidate
+    
+    def _enrich_search_candidate(self, candidate) -> Optional[Article]:
+        """검증된 후보에 이미지/날짜를 채워 Article 생성 (반환될 기사에만 실행)"""
+        link, title, url, summary, image_url = candidate
+        try:
+            if link is not None:
+                # 이미지 추출 (개선된 방법 사용)
+                image_url = self._extract_scmp_image(link, url)
+                # 요약 생성
+                summary = title[:100] + "..." if len(title) > 100 else title
             
             # 이미지 URL 정규화
             if image_url and not image_url.startswith('http'):
@@ -957,12 +965,9 @@ class SCMPScraper:
                 elif image_url.startswith('/'):
                     image_url = self.base_url + image_url
             
-            # 요약 생성
-            summary = title[:100] + "..." if len(title) > 100 else title
-            
-            # 날짜 추출 시도
-            published_date = self._extract_date(href, summary)
-            if not published_date:
+            # 날짜 추출 시도 (URL이나 텍스트에서)
+            published_date = self._extract_date(url, summary)
+            if not published_date and link is not None:
                 published_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
             
             # 유니코드 문제 해결을 위한 인코딩 처리
@@ -973,17 +978,16 @@ class SCMPScraper:
                 title = ''.join(c for c in title if ord(c) < 128)
                 summary = ''.join(c for c in summary if ord(c) < 128)
             
-            return {
-                'title': title,
-                'url': href,
-                'summary': summary,
-                'published_date': published_date,
-                'source': 'SCMP',
-                'category': self._extract_category_from_url(href),
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 1,
-                'image_url': image_url or ''
-            }
+            return Article(
+                title=title,
+                url=url,
+                summary=summary if link is not None else (summary[:300] if summary else ''),
+                published_date=published_date,
+                source='SCMP',
+                category=self._extract_category_from_url(url),
+                relevance_score=1,
+                image_url=image_url or ''
+            )
             
         except Exception as e:
             logger.debug("SCMP 링크 처리 실패: {}".format(e))
@@ -1135,11 +1139,19 @@ class SCMPScraper:
             for url in url_priority:
                 try:
                     logger.info(f"SCMP 시도 중: {url}")
-                    response = requests.get(url, headers=self.headers, timeout=15)
-                    response.raise_for_status()
                     
-                    # 카테고리별 필터링과 함께 기사 추출
-                    articles = self._extract_articles_from_homepage(response.text, limit, category)
+                    # 카테고리별 필터링과 함께 기사 추출. 홈페이지는 검색 폴백/트렌딩과 같은
+                    # 전체 본문 스냅샷을 공유하고, 섹션 페이지만 스트리밍 파싱 (limit 개를 채우면 내려받기 중단)
+                    if url == self.base_url:
+                        articles = get_page(
+                            url, lambda html: self._extract_articles_from_homepage(html, limit, category),
+                            headers=self.headers, timeout=15, variant=('homepage', limit, category)
+                        )
+                    else:
+                        articles = get_page_streamed(
+                            url, lambda chunks: self._stream_articles_from_homepage(chunks, limit, category),
+                            headers=self.headers, timeout=15, variant=('section', limit, category)
+                        )
                     
                     if articles:
                         logger.info(f"SCMP {url}에서 {len(articles)}개 기사 추출 성공")
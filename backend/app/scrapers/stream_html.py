@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""대용량 페이지 스트리밍 증분 HTML 파싱
+
+response.text 로 전체 본문을 받은 뒤 완성된 soup 를 만드는 대신, 응답 청크를
+lxml HTMLPullParser 에 넣으며 조건에 맞는 <a> 를 찾는다. 호출한 쪽이 필요한
+기사 수를 채워 반복을 멈추면 나머지 본문은 내려받지 않는다.
+
+기존 기사 추출 코드(이미지/날짜/제목 보정)는 BeautifulSoup 요소와 그 부모/형제를
+다루므로, 링크를 감싼 컨테이너(container_depth 단계 위 조상)가 닫힐 때까지
+기다렸다가 컨테이너를 BeautifulSoup 조각으로 만들어 그 안의 링크 요소를 넘겨준다.
+링크 뒤의 형제(시간/이미지/요약)가 어느 청크에 있든 항상 포함된다.
+
+처리가 끝난 컨테이너와 그 앞 형제 요소는 비워서 파싱한 트리가 본문 크기만큼
+계속 커지지 않게 한다. 다른 링크의 컨테이너 안에 있는 요소는 그 컨테이너가 닫힐
+때까지 남겨 둔다.
+"""
+import logging
+from typing import Callable, Dict, Iterable, Iterator, Union
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+_MARK = 'data-stream-link'
+
+
+def _container_for(elem, depth: int):
+    """링크의 depth 단계 위 조상 (문서 최상위에 가까우면 가장 높은 조상)"""
+    container = elem
+    for _ in range(depth):
+        parent = container.getparent()
+        if parent is None:
+            break
+        container = parent
+    return container
+
+
+def _markup(elem, container, max_bytes: int) -> str:
+    """컨테이너부터 링크까지 내려가며 max_bytes 이하인 첫 조상의 HTML"""
+    candidate = elem
+    ancestors = [elem]
+    while candidate is not container:
+        candidate = candidate.getparent()
+        ancestors.append(candidate)
+    for candidate in reversed(ancestors):
+        markup = etree.tostring(candidate, encoding='unicode', method='html', with_tail=False)
+        if len(markup) <= max_bytes or candidate is elem:
+            return markup
+    return etree.tostring(elem, encoding='unicode', method='html', with_tail=False)
+
+
+def _as_soup_link(elem, container, max_bytes: int):
+    elem.set(_MARK, '1')
+    try:
+        fragment = BeautifulSoup(_markup(elem, container, max_bytes), 'html.parser')
+    finally:
+        del elem.attrib[_MARK]
+    link = fragment.find(attrs={_MARK: '1'})
+    if link is not None:
+        del link[_MARK]
+    return link
+
+
+def _release(container, pending: Dict) -> None:
+    """처리한 컨테이너와 그 앞 형제를 비움 (아직 닫히지 않은 다른 컨테이너 안이면 유지)"""
+    parent = container.getparent()
+    ancestor = parent
+    while ancestor is not None:
+        if ancestor in pending:
+            return
+        ancestor = ancestor.getparent()
+    container.clear(keep_tail=True)
+    if parent is not None:
+        while container.getprevious() is not None:
+            del parent[0]
+
+
+def iter_links(chunks: Iterable[Union[bytes, str]], match: Callable[[str], bool],
+               container_depth: int = 2, max_container_bytes: int = 20000) -> Iterator:
+    """청크를 증분 파싱하며 href 가 match 를 만족하는 링크를 컨테이너가 닫히는 순서대로 전달
+
+    Args:
+        chunks: 응답 본문 청크 (bytes 또는 str)
+        match: href 문자열 필터
+        container_depth: 링크와 함께 넘겨줄 조상 단계 수 (부모/형제 탐색용)
+
+    Yields:
+        컨테이너 조각 안의 BeautifulSoup <a> 요소
+    """
+    parser = etree.HTMLPullParser(events=('end',))
+    pending: Dict = {}  # 컨테이너 요소 -> 그 안에서 닫힌 링크 목록 (문서 순서)
+
+    def drain():
+        for _, elem in parser.read_events():
+            if elem.tag == 'a':
+                href = elem.get('href')
+                if href and match(href):
+                    pending.setdefault(_container_for(elem, container_depth), []).append(elem)
+            links = pending.pop(elem, None)
+            if links is None:
+                continue
+            for link_elem in links:
+                try:
+                    link = _as_soup_link(link_elem, elem, max_container_bytes)
+                except Exception as e:
+                    logger.debug(f"스트리밍 링크 변환 실패: {e}")
+                    continue
+                if link is not None:
+                    yield link
+            _release(elem, pending)
+
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+            yield from drain()
+    parser.close()
+    yield from drain()
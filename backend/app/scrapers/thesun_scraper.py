@@ -1,14 +1,29 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime
 import json
+import os
 import re
+import threading
+import time
+
+from ..models.article import Article
+from .hedged_fetch import run_concurrently
+from .local_index import LocalArticleIndex
+from .page_snapshot import get_page
+from .outbound import ENRICHMENT, PREFETCH, outbound_priority, throttled_get
 
 logger = logging.getLogger(__name__)
 
+# 로컬 인덱스를 섹션 크롤링으로 다시 채우는 주기 (초)
+INDEX_REFRESH_INTERVAL = float(os.getenv('THESUN_INDEX_REFRESH', '300'))
+# 인덱스 갱신 때 섹션별로 추출하는 기사 수
+INDEX_ARTICLES_PER_SECTION = 40
+# Google 폴백 최소 호출 간격 (초)
+GOOGLE_MIN_INTERVAL = float(os.getenv('THESUN_GOOGLE_INTERVAL', '10'))
+
 class TheSunScraper:
     """The Sun 뉴스 스크래퍼"""
     
@@ -20,8 +35,112 @@ class TheSunScraper:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
+        # 검색은 섹션 크롤링으로 채운 로컬 인덱스에서 먼저 처리
+        self.index = LocalArticleIndex()
+        self.index_sections = {
+            'news': 'https://www.thesun.co.uk/news/',
+            'sports': 'https://www.thesun.co.uk/sport/',
+            'business': 'https://www.thesun.co.uk/money/',
+            'technology': 'https://www.thesun.co.uk/tech/',
+            'health': 'https://www.thesun.co.uk/health/',
+            'entertainment': 'https://www.thesun.co.uk/fabulous/fabulous-celebrity/',
+            'world': 'https://www.thesun.co.uk/news/worldnews/',
+            'politics': 'https://www.thesun.co.uk/news/politics/',
+            'travel': 'https://www.thesun.co.uk/travel/'
+        }
+        self._index_refreshed_at = 0.0
+        self._index_lock = threading.Lock()
+        self._google_lock = threading.Lock()
+        self._last_google_at = 0.0
+        
     def search_news(self, query: str, limit: int = 10) -> List[Dict]:
-        """The Sun에서 뉴스 검색 - Google Site Search 사용"""
+        """The Sun에서 뉴스 검색 - 로컬 인덱스 우선, 결과가 부족하면 Google Site Search 폴백"""
+        try:
+            self._refresh_index()
+            # 검색어의 모든 (불용어 아닌) 단어가 들어간 기사만 적중으로 셈
+            articles = self.index.search(query, limit, min_match=1.0)
+            if len(articles) >= max(1, limit // 2):
+                logger.info("The Sun found {} search results in local index".format(len(articles)))
+                return articles
+            
+            if not self._google_allowed():
+                logger.info("The Sun Google 폴백 호출 간격 제한, 로컬 인덱스 결과 {}개 사용".format(len(articles)))
+                return articles
+            
+            google_articles = self._search_google(query, limit)
+            self.index.add(google_articles)
+            
+            # Google 결과 우선, 부족하면 로컬 인덱스 결과로 채움
+            seen_urls = {article['url'] for article in google_articles}
+            merged = list(google_articles)
+            for article in articles:
+                if len(merged) >= limit:
+                    break
+                if article['url'] not in seen_urls:
+                    seen_urls.add(article['url'])
+                    merged.append(article)
+            return merged
+            
+        except Exception as e:
+            logger.error("The Sun search failed: {}".format(e))
+            return []
+    
+    def _refresh_index(self):
+        """인덱스가 오래됐으면 섹션 크롤링으로 갱신
+
+        검색 요청 안에서 크롤링하면 소스 시간 예산을 다 써 버리므로, 인덱스가 비어 있는
+        첫 호출만 갱신 완료까지 기다리고 그 외에는 백그라운드 스레드에서 갱신한다
+        (검색은 기존 인덱스를 바로 사용).
+        """
+        if time.monotonic() - self._index_refreshed_at < INDEX_REFRESH_INTERVAL:
+            return
+        if len(self.index) == 0:
+            with self._index_lock:
+                self._crawl_index()
+            return
+        # 다른 스레드가 이미 갱신 중이면 건너뜀
+        if not self._index_lock.acquire(blocking=False):
+            return
+        
+        def run():
+            try:
+                self._crawl_index()
+            except Exception as e:
+                logger.warning("The Sun 로컬 인덱스 백그라운드 갱신 실패: {}".format(e))
+            finally:
+                self._index_lock.release()
+        
+        threading.Thread(target=run, name='thesun-index', daemon=True).start()
+    
+    def _crawl_index(self):
+        """섹션 페이지들을 동시에 크롤링해 인덱스를 다시 채움 (_index_lock 을 잡은 상태에서 호출)"""
+        if time.monotonic() - self._index_refreshed_at < INDEX_REFRESH_INTERVAL:
+            return
+        logger.info("The Sun 로컬 인덱스 갱신: 섹션 {}개 크롤링".format(len(self.index_sections)))
+        calls = [
+            lambda category=category, url=url: get_page(
+                url, lambda html: self._extract_thesun_category_articles(html, INDEX_ARTICLES_PER_SECTION, category),
+                headers=self.headers, timeout=10, variant=('index', category)
+            )
+            for category, url in self.index_sections.items()
+        ]
+        with outbound_priority(PREFETCH):
+            results = run_concurrently(calls, timeout=12, label="The Sun")
+        added = sum(self.index.add(articles) for articles in results)
+        self._index_refreshed_at = time.monotonic()
+        logger.info("The Sun 로컬 인덱스 {}개 기사 갱신 (전체 {}개)".format(added, len(self.index)))
+    
+    def _google_allowed(self) -> bool:
+        """Google 폴백 호출 간격 제한 (GOOGLE_MIN_INTERVAL 초에 한 번)"""
+        with self._google_lock:
+            now = time.monotonic()
+            if now - self._last_google_at < GOOGLE_MIN_INTERVAL:
+                return False
+            self._last_google_at = now
+            return True
+    
+    def _search_google(self, query: str, limit: int) -> List[Dict]:
+        """Google Site Search 로 The Sun 기사 검색 (로컬 인덱스 미스 시 폴백)"""
         try:
             logger.info("The Sun search via Google: {}".format(query))
             
@@ -33,7 +152,7 @@ class TheSunScraper:
                 'num': min(limit * 2, 20)  # 더 많은 결과 요청
             }
             
-            response = requests.get(self.search_url, params=params, headers=self.headers, timeout=15)
+            response = throttled_get(self.search_url, params=params, headers=self.headers, timeout=15)
             response.raise_for_status()
             
             # Google 검색 결과에서 The Sun 링크들 추출
@@ -180,17 +299,16 @@ class TheSunScraper:
                         # 날짜 추출 시도 (URL이나 텍스트에서)
                         published_date = self._extract_date(url, summary)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else '',
-                            'published_date': published_date,
-                            'source': 'The Sun',
-                            'category': self._extract_category_from_url(url),
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else '',
+                            published_date=published_date,
+                            source='The Sun',
+                            category=self._extract_category_from_url(url),
+                            relevance_score=1,
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
@@ -335,14 +453,14 @@ class TheSunScraper:
             url = category_urls.get(category, category_urls['news'])
             logger.info(f"The Sun 카테고리 페이지 접근: {url}")
             
-            # 실제 카테고리 페이지에서 기사 추출
+            # 실제 카테고리 페이지에서 기사 추출 (섹션 페이지 스냅샷 공유)
             try:
-                response = requests.get(url, headers=self.headers, timeout=15)
-                response.raise_for_status()
-                
-                articles = self._extract_thesun_category_articles(response.text, limit, category)
+                articles = get_page(url, lambda html: self._extract_thesun_category_articles(html, limit, category),
+                                    headers=self.headers, timeout=15, variant=('latest', limit, category))
                 
                 if articles:
+                    # 크롤링 결과를 검색용 로컬 인덱스에 반영
+                    self.index.add(articles)
                     logger.info(f"The Sun {category} 카테고리에서 {len(articles)}개 기사 추출")
                     return articles
                 else:
@@ -477,17 +595,16 @@ class TheSunScraper:
                             # 카테고리 추출
                             article_category = self._extract_thesun_category_from_url(url) or category
                             
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary[:300] if summary else title[:200],
-                                'published_date': published_date,
-                                'source': 'The Sun',
-                                'category': article_category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url
-                            }
+                            article = Article(
+                                title=title,
+                                url=url,
+                                summary=summary[:300] if summary else title[:200],
+                                published_date=published_date,
+                                source='The Sun',
+                                category=article_category,
+                                relevance_score=1,
+                                image_url=image_url
+                            )
                             
                             articles.append(article)
                             logger.info(f"The Sun 기사 추가: {title[:50]}...")
@@ -702,17 +819,16 @@ class TheSunScraper:
                         # 이미지가 없으면 폴백 사용
                         final_image_url = image_url if image_url else self._get_fallback_image_url(category, url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else title[:200],
-                            'published_date': published_date,
-                            'source': 'The Sun',
-                            'category': category,
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': final_image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else title[:200],
+                            published_date=published_date,
+                            source='The Sun',
+                            category=category,
+                            relevance_score=1,
+                            image_url=final_image_url
+                        )
                         
                         articles.append(article)
                         logger.info(f"Google에서 The Sun 기사 추가: {title[:50]}...")
@@ -792,7 +908,7 @@ class TheSunScraper:
             if not self._is_real_news_url(article_url):
                 return ''
                 
-            response = requests.get(article_url, headers=self.headers, timeout=10)
+            response = throttled_get(article_url, priority=ENRICHMENT, headers=self.headers, timeout=10)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict
 import logging
 from datetime import datetime, timedelta
 import re
 
+from ..models.article import Article
+from .page_snapshot import get_page
+from .outbound import throttled_get
+
 logger = logging.getLogger(__name__)
 
 class TheThaigerScraper:
@@ -27,7 +30,7 @@ class TheThaigerScraper:
             search_url = self.base_url + "/"
             search_params = {'s': query}
             
-            response = requests.get(search_url, params=search_params, headers=self.headers, timeout=15)
+            response = throttled_get(search_url, params=search_params, headers=self.headers, timeout=15)
             response.raise_for_status()
             
             articles = self._extract_articles_from_html(response.text, limit, query)
@@ -223,16 +226,15 @@ class TheThaigerScraper:
                 requested_category != 'news' and category != requested_category):
                 return None
             
-            return {
-                'title': title,
-                'url': url,
-                'summary': summary,
-                'published_date': published_date,
-                'source': 'The Thaiger',
-                'category': category,
-                'scraped_at': datetime.now().isoformat(),
-                'image_url': image_url
-            }
+            return Article(
+                title=title,
+                url=url,
+                summary=summary,
+                published_date=published_date,
+                source='The Thaiger',
+                category=category,
+                image_url=image_url
+            )
             
         except Exception as e:
             logger.debug("The Thaiger latest-new-list 파싱 실패: {}".format(e))
@@ -311,16 +313,15 @@ class TheThaigerScraper:
                 requested_category != 'news' and category != requested_category):
                 return None
             
-            return {
-                'title': title,
-                'url': url,
-                'summary': summary,
-                'published_date': published_date,
-                'source': 'The Thaiger',
-                'category': category,
-                'scraped_at': datetime.now().isoformat(),
-                'image_url': image_url
-            }
+            return Article(
+                title=title,
+                url=url,
+                summary=summary,
+                published_date=published_date,
+                source='The Thaiger',
+                category=category,
+                image_url=image_url
+            )
             
         except Exception as e:
             logger.debug("The Thaiger 기사 파싱 실패: {}".format(e))
@@ -364,16 +365,15 @@ class TheThaigerScraper:
                 requested_category != 'news' and category != requested_category):
                 return None
             
-            return {
-                'title': title,
-                'url': url,
-                'summary': summary,
-                'published_date': published_date,
-                'source': 'The Thaiger',
-                'category': category,
-                'scraped_at': datetime.now().isoformat(),
-                'image_url': image_url
-            }
+            return Article(
+                title=title,
+                url=url,
+                summary=summary,
+                published_date=published_date,
+                source='The Thaiger',
+                category=category,
+                image_url=image_url
+            )
             
         except Exception as e:
             logger.debug("The Thaiger 홈페이지 기사 생성 실패: {}".format(e))
@@ -559,11 +559,7 @@ class TheThaigerScraper:
         """홈페이지에서 최신 기사 추출"""
         try:
             logger.info("The Thaiger 홈페이지에서 최신 기사 추출")
-            
-            response = requests.get(self.base_url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            return self._extract_articles_from_html(response.text, limit, "homepage")
+            return self._get_homepage_snapshot(limit, "homepage")
             
         except Exception as e:
             logger.error("The Thaiger 홈페이지 추출 실패: {}".format(e))
@@ -573,16 +569,17 @@ class TheThaigerScraper:
         """홈페이지에서 특정 카테고리 기사 목록 가져오기"""
         try:
             logger.info("The Thaiger 홈페이지에서 {} 카테고리 기사 추출".format(category))
-            
-            response = requests.get(self.base_url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            return self._extract_articles_from_html(response.text, limit, category)
+            return self._get_homepage_snapshot(limit, category)
             
         except Exception as e:
             logger.error("The Thaiger 홈페이지 카테고리 추출 실패: {}".format(e))
             return []
     
+    def _get_homepage_snapshot(self, limit, category):
+        """검색/트렌딩/최신 뉴스가 공유하는 홈페이지 스냅샷에서 기사 추출"""
+        return get_page(self.base_url, lambda html: self._extract_articles_from_html(html, limit, category),
+                        headers=self.headers, timeout=15, variant=('homepage', limit, category))
+    
     def get_latest_news(self, category='news', limit=10):
         try:
             logger.info("The Thaiger 카테고리: {}".format(category))
@@ -604,10 +601,9 @@ class TheThaigerScraper:
             url = category_urls.get(category, self.base_url)
             logger.info("The Thaiger 카테고리 URL: {}".format(url))
             
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            articles = self._extract_articles_from_html(response.text, limit, category)
+            # 섹션 페이지 스냅샷 공유 ('all'은 홈페이지와 같은 스냅샷)
+            articles = get_page(url, lambda html: self._extract_articles_from_html(html, limit, category),
+                                headers=self.headers, timeout=15, variant=('homepage', limit, category))
             
             if not articles:
                 logger.info("The Thaiger 카테고리 실패, 홈페이지로 폴백")
@@ -632,15 +628,14 @@ class TheThaigerScraper:
         ]
         
         for i in range(min(limit, len(base_titles))):
-            articles.append({
-                'title': "{} - {} Update".format(base_titles[i], category.title()),
-                'url': "{}/news/{}-update-{}".format(self.base_url, category, i+1),
-                'summary': "Latest {} news and updates from Thailand. Stay informed with The Thaiger's comprehensive coverage.".format(category),
-                'published_date': (datetime.now() - timedelta(hours=i)).isoformat(),
-                'source': 'The Thaiger',
-                'category': category,
-                'scraped_at': datetime.now().isoformat(),
-                'image_url': ''
-            })
+            articles.append(Article(
+                title="{} - {} Update".format(base_titles[i], category.title()),
+                url="{}/news/{}-update-{}".format(self.base_url, category, i+1),
+                summary="Latest {} news and updates from Thailand. Stay informed with The Thaiger's comprehensive coverage.".format(category),
+                published_date=(datetime.now() - timedelta(hours=i)).isoformat(),
+                source='The Thaiger',
+                category=category,
+                image_url=''
+            ))
         
         return articles 
\ No newline at end of file
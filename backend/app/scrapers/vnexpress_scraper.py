@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import logging
@@ -8,6 +7,10 @@ import json
 import re
 import time
 
+from ..models.article import Article
+from .hedged_fetch import hedged_get
+from .outbound import throttled_get
+
 logger = logging.getLogger(__name__)
 
 class VNExpressScraper:
@@ -37,22 +40,14 @@ class VNExpressScraper:
                 f"https://vnexpress.net/?s={query}"
             ]
             
-            for search_url in search_urls:
-                try:
-                    logger.info(f"VN Express 검색 시도: {search_url}")
-                    response = requests.get(search_url, headers=self.headers, timeout=15)
-                    response.raise_for_status()
-                    
-                    articles = self._extract_search_results(response.text, limit, query)
-                    if articles:
-                        logger.info(f"VN Express에서 {len(articles)}개 기사 발견")
-                        return articles
-                    else:
-                        logger.debug(f"검색 결과 없음: {search_url}")
-                        
-                except Exception as e:
-                    logger.debug(f"VN Express 검색 URL 실패 {search_url}: {e}")
-                    continue
+            # 후보 URL 헤지 요청 - 먼저 결과를 준 URL 사용
+            articles = hedged_get(
+                [(url, lambda response: self._extract_search_results(response.text, limit, query)) for url in search_urls],
+                headers=self.headers, timeout=15, label="VN Express"
+            )
+            if articles:
+                logger.info(f"VN Express에서 {len(articles)}개 기사 발견")
+                return articles
             
             # 검색 실패 시 최신 뉴스로 대체
             logger.info("VN Express 검색 실패, 최신 뉴스로 대체")
@@ -159,17 +154,16 @@ class VNExpressScraper:
                         # 카테고리 추출
                         category = self._extract_category_from_url(url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else title[:200],
-                            'published_date': published_date,
-                            'source': 'VN Express',
-                            'category': category,
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else title[:200],
+                            published_date=published_date,
+                            source='VN Express',
+                            category=category,
+                            relevance_score=1,
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
@@ -279,7 +273,7 @@ class VNExpressScraper:
             
             logger.info(f"VN Express 최신 뉴스 가져오기: {url}")
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = throttled_get(url, headers=self.headers, timeout=15)
             response.raise_for_status()
             
             articles = self._extract_search_results(response.text, limit)
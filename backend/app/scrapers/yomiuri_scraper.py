@@ -1,16 +1,24 @@
 # -*- coding: utf-8 -*-
-import requests
 from bs4 import BeautifulSoup
 import logging
 from datetime import datetime, timedelta
 import json
 import re
 import time
-import feedparser  # Added for RSS parsing
+import os
 from urllib.parse import quote
 
+from ..models.article import Article
+from .conditional_fetch import fetch_parsed
+from .endpoint_strategy import get_selector
+from .hedged_fetch import run_concurrently
+from .outbound import throttled_get
+
 logger = logging.getLogger(__name__)
 
+# 홈페이지+섹션 동시 수집 전체 마감 시간 (초)
+COLLECT_DEADLINE = float(os.getenv('YOMIURI_COLLECT_DEADLINE', '12'))
+
 class YomiuriScraper:
     """Yomiuri Shimbun 뉴스 스크래퍼 (www.yomiuri.co.jp)"""
     
@@ -63,7 +71,7 @@ class YomiuriScraper:
             search_url = "https://www.yomiuri.co.jp/web-search/?st=1&wo={}&ac=srch&ar=1&fy=&fm=&fd=&ty=&tm=&td=".format(quote(query))
             
             logger.info("Yomiuri 검색 시도: {}".format(search_url))
-            response = requests.get(search_url, headers=self.headers, timeout=15)
+            response = throttled_get(search_url, headers=self.headers, timeout=15)
             response.raise_for_status()
             
             articles = self._extract_search_results(response.text, limit, query)
@@ -182,17 +190,16 @@ class YomiuriScraper:
                         # 카테고리 추출
                         category = self._extract_category_from_content(title, summary, url)
                         
-                        article = {
-                            'title': title,
-                            'url': url,
-                            'summary': summary[:300] if summary else title[:200],
-                            'published_date': published_date,
-                            'source': 'Yomiuri Shimbun',
-                            'category': category,
-                            'scraped_at': datetime.now().isoformat(),
-                            'relevance_score': 1,
-                            'image_url': image_url
-                        }
+                        article = Article(
+                            title=title,
+                            url=url,
+                            summary=summary[:300] if summary else title[:200],
+                            published_date=published_date,
+                            source='Yomiuri Shimbun',
+                            category=category,
+                            relevance_score=1,
+                            image_url=image_url
+                        )
                         
                         articles.append(article)
                         
@@ -352,70 +359,7 @@ class YomiuriScraper:
             # Multi-method approach for 'all', 'trending', 'popular' categories
             if category in ['all', 'trending', 'popular']:
                 logger.info("Yomiuri multi-source approach")
-                
-                # Method 1: Homepage first (most important articles)
-                homepage_articles = self._get_enhanced_homepage_articles(limit * 2)  # Get more for better selection
-                if homepage_articles:
-                    # 메인 페이지 기사는 높은 우선순위
-                    for article in homepage_articles:
-                        article['relevance_score'] = 3.0  # 최상위 우선순위
-                    all_articles.extend(homepage_articles)
-                    logger.info("Homepage: {} articles collected".format(len(homepage_articles)))
-                
-                # Method 2: Enhanced section scraping (RSS discontinued)
-                # Skip RSS since all feeds return 404
-                logger.info("Skipping RSS feeds (discontinued), using enhanced section scraping")
-                
-                # Method 3: Enhanced section scraping with more sources
-                if len(all_articles) < limit * 2:  # Get more articles to compensate for no RSS
-                    section_articles = self._get_enhanced_section_articles(limit * 2)
-                    if section_articles:
-                        # URL 및 제목 기반 중복 제거 (더 엄격한 중복 체크)
-                        existing_urls = {article['url'] for article in all_articles}
-                        existing_titles = {article['title'] for article in all_articles}
-                        new_section_articles = [
-                            article for article in section_articles 
-                            if article['url'] not in existing_urls and article['title'] not in existing_titles
-                        ]
-                        
-                        # 섹션 기사는 기본 우선순위
-                        for article in new_section_articles:
-                            article['relevance_score'] = 1.0
-                        
-                        all_articles.extend(new_section_articles)
-                        logger.info("Sections: {} new articles collected".format(len(new_section_articles)))
-                
-                # 최종 기사 선택
-                # 1. 우선순위로 정렬
-                all_articles.sort(key=lambda x: (
-                    x.get('relevance_score', 0),  # 우선순위 점수
-                    'OYT' in x.get('url', ''),    # OYT 코드 포함 여부
-                    len(x.get('summary', '')),    # 요약 길이
-                    x.get('image_url', '') != ''  # 이미지 존재 여부
-                ), reverse=True)
-                
-                # 2. 중복 제거 (URL과 제목 모두 고려)
-                seen_urls = set()
-                seen_titles = set()
-                unique_articles = []
-                
-                for article in all_articles:
-                    url = article['url']
-                    title = article['title']
-                    
-                    if url not in seen_urls and title not in seen_titles:
-                        seen_urls.add(url)
-                        seen_titles.add(title)
-                        unique_articles.append(article)
-                
-                final_articles = unique_articles[:limit]
-                
-                if final_articles:
-                    logger.info("Total: {} unique articles returned (requested: {})".format(len(final_articles), limit))
-                    return final_articles
-                else:
-                    logger.info("Multi-source approach failed, falling back to news category")
-                    return self.get_latest_news('news', limit)
+                return self._collect_multi_source(limit)
             
             # 카테고리별 URL 매핑 (일본어 메인 사이트 사용)
             category_urls = {
@@ -433,38 +377,36 @@ class YomiuriScraper:
             
             # 기본 카테고리 처리
             url = category_urls.get(category)
-            if not url:
-                # URL이 없으면 RSS로 폴백
-                logger.info("Yomiuri {} URL 없음, RSS 시도".format(category))
-                return self._get_rss_articles('national', limit)
             
-            logger.info("Yomiuri 최신 뉴스 가져오기: {}".format(url))
-            
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            articles = self._extract_search_results(response.text, limit)
+            def get_section():
+                if not url:
+                    return []
+                logger.info("Yomiuri 최신 뉴스 가져오기: {}".format(url))
+                # 조건부 GET - 섹션 페이지가 바뀌지 않았으면 이전 추출 결과 재사용
+                return fetch_parsed(url, lambda html: self._extract_search_results(html, limit),
+                                    headers=self.headers, timeout=15, variant=('latest', limit))
+            
+            # 중단된 RSS 는 항상 빈 결과(성공)를 돌려 강등되지 않으므로 후보에서 제외
+            endpoints = [
+                ('search', lambda: self.search_news('breaking news', limit)),
+            ]
+            if url:
+                endpoints.insert(0, ('section', get_section))
+            else:
+                logger.info("Yomiuri {} URL 없음, 대체 방법 시도".format(category))
+            
+            # 섹션 페이지 → 검색 순서로 선언하되, 최근 성과가 좋은 방법부터 시도
+            # (계속 실패하는 방법은 주기적인 프로브 전까지 건너뜀)
+            # 섹션 URL 이 카테고리마다 다르므로 선택기도 카테고리별로 둠
+            articles = get_selector('yomiuri', f'latest.{category}').first(
+                endpoints, accept=lambda result: len(result) >= max(1, limit // 2)
+            )
             logger.info("Yomiuri 최신 뉴스 {}개 수집".format(len(articles)))
-            
-            # 결과가 없거나 적으면 RSS로 fallback
-            if not articles or len(articles) < limit // 2:
-                logger.info("Yomiuri 최신 뉴스 결과 부족, RSS로 fallback")
-                rss_articles = self._get_rss_articles('latest', limit)
-                if rss_articles:
-                    return rss_articles
-                return self.search_news('breaking news', limit)
-            
             return articles
             
         except Exception as e:
             logger.error("Yomiuri 최신 뉴스 가져오기 실패: {}".format(e))
-            # 404나 다른 오류 시 search_news로 fallback
-            logger.info("Yomiuri 최신 뉴스 실패, 검색으로 fallback")
-            try:
-                return self.search_news('breaking news', limit)
-            except Exception as fallback_error:
-                logger.error("Yomiuri fallback 검색도 실패: {}".format(fallback_error))
-                return []
+            return []
     
     def _get_rss_articles(self, feed_type='trending', limit=10):
         """RSS 피드에서 기사 추출 - RSS 중단으로 인한 스킵"""
@@ -570,7 +512,7 @@ class YomiuriScraper:
             logger.info("Yomiuri 메인 페이지에서 트렌딩 뉴스 추출 시도")
             
             # 메인 페이지 접근
-            response = requests.get(self.base_url, headers=self.headers, timeout=15)
+            response = throttled_get(self.base_url, headers=self.headers, timeout=15)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -637,17 +579,16 @@ class YomiuriScraper:
                     # 날짜 (현재 시간을 기본값으로 - 트렌딩이므로 최신)
                     published_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
                     
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'summary': summary,
-                        'published_date': published_date,
-                        'source': 'Yomiuri Shimbun',
-                        'category': category,
-                        'scraped_at': datetime.now().isoformat(),
-                        'relevance_score': 2,  # 메인 페이지 트렌딩은 높은 관련성
-                        'image_url': image_url or self._get_fallback_image(category)
-                    }
+                    article = Article(
+                        title=title,
+                        url=url,
+                        summary=summary,
+                        published_date=published_date,
+                        source='Yomiuri Shimbun',
+                        category=category,
+                        relevance_score=2,  # 메인 페이지 트렌딩은 높은 관련성
+                        image_url=image_url or self._get_fallback_image(category)
+                    )
                     
                     articles.append(article)
                     
@@ -794,17 +735,16 @@ class YomiuriScraper:
         # Create summary
         summary = title[:150] + "..." if len(title) > 150 else title
         
-        article = {
-            'title': title,
-            'url': url,
-            'summary': summary,
-            'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-            'source': 'Yomiuri Shimbun',
-            'category': category,
-            'scraped_at': datetime.now().isoformat(),
-            'relevance_score': relevance_score,
-            'image_url': image_url or self._get_fallback_image(category)
-        }
+        article = Article(
+            title=title,
+            url=url,
+            summary=summary,
+            published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+            source='Yomiuri Shimbun',
+            category=category,
+            relevance_score=relevance_score,
+            image_url=image_url or self._get_fallback_image(category)
+        )
         
         articles.append(article)
         
@@ -828,100 +768,76 @@ class YomiuriScraper:
         logger.info("RSS feeds discontinued by Yomiuri, returning empty list")
         return []
     
-    def _get_backup_rss_articles(self, limit=5):
-        """Try backup RSS feeds when primary feeds fail"""
-        try:
-            for backup_url in self.backup_rss_feeds:
-                try:
-                    logger.info("백업 RSS 시도: {}".format(backup_url))
-                    feed = feedparser.parse(backup_url)
-                    
-                    if not feed.entries:
-                        continue
-                    
-                    articles = []
-                    for entry in feed.entries[:limit]:
-                        try:
-                            title = entry.get('title', '').strip()
-                            url = entry.get('link', '').strip()
-                            
-                            if not title or not url:
-                                continue
-                            
-                            summary = self._extract_rss_summary(entry)
-                            published_date = self._extract_rss_date(entry)
-                            image_url = self._extract_rss_image(entry)
-                            category = self._extract_category_from_url(url)
-                            
-                            article = {
-                                'title': title,
-                                'url': url,
-                                'summary': summary,
-                                'published_date': published_date,
-                                'source': 'Yomiuri Backup RSS',
-                                'category': category,
-                                'scraped_at': datetime.now().isoformat(),
-                                'relevance_score': 1,
-                                'image_url': image_url or self._get_fallback_image(category)
-                            }
-                            
-                            articles.append(article)
-                            
-                        except Exception as e:
-                            logger.debug("백업 RSS 엔트리 처리 실패: {}".format(e))
-                            continue
-                    
-                    if articles:
-                        logger.info("백업 RSS {}에서 {}개 기사 수집".format(backup_url, len(articles)))
-                        return articles
-                        
-                except Exception as e:
-                    logger.debug("백업 RSS {} 실패: {}".format(backup_url, e))
-                    continue
-            
-            return []
-            
-        except Exception as e:
-            logger.error("백업 RSS 처리 실패: {}".format(e))
-            return []
+    def _collect_multi_source(self, limit):
+        """홈페이지와 모든 섹션 페이지를 하나의 마감 시간 안에 동시에 수집한 뒤 한 번에 병합"""
+        articles_per_section = max(2, (limit * 2) // len(self.enhanced_section_urls))
+        calls = [lambda: self._get_enhanced_homepage_articles(limit * 2)]  # Get more for better selection
+        calls.extend(
+            lambda section_url=section_url: self._get_enhanced_section_page(section_url, articles_per_section)
+            for section_url in self.enhanced_section_urls
+        )
+        homepage_articles, *section_results = run_concurrently(calls, timeout=COLLECT_DEADLINE, label="Yomiuri")
+        
+        all_articles = []
+        # 메인 페이지 기사는 높은 우선순위
+        for article in homepage_articles:
+            article['relevance_score'] = 3.0  # 최상위 우선순위
+            all_articles.append(article)
+        logger.info("Homepage: {} articles collected".format(len(homepage_articles)))
+        
+        # 섹션 기사는 기본 우선순위
+        section_count = 0
+        for section_articles in section_results:
+            for article in section_articles:
+                article['relevance_score'] = 1.0
+                all_articles.append(article)
+                section_count += 1
+        logger.info("Sections: {} articles collected".format(section_count))
+        
+        # 최종 기사 선택
+        # 1. 우선순위로 정렬
+        all_articles.sort(key=lambda x: (
+            x.get('relevance_score', 0),  # 우선순위 점수
+            'OYT' in x.get('url', ''),    # OYT 코드 포함 여부
+            len(x.get('summary', '')),    # 요약 길이
+            x.get('image_url', '') != ''  # 이미지 존재 여부
+        ), reverse=True)
+        
+        # 2. 중복 제거 (URL과 제목 모두 고려)
+        seen_urls = set()
+        seen_titles = set()
+        unique_articles = []
+        
+        for article in all_articles:
+            url = article['url']
+            title = article['title']
+            
+            if url not in seen_urls and title not in seen_titles:
+                seen_urls.add(url)
+                seen_titles.add(title)
+                unique_articles.append(article)
+        
+        final_articles = unique_articles[:limit]
+        logger.info("Total: {} unique articles returned (requested: {})".format(len(final_articles), limit))
+        return final_articles
     
-    def _get_enhanced_section_articles(self, limit=20):
-        """Enhanced scraping from multiple section pages with better extraction"""
+    def _get_enhanced_section_page(self, section_url, articles_per_section):
+        """Enhanced scraping from one section page"""
         try:
-            logger.info("Enhanced 섹션 페이지에서 기사 수집 시도")
-            
-            all_articles = []
-            articles_per_section = max(2, limit // len(self.enhanced_section_urls))
-            
-            for section_url in self.enhanced_section_urls:
-                if len(all_articles) >= limit:
-                    break
-                    
-                try:
-                    logger.info("Enhanced 섹션 페이지 스크래핑: {}".format(section_url))
-                    response = requests.get(section_url, headers=self.headers, timeout=15)
-                    response.raise_for_status()
-                    
-                    # Use enhanced extraction with better selectors
-                    section_articles = self._extract_enhanced_articles(response.text, articles_per_section, section_url)
-                    if section_articles:
-                        # Mark as section-sourced with higher priority
-                        for article in section_articles:
-                            article['relevance_score'] = 1.5  # Higher than before
-                            article['source'] = 'Yomiuri Shimbun (Enhanced)'
-                        
-                        all_articles.extend(section_articles)
-                        logger.info("Enhanced 섹션 {}에서 {}개 기사 수집".format(section_url, len(section_articles)))
-                    
-                except Exception as e:
-                    logger.debug("Enhanced 섹션 {} 스크래핑 실패: {}".format(section_url, e))
-                    continue
-            
-            logger.info("총 Enhanced 섹션에서 {}개 기사 수집 완료".format(len(all_articles)))
-            return all_articles[:limit]
+            logger.info("Enhanced 섹션 페이지 스크래핑: {}".format(section_url))
+            # Use enhanced extraction with better selectors (조건부 GET, 변경 없으면 재사용)
+            section_articles = fetch_parsed(
+                section_url,
+                lambda html: self._extract_enhanced_articles(html, articles_per_section, section_url),
+                headers=self.headers, timeout=15, variant=('enhanced', articles_per_section)
+            )
+            for article in section_articles:
+                article['source'] = 'Yomiuri Shimbun (Enhanced)'
+            logger.info("Enhanced 섹션 {}에서 {}개 기사 수집".format(section_url, len(section_articles)))
+            return section_articles
             
         except Exception as e:
-            logger.error("Enhanced 섹션 페이지 처리 실패: {}".format(e))
+            logger.debug("Enhanced 섹션 {} 스크래핑 실패: {}".format(section_url, e))
             return []
     
     def _extract_enhanced_articles(self, html_content, limit, base_url):
@@ -1034,17 +950,16 @@ class YomiuriScraper:
             # Better summary
             summary = self._generate_better_summary(title, link, base_url)
             
-            article = {
-                'title': title,
-                'url': url,
-                'summary': summary,
-                'published_date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
-                'source': 'Yomiuri Shimbun',
-                'category': category,
-                'scraped_at': datetime.now().isoformat(),
-                'relevance_score': 1.5,
-                'image_url': image_url or self._get_fallback_image(category)
-            }
+            article = Article(
+                title=title,
+                url=url,
+                summary=summary,
+                published_date=datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                source='Yomiuri Shimbun',
+                category=category,
+                relevance_score=1.5,
+                image_url=image_url or self._get_fallback_image(category)
+            )
             
             articles.append(article)
             
@@ -1082,7 +997,7 @@ class YomiuriScraper:
         try:
             logger.info("Enhanced homepage scraping attempt")
             
-            response = requests.get(self.base_url, headers=self.headers, timeout=15)
+            response = throttled_get(self.base_url, headers=self.headers, timeout=15)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
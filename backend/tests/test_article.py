@@ -0,0 +1,29 @@
+import pytest
+
+from app.models.article import Article
+
+
+def test_dict_compatible_access():
+    article = Article(title='t', url='https://x/1', source='BBC News', scraped_at=0)
+    assert article['title'] == 't'
+    assert article.get('image_url') == ''
+    assert article.get('missing', 'default') == 'default'
+    assert 'url' in article and 'missing' not in article
+    assert list(article.keys()) == list(Article.FIELDS)
+    with pytest.raises(KeyError):
+        article['missing'] = 1
+
+
+def test_from_dict_round_trip():
+    original = Article(title='t', url='https://x/1', summary='s', published_date='2026-10-19',
+                       source='SCMP', category='world', relevance_score=2, image_url='i')
+    restored = Article.from_dict(original.to_dict())
+    assert restored.to_dict() == original.to_dict()
+    assert Article.coerce(original) is original
+
+
+def test_source_and_category_are_interned():
+    first = Article(source=''.join(['Daily', ' Mail']), category=''.join(['spo', 'rts']))
+    second = Article.from_dict({'source': 'Daily Mail', 'category': 'sports'})
+    assert first.source is second.source
+    assert first.category is second.category
@@ -0,0 +1,52 @@
+from app.api.news_router import make_date_filter
+from app.core.article_store import ArticleStore
+from app.models.article import Article
+
+
+def article(url, published_date, relevance=0):
+    return Article(title=url, url=url, published_date=published_date, relevance_score=relevance)
+
+
+def make_store():
+    store = ArticleStore()
+    store.add('BBC News', [article('b1', '2026-10-17', 1), article('b2', '2026-10-19', 3)])
+    store.add('SCMP', [article('s1', '2026-10-18', 2), article('s2', '', 0)])
+    return store
+
+
+def urls(articles):
+    return [a.url for a in articles]
+
+
+def test_sort_orders_flat_and_grouped_views():
+    store = make_store()
+    store.sort('date_desc')
+    assert urls(store.flat()) == ['b2', 's1', 'b1', 's2']
+    grouped = store.grouped()
+    assert list(grouped) == ['BBC News', 'SCMP']
+    assert urls(grouped['BBC News']) == ['b2', 'b1']
+
+    store.sort('relevance')
+    assert urls(store.flat()) == ['b2', 's1', 'b1', 's2']
+    store.sort('date_asc')
+    assert urls(store.flat()) == ['s2', 'b1', 's1', 'b2']
+
+
+def test_unknown_sort_keeps_insertion_order():
+    store = make_store()
+    store.sort('unknown')
+    assert urls(store.flat()) == ['b1', 'b2', 's1', 's2']
+
+
+def test_date_filter_keeps_undated_and_drops_empty_groups():
+    store = make_store()
+    store.filter(make_date_filter('2026-10-19', None))
+    # 날짜 없는 기사는 포함
+    assert urls(store.flat()) == ['b2', 's2']
+    assert len(store) == 2
+
+    store = ArticleStore()
+    store.add('BBC News', [article('b1', '2026-10-17')])
+    store.add('SCMP', [article('s1', '2026-10-18')])
+    store.filter(make_date_filter('2026-10-17', '2026-10-17'))
+    assert list(store.grouped()) == ['BBC News']
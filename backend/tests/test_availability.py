@@ -0,0 +1,29 @@
+import sys
+
+from app.scrapers import registry
+from app.scrapers.browser import availability
+
+
+def test_selenium_probe_runs_once(monkeypatch):
+    calls = []
+
+    def probe():
+        calls.append(1)
+        return False
+
+    monkeypatch.setattr(availability, '_probe', probe)
+    monkeypatch.setattr(availability, '_available', None)
+    assert availability.selenium_available() is False
+    assert availability.selenium_available() is False
+    assert calls == [1]
+
+
+def test_scrapers_are_created_on_first_use(monkeypatch):
+    monkeypatch.setattr(registry, '_instances', {})
+    monkeypatch.delitem(sys.modules, 'app.scrapers.vnexpress_scraper', raising=False)
+    assert 'app.scrapers.vnexpress_scraper' not in sys.modules
+
+    scraper = registry.get_scraper('vnexpress')
+    assert 'app.scrapers.vnexpress_scraper' in sys.modules
+    assert registry.get_scraper('vnexpress') is scraper
+    assert list(registry._instances) == ['vnexpress']
@@ -0,0 +1,37 @@
+from app.scrapers.browser.extract import extract_candidates
+from app.scrapers.hybrid_nypost_scraper import HybridNYPostScraper
+
+
+class ExtractDriver:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_single_script_call_for_all_selectors():
+    result = [[{'title': 'a', 'url': 'u', 'image': '', 'time': ''}], []]
+    driver = ExtractDriver(result)
+    assert extract_candidates(driver, ('.a', '.b'), 5) == result
+    assert driver.calls == [(['.a', '.b'], 5)]
+
+
+def test_script_failure_returns_empty():
+    assert extract_candidates(ExtractDriver(RuntimeError('stale')), ['.a'], 5) == []
+    assert extract_candidates(ExtractDriver(None), ['.a'], 5) == []
+
+
+def test_candidate_becomes_article():
+    scraper = HybridNYPostScraper()
+    article = scraper._article_from_candidate({
+        'title': 'Mayor announces new subway plan', 'url': 'https://nypost.com/2026/10/19/metro/plan/',
+        'image': '', 'time': '2026-10-19T08:30:00-04:00'})
+    assert article.url == 'https://nypost.com/2026/10/19/metro/plan/'
+    assert article.source == 'NY Post'
+    assert scraper._article_from_candidate({'title': 'short', 'url': 'https://nypost.com/x'}) is None
+    assert scraper._article_from_candidate({'title': 'Long enough title here', 'url': 'https://other.com/x'}) is None
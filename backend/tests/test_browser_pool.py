@@ -0,0 +1,94 @@
+import pytest
+
+from app.scrapers.browser.pool import BrowserPool, _BrowserSession
+
+
+class FakeDriver:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.quit_called = False
+        self.visited = []
+
+    def execute_script(self, script, *args):
+        if not self.healthy:
+            raise RuntimeError('dead')
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        pass
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(monkeypatch, created, **kwargs):
+    def create(self):
+        driver = FakeDriver()
+        created.append(driver)
+        return _BrowserSession(driver)
+    monkeypatch.setattr(BrowserPool, '_create_session', create)
+    return BrowserPool(**kwargs)
+
+
+def test_sessions_are_reused_and_cleaned(monkeypatch):
+    created = []
+    pool = make_pool(monkeypatch, created, size=1, max_uses=5, max_memory_mb=1000)
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+    assert first is second
+    assert len(created) == 1
+    assert first.visited == ['about:blank', 'about:blank']
+
+
+def test_session_recycled_after_max_uses_or_failure(monkeypatch):
+    created = []
+    pool = make_pool(monkeypatch, created, size=1, max_uses=2, max_memory_mb=1000)
+    for _ in range(2):
+        with pool.lease():
+            pass
+    assert created[0].quit_called
+    with pytest.raises(ValueError):
+        with pool.lease():
+            raise ValueError('page error')
+    assert created[1].quit_called
+    with pool.lease() as driver:
+        assert driver is created[2]
+
+
+def test_unhealthy_idle_session_is_replaced(monkeypatch):
+    created = []
+    pool = make_pool(monkeypatch, created, size=1, max_uses=5, max_memory_mb=1000)
+    with pool.lease():
+        pass
+    created[0].healthy = False
+    with pool.lease() as driver:
+        assert driver is created[1]
+    assert created[0].quit_called
+
+
+def test_pool_size_bounds_concurrent_leases(monkeypatch):
+    created = []
+    pool = make_pool(monkeypatch, created, size=1, max_uses=5, max_memory_mb=1000)
+    with pool.lease():
+        with pytest.raises(TimeoutError):
+            with pool.lease(timeout=0.05):
+                pass
+    assert len(created) == 1
+
+
+def test_warm_creates_sessions_up_to_size(monkeypatch):
+    created = []
+    pool = make_pool(monkeypatch, created, size=2, max_uses=5, max_memory_mb=1000)
+    pool.warm()
+    pool.warm()
+    assert len(created) == 2
+    pool.shutdown()
+    assert all(driver.quit_called for driver in created)
@@ -0,0 +1,30 @@
+from app.scrapers.browser import profile
+
+
+class RecordingDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+
+
+def test_resource_blocking_sets_blocked_urls(monkeypatch):
+    monkeypatch.setattr(profile, 'BLOCK_RESOURCES', True)
+    driver = RecordingDriver()
+    profile.apply_resource_blocking(driver)
+    assert driver.commands[0] == ('Network.enable', {})
+    assert driver.commands[1] == ('Network.setBlockedURLs', {'urls': profile.BLOCKED_URL_PATTERNS})
+    assert '*.woff2' in profile.BLOCKED_URL_PATTERNS
+
+
+def test_resource_blocking_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(profile, 'BLOCK_RESOURCES', False)
+    driver = RecordingDriver()
+    profile.apply_resource_blocking(driver)
+    assert driver.commands == []
+
+
+def test_drivers_without_cdp_are_ignored(monkeypatch):
+    monkeypatch.setattr(profile, 'BLOCK_RESOURCES', True)
+    profile.apply_resource_blocking(object())
@@ -0,0 +1,43 @@
+import time
+
+from app.scrapers.browser import waits
+
+
+class ScriptedDriver:
+    """execute_script 호출마다 정해 둔 값을 차례로 반환"""
+
+    def __init__(self, values, url='https://x/'):
+        self.values = list(values)
+        self.calls = 0
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return self.values.pop(0) if len(self.values) > 1 else self.values[0]
+
+
+def test_wait_for_selectors_returns_first_present(monkeypatch):
+    monkeypatch.setattr(waits, 'POLL_INTERVAL', 0.01)
+    driver = ScriptedDriver([-1, -1, 1])
+    assert waits.wait_for_selectors(driver, ['.a', '.b'], timeout=1) == '.b'
+    assert driver.calls == 3
+
+
+def test_wait_for_selectors_gives_up_at_timeout(monkeypatch):
+    monkeypatch.setattr(waits, 'POLL_INTERVAL', 0.01)
+    start = time.monotonic()
+    assert waits.wait_for_selectors(ScriptedDriver([-1]), ['.a'], timeout=0.1) is None
+    assert time.monotonic() - start < 0.5
+
+
+def test_wait_for_dom_stable_returns_once_size_settles(monkeypatch):
+    monkeypatch.setattr(waits, 'POLL_INTERVAL', 0.01)
+    driver = ScriptedDriver([[10, 5], [20, 8], [30, 9], [30, 9]])
+    assert waits.wait_for_dom_stable(driver, timeout=1, quiet_period=0.05)
+
+
+def test_wait_for_url_change(monkeypatch):
+    monkeypatch.setattr(waits, 'POLL_INTERVAL', 0.01)
+    driver = ScriptedDriver([None], url='https://x/search?q=a')
+    assert waits.wait_for_url_change(driver, 'https://x/', timeout=0.1)
+    assert not waits.wait_for_url_change(driver, 'https://x/search?q=a', timeout=0.05)
@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from app.scrapers import circuit_breaker, registry
+from app.scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError, SourceFailure
+from app.scrapers.outbound import record_fetch
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker('test', failure_threshold=3, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == circuit_breaker.OPEN
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == circuit_breaker.CLOSED
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == circuit_breaker.HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == circuit_breaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == circuit_breaker.OPEN
+    assert not breaker.allow()
+
+
+def fresh_spec():
+    spec = registry.ScraperSpec('bbc', 'bbc_scraper', 'BBCNewsScraper')
+    spec.breaker.failure_threshold = 2
+    return spec
+
+
+def test_blocked_source_trips_breaker_and_serves_cache():
+    spec = fresh_spec()
+    calls = []
+    state = {'blocked': False}
+
+    def scrape():
+        calls.append(1)
+        if state['blocked']:
+            record_fetch(False)  # 403 을 받고 스크래퍼가 [] 반환
+            return []
+        record_fetch(True)
+        return ['cached article']
+
+    async def call(spec):
+        return await spec._guarded(('search', 'q'), scrape)
+
+    async def run():
+        results = [await registry.gather_sources([spec], call)]
+        state['blocked'] = True
+        for _ in range(2):
+            results.append(await registry.gather_sources([spec], call))
+        results.append(await registry.gather_sources([spec], call))
+        return results
+
+    first, blocked1, blocked2, short_circuited = [r[0] for r in asyncio.run(run())]
+    assert first[1] == ['cached article']
+    assert isinstance(blocked1[2], SourceFailure)
+    assert isinstance(blocked2[2], SourceFailure)
+    assert spec.breaker.state == circuit_breaker.OPEN
+    # 열린 동안에는 스크래퍼를 부르지 않고 최근 성공 결과 제공
+    assert len(calls) == 3
+    assert short_circuited[1] == ['cached article'] and short_circuited[2] is None
+
+
+def test_open_breaker_without_cache_reports_error():
+    spec = fresh_spec()
+    spec.breaker.record_failure()
+    spec.breaker.record_failure()
+
+    async def call(spec):
+        return await spec._guarded(('search', 'other'), lambda: ['x'])
+
+    _, articles, error = asyncio.run(registry.gather_sources([spec], call))[0]
+    assert articles == []
+    assert isinstance(error, CircuitOpenError)
@@ -0,0 +1,40 @@
+from app.models.article import Article
+from app.scrapers import conditional_fetch
+from app.scrapers.conditional_fetch import ConditionalFetcher
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b''):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {'ETag': '"v1"'}
+        self.encoding = 'utf-8'
+        self.apparent_encoding = 'utf-8'
+
+    def raise_for_status(self):
+        pass
+
+
+def test_reused_articles_are_copies(monkeypatch):
+    responses = iter([FakeResponse(200, b'<html>'), FakeResponse(304)])
+    monkeypatch.setattr(conditional_fetch, 'throttled_get', lambda url, **kwargs: next(responses))
+    fetcher = ConditionalFetcher()
+
+    def parse(html):
+        return [Article(title='t', url='https://x/1', source='Yomiuri Shimbun')]
+
+    first = fetcher.fetch('https://x/', parse)
+    first[0]['source'] = 'Yomiuri Shimbun (Enhanced)'
+    first[0]['relevance_score'] = 3.0
+
+    second = fetcher.fetch('https://x/', parse)
+    assert second[0].source == 'Yomiuri Shimbun'
+    assert second[0].relevance_score == 0
+
+
+def test_raw_parse_receives_bytes(monkeypatch):
+    body = '<?xml version="1.0" encoding="shift_jis"?><rss/>'.encode('shift_jis')
+    monkeypatch.setattr(conditional_fetch, 'throttled_get', lambda url, **kwargs: FakeResponse(200, body))
+    received = []
+    ConditionalFetcher().fetch('https://x/feed', lambda content: received.append(content) or [], raw=True)
+    assert received == [body]
@@ -0,0 +1,57 @@
+from app.scrapers.endpoint_strategy import StrategySelector
+from app.scrapers.outbound import record_fetch
+
+
+def make_selector():
+    return StrategySelector('test', failure_threshold=3, probe_interval=300)
+
+
+def test_empty_results_do_not_disable_endpoint():
+    selector = make_selector()
+    for _ in range(5):
+        assert selector.call('api', lambda: []) == []
+    assert selector.ranked(['api', 'html']) == ['html', 'api']
+    assert 'api' in selector.ranked(['api'])
+
+
+def test_exceptions_disable_endpoint_until_probe():
+    selector = make_selector()
+
+    def broken():
+        raise ValueError('parse error')
+
+    for _ in range(3):
+        selector.call('api', broken)
+    assert selector.ranked(['api', 'html']) == ['html']
+
+
+def test_swallowed_http_errors_count_as_failures():
+    selector = make_selector()
+
+    def blocked():
+        record_fetch(False)  # 403 등을 받고 스크래퍼가 빈 결과를 반환한 경우
+        return []
+
+    for _ in range(3):
+        selector.call('api', blocked)
+    assert selector.ranked(['api']) == []
+
+
+def test_empty_response_with_successful_fetch_is_success():
+    selector = make_selector()
+
+    def no_hits():
+        record_fetch(True)
+        return []
+
+    for _ in range(5):
+        selector.call('api', no_hits)
+    assert selector.ranked(['api']) == ['api']
+
+
+def test_success_resets_failures_and_ranks_by_yield():
+    selector = make_selector()
+    selector.call('api', lambda: [1])
+    selector.call('html', lambda: [1, 2, 3])
+    assert selector.ranked(['api', 'html']) == ['html', 'api']
+    assert selector.first([('api', lambda: [1]), ('html', lambda: [1, 2, 3])]) == [1, 2, 3]
@@ -0,0 +1,38 @@
+from app.scrapers.feed_cache import FeedEntryCache, entry_key
+
+
+def counting_extract(calls):
+    def extract(entry):
+        calls.append(entry['id'] if 'id' in entry else entry.get('link'))
+        return {'title': entry['title'].upper()}
+    return extract
+
+
+def test_unchanged_entries_are_not_extracted_again():
+    cache = FeedEntryCache()
+    calls = []
+    entries = [{'id': 'a', 'title': 'one'}, {'id': 'b', 'title': 'two'}]
+    for _ in range(3):
+        results = [cache.extract(entry, counting_extract(calls)) for entry in entries]
+    assert results == [{'title': 'ONE'}, {'title': 'TWO'}]
+    assert calls == ['a', 'b']
+
+
+def test_changed_content_is_extracted_again():
+    cache = FeedEntryCache()
+    calls = []
+    cache.extract({'id': 'a', 'title': 'one'}, counting_extract(calls))
+    assert cache.extract({'id': 'a', 'title': 'one (updated)'}, counting_extract(calls)) == {'title': 'ONE (UPDATED)'}
+    assert calls == ['a', 'a']
+
+
+def test_entries_without_key_are_always_extracted_and_lru_is_bounded():
+    cache = FeedEntryCache(max_entries=2)
+    calls = []
+    cache.extract({'title': 'no key'}, counting_extract(calls))
+    cache.extract({'title': 'no key'}, counting_extract(calls))
+    assert len(calls) == 2
+    for key in 'abc':
+        cache.extract({'id': key, 'title': key}, counting_extract(calls))
+    assert list(cache._entries) == ['b', 'c']
+    assert entry_key({'link': 'https://x/1'}) == 'https://x/1'
@@ -0,0 +1,106 @@
+import threading
+import time
+
+from app.scrapers import hedged_fetch
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, delay: float):
+        self.body = body
+        self.delay = delay
+        self.closed = threading.Event()
+        self._content = None
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        # 본문을 두 번에 나눠 보내며 중간에 지연
+        yield self.body[:1]
+        self.closed.wait(self.delay)
+        yield self.body[1:]
+
+    def close(self):
+        self.closed.set()
+
+    @property
+    def text(self):
+        return self._content.decode()
+
+
+def fake_get(responses, started):
+    def get(url, **kwargs):
+        started.append(url)
+        return responses[url]
+    return get
+
+
+def parse(response):
+    return [response.text] if response.text.strip('-') else []
+
+
+def test_first_candidate_wins_without_launching_others(monkeypatch):
+    responses = {'a': FakeResponse(b'aa', 0), 'b': FakeResponse(b'bb', 0)}
+    started = []
+    monkeypatch.setattr(hedged_fetch, 'throttled_get', fake_get(responses, started))
+
+    assert hedged_fetch.hedged_get([('a', parse), ('b', parse)], delay=1) == ['aa']
+    assert started == ['a']
+
+
+def test_slow_candidate_is_hedged_and_cancelled(monkeypatch):
+    responses = {'a': FakeResponse(b'aa', 2), 'b': FakeResponse(b'bb', 0)}
+    started = []
+    monkeypatch.setattr(hedged_fetch, 'throttled_get', fake_get(responses, started))
+
+    start = time.monotonic()
+    assert hedged_fetch.hedged_get([('a', parse), ('b', parse)], delay=0.1) == ['bb']
+    assert time.monotonic() - start < 1
+    assert started == ['a', 'b']
+    # 진 시도의 연결은 닫혀 본문 수신이 멈춤
+    assert responses['a'].closed.wait(1)
+
+
+def test_empty_result_launches_next_candidate_immediately(monkeypatch):
+    responses = {'a': FakeResponse(b'--', 0), 'b': FakeResponse(b'bb', 0)}
+    started = []
+    monkeypatch.setattr(hedged_fetch, 'throttled_get', fake_get(responses, started))
+
+    start = time.monotonic()
+    assert hedged_fetch.hedged_get([('a', parse), ('b', parse)], delay=5) == ['bb']
+    assert time.monotonic() - start < 1
+
+
+def test_all_candidates_fail(monkeypatch):
+    def failing_get(url, **kwargs):
+        raise hedged_fetch.requests.ConnectionError(url)
+    monkeypatch.setattr(hedged_fetch, 'throttled_get', failing_get)
+
+    assert hedged_fetch.hedged_get([('a', parse), ('b', parse)], delay=0.1) == []
+
+
+def test_run_concurrently_keeps_input_order_and_drops_failures():
+    def slow():
+        time.sleep(0.05)
+        return ['slow']
+
+    def broken():
+        raise ValueError('boom')
+
+    start = time.monotonic()
+    results = hedged_fetch.run_concurrently([slow, broken, lambda: ['fast'], lambda: None, slow])
+    assert results == [['slow'], [], ['fast'], [], ['slow']]
+    # 동시에 실행되어 느린 호출 두 개가 겹침
+    assert time.monotonic() - start < 0.1
+
+
+def test_run_concurrently_deadline():
+    release = threading.Event()
+
+    def stuck():
+        release.wait(1)
+        return ['late']
+
+    results = hedged_fetch.run_concurrently([stuck, lambda: ['fast']], timeout=0.05)
+    release.set()
+    assert results == [[], ['fast']]
@@ -0,0 +1,36 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.api.http_cache import CachedPayload, payload_response
+
+PAYLOAD = CachedPayload.from_content({"articles": ["x" * 50] * 100})
+
+app = FastAPI()
+
+
+@app.get("/payload")
+async def payload(request: Request):
+    return payload_response(request, PAYLOAD)
+
+
+client = TestClient(app)
+
+
+def get(**headers):
+    return client.get("/payload", headers=headers)
+
+
+def test_each_encoding_has_its_own_etag():
+    etags = {get(**{"Accept-Encoding": encoding}).headers["etag"] for encoding in ("identity", "gzip", "br")}
+    assert etags == {PAYLOAD.etag, f'"{PAYLOAD.version}-gzip"', f'"{PAYLOAD.version}-br"'}
+
+
+def test_any_variant_etag_revalidates():
+    gzip_etag = get(**{"Accept-Encoding": "gzip"}).headers["etag"]
+    response = get(**{"Accept-Encoding": "br", "If-None-Match": gzip_etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == f'"{PAYLOAD.version}-br"'
+
+
+def test_other_version_does_not_match():
+    assert get(**{"If-None-Match": '"0000000000000000-br"'}).status_code == 200
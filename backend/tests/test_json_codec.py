@@ -0,0 +1,35 @@
+import json
+
+from app.core.json_codec import encode
+from app.models.article import Article
+
+
+def test_mixed_list_encodes_fragments_after_first_item():
+    article = Article(title='t', url='https://x/1', source='BBC News')
+    payload = json.loads(encode(['plain', 1, article, {'nested': [article]}]))
+    assert payload[:2] == ['plain', 1]
+    assert payload[2]['url'] == 'https://x/1'
+    assert payload[3]['nested'][0]['title'] == 't'
+
+
+def test_plain_list_matches_json():
+    assert json.loads(encode([1, 'a', None])) == [1, 'a', None]
+
+
+def test_attribute_assignment_refreshes_cached_json():
+    article = Article(title='old', url='https://x/1', source='BBC News')
+    assert json.loads(article.to_json())['title'] == 'old'
+    article.title = 'new'
+    assert json.loads(article.to_json())['title'] == 'new'
+    article['summary'] = 's'
+    assert article.to_dict()['summary'] == 's'
+
+
+def test_copy_keeps_cache_and_is_independent():
+    article = Article(title='t', url='https://x/1', source='BBC News')
+    encoded = article.to_json()
+    clone = article.copy()
+    assert clone.to_json() is encoded
+    clone.source = 'Other'
+    assert json.loads(clone.to_json())['source'] == 'Other'
+    assert article.to_json() is encoded
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+from app.scrapers import latency, registry
+from app.scrapers.latency import LatencyTracker
+
+
+def test_budget_uses_default_until_enough_samples():
+    tracker = LatencyTracker()
+    for _ in range(latency.LATENCY_MIN_SAMPLES - 1):
+        tracker.record(1.0)
+    assert tracker.budget() == latency.DEFAULT_TIMEOUT
+
+
+def test_timeouts_are_not_latency_samples():
+    tracker = LatencyTracker()
+    for _ in range(5):
+        tracker.record(1.0)
+    first = tracker.budget()
+    tracker.record_timeout()
+    assert tracker.budget() == first
+    assert tracker.percentiles()["timeouts"] == 1
+    assert tracker.percentiles()["samples"] == 5
+
+
+def test_slowed_down_source_gets_default_budget_back():
+    tracker = LatencyTracker()
+    for _ in range(10):
+        tracker.record(0.1)
+    assert tracker.budget() == latency.MIN_TIMEOUT
+    for _ in range(latency.LATENCY_TIMEOUT_RESET):
+        tracker.record_timeout()
+    assert tracker.budget() == latency.DEFAULT_TIMEOUT
+    assert tracker.percentiles()["samples"] == 0
+    # 느려진 지연으로 다시 학습
+    for _ in range(latency.LATENCY_MIN_SAMPLES):
+        tracker.record(6.0)
+    assert tracker.budget() == min(latency.MAX_TIMEOUT, 6.0 * latency.TIMEOUT_HEADROOM)
+
+
+def test_success_between_timeouts_keeps_samples():
+    tracker = LatencyTracker()
+    for _ in range(5):
+        tracker.record(1.0)
+    for _ in range(5):
+        tracker.record_timeout()
+        tracker.record(1.0)
+    assert tracker.percentiles()["samples"] == 10
+
+
+def test_budget_never_exceeds_fixed_timeout():
+    tracker = LatencyTracker()
+    for _ in range(10):
+        tracker.record(latency.DEFAULT_TIMEOUT * 3)
+    assert tracker.budget() <= latency.DEFAULT_TIMEOUT
+
+
+def test_budget_tracks_fast_source():
+    tracker = LatencyTracker()
+    for _ in range(10):
+        tracker.record(0.1)
+    assert tracker.budget() == latency.MIN_TIMEOUT
+
+
+def test_gather_sources_respects_overall_deadline():
+    specs = [registry.SCRAPERS["bbc"], registry.SCRAPERS["vnexpress"]]
+
+    async def slow(spec):
+        await asyncio.sleep(0.3)
+        return []
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await registry.gather_sources(specs, slow, timeout=5, max_concurrency=1, deadline=0.2)
+        return loop.time() - start, results
+
+    elapsed, results = asyncio.run(run())
+    assert elapsed < 0.5
+    assert all(isinstance(error, registry.SourceTimeout) for _, _, error in results)
+    assert results[1][2].budget == 0.0
+
+
+def test_timed_out_call_keeps_its_slot_until_thread_finishes():
+    specs = [registry.ScraperSpec('bbc', 'bbc_scraper', 'BBCNewsScraper'),
+             registry.ScraperSpec('vnexpress', 'vnexpress_scraper', 'VNExpressScraper')]
+    started = {}
+
+    def blocking(key):
+        started[key] = time.monotonic()
+        time.sleep(0.3 if key == 'bbc' else 0.01)
+        return ['done']
+
+    async def call(spec):
+        return await registry._run_blocking(blocking, spec.key)
+
+    start = time.monotonic()
+    results = asyncio.run(registry.gather_sources(specs, call, timeout=0.1, max_concurrency=1, deadline=5))
+    assert isinstance(results[0][2], registry.SourceTimeout)
+    assert results[1][1] == ['done']
+    # 두 번째 소스는 첫 소스의 스레드가 끝난 뒤에야 시작
+    assert started['vnexpress'] - start >= 0.29
+
+
+def test_pool_queue_wait_is_not_source_latency():
+    spec = registry.ScraperSpec('bbc', 'bbc_scraper', 'BBCNewsScraper')
+    # 다른 요청의 호출이 공유 풀을 모두 차지한 상태
+    busy = [registry._executor.submit(time.sleep, 0.3) for _ in range(registry._executor._max_workers)]
+
+    def quick():
+        time.sleep(0.01)
+        return ['done']
+
+    async def call(spec):
+        return await registry._run_blocking(quick)
+
+    results = asyncio.run(registry.gather_sources([spec], call, timeout=0.2, deadline=5))
+    for future in busy:
+        future.result()
+    assert results[0][1] == ['done']
+    assert results[0][2] is None
+    assert registry.get_tracker('bbc').percentiles()["p99"] < 0.2
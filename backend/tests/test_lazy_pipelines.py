@@ -0,0 +1,67 @@
+from app.models.article import Article
+from app.scrapers.hybrid_nypost_scraper import HybridNYPostScraper
+from app.scrapers.scmp_scraper import SCMPScraper
+
+
+def test_nypost_enriches_only_returned_articles(monkeypatch):
+    links = ''.join(
+        f'<h2><a href="https://nypost.com/2026/10/19/news/story-{n}/">Story number {n} about the city</a></h2>'
+        for n in range(30)
+    )
+    # 중복 URL 과 짧은 제목은 보강 전에 걸러짐
+    html = ('<html><body><h2><a href="https://nypost.com/2026/10/19/news/story-0/">Story number 0 about the city</a></h2>'
+            '<h2><a href="https://nypost.com/short/">Short</a></h2>' + links + '</body></html>')
+    enriched = []
+
+    def enrich(self, link, title, url, category):
+        enriched.append(url)
+        return Article(title=title, url=url, source='NY Post', category=category)
+
+    monkeypatch.setattr(HybridNYPostScraper, '_enrich_category_candidate', enrich)
+    articles = HybridNYPostScraper()._extract_nypost_category_articles(html, 3, 'news')
+    assert [a.url for a in articles] == [f'https://nypost.com/2026/10/19/news/story-{n}/' for n in range(3)]
+    assert enriched == [a.url for a in articles]
+
+
+def test_nypost_skips_failed_enrichment_and_keeps_filling(monkeypatch):
+    html = '<html><body>' + ''.join(
+        f'<h2><a href="https://nypost.com/2026/10/19/news/story-{n}/">Story number {n} about the city</a></h2>'
+        for n in range(5)) + '</body></html>'
+    calls = []
+
+    def enrich(self, link, title, url, category):
+        calls.append(url)
+        return None if url.endswith('story-1/') else Article(title=title, url=url)
+
+    monkeypatch.setattr(HybridNYPostScraper, '_enrich_category_candidate', enrich)
+    articles = HybridNYPostScraper()._extract_nypost_category_articles(html, 2, 'news')
+    assert [a.url[-8:] for a in articles] == ['story-0/', 'story-2/']
+    assert len(calls) == 3
+
+
+def test_scmp_fallback_selectors_not_consumed_when_image_links_suffice(monkeypatch):
+    consumed = []
+
+    def image_candidates(self, soup):
+        for n in range(10):
+            consumed.append(n)
+            yield None, f'Image story {n} title', f'https://www.scmp.com/news/{n}', '', ''
+
+    def selector_candidates(self, soup):
+        raise AssertionError('이미지 링크로 limit 를 채우면 일반 선택자는 실행하지 않음')
+        yield  # pragma: no cover
+
+    enriched = []
+
+    def enrich(self, candidate):
+        enriched.append(candidate[2])
+        return Article(title=candidate[1], url=candidate[2], source='SCMP')
+
+    monkeypatch.setattr(SCMPScraper, '_image_link_candidates', image_candidates)
+    monkeypatch.setattr(SCMPScraper, '_selector_candidates', selector_candidates)
+    monkeypatch.setattr(SCMPScraper, '_enrich_search_candidate', enrich)
+
+    articles = SCMPScraper()._extract_search_results('<html></html>', 3)
+    assert len(articles) == 3
+    assert enriched == ['https://www.scmp.com/news/0', 'https://www.scmp.com/news/1', 'https://www.scmp.com/news/2']
+    assert consumed == [0, 1, 2]
@@ -0,0 +1,67 @@
+from app.models.article import Article
+from app.scrapers.local_index import LocalArticleIndex, tokenize
+
+
+def article(title, url, summary=''):
+    return Article(title=title, url=url, summary=summary, published_date='2024-01-01',
+                   source='The Sun', category='news', image_url='')
+
+
+def make_index():
+    index = LocalArticleIndex()
+    index.add([
+        article('Cost of living crisis deepens', 'https://x/1'),
+        article('Prince of Wales visits school', 'https://x/2'),
+        article('Energy bills rise', 'https://x/3', summary='Living costs push households to the cost limit'),
+        article('Living room makeover ideas', 'https://x/4'),
+    ])
+    return index
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize('Cost of the living') == {'cost', 'living'}
+
+
+def test_stopwords_do_not_match_every_article():
+    urls = [a.url for a in make_index().search('cost of living', 10)]
+    assert 'https://x/2' not in urls
+    assert 'https://x/4' not in urls
+    assert urls[0] == 'https://x/1'
+    assert set(urls) == {'https://x/1', 'https://x/3'}
+
+
+def test_stopword_only_query_returns_nothing():
+    assert make_index().search('of the', 10) == []
+
+
+def test_min_match_allows_partial_overlap():
+    urls = {a.url for a in make_index().search('living makeover', 10, min_match=0.5)}
+    assert urls == {'https://x/1', 'https://x/3', 'https://x/4'}
+
+
+def test_stale_index_refreshes_in_background(monkeypatch):
+    import threading
+    import time
+
+    from app.scrapers import thesun_scraper
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_page(url, parse, **kwargs):
+        started.set()
+        release.wait(2)
+        return []
+
+    monkeypatch.setattr(thesun_scraper, 'get_page', slow_page)
+    scraper = thesun_scraper.TheSunScraper()
+    scraper.index = make_index()
+    scraper._last_google_at = time.monotonic()  # Google 폴백 호출 막기
+
+    start = time.monotonic()
+    results = scraper.search_news('cost of living', 2)
+    elapsed = time.monotonic() - start
+    release.set()
+    assert elapsed < 0.5
+    assert started.wait(1)
+    assert {a.url for a in results} == {'https://x/1', 'https://x/3'}
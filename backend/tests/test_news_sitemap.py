@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+from app.scrapers import news_sitemap
+from app.scrapers.news_sitemap import NewsSitemapFeed
+
+HEAD = ('<?xml version="1.0" encoding="UTF-8"?>'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+        'xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">')
+ENTRY = ('<url><loc>https://example.com/{section}/{n}</loc><news:news>'
+         '<news:publication_date>2026-10-19T0{hour}:00:00+09:00</news:publication_date>'
+         '<news:title>Story {n}</news:title></news:news></url>')
+
+
+def sitemap(*numbers, section='news'):
+    return (HEAD + ''.join(ENTRY.format(section=section, n=n, hour=n % 10) for n in numbers)
+            + '</urlset>').encode()
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b'', etag=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {'ETag': etag} if etag else {}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        # 작은 청크로 나눠 <url> 이 청크 경계에 걸리게 함
+        for start in range(0, len(self.body), 50):
+            yield self.body[start:start + 50]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def serve(monkeypatch, responses, requests):
+    def get(url, headers=None, **kwargs):
+        requests.append(dict(headers or {}))
+        return responses.pop(0)
+    monkeypatch.setattr(news_sitemap, 'throttled_get', get)
+
+
+def test_incremental_ingest_adds_only_new_entries(monkeypatch):
+    requests = []
+    serve(monkeypatch, [FakeResponse(200, sitemap(1, 2), etag='"a"'),
+                        FakeResponse(200, sitemap(1, 2, 3), etag='"b"'),
+                        FakeResponse(304)], requests)
+    feed = NewsSitemapFeed('https://example.com/news-sitemap.xml', 'Example')
+
+    assert feed.poll() == 2
+    assert feed.poll() == 1
+    assert feed.poll() == 0
+    assert requests[1]['If-None-Match'] == '"a"'
+    assert requests[2]['If-None-Match'] == '"b"'
+    latest = feed.latest(10)
+    assert [article.url for article in latest] == ['https://example.com/news/3', 'https://example.com/news/2',
+                                                   'https://example.com/news/1']
+    assert latest[0].published_date == '2026-10-19T03:00:00+09:00'
+    assert latest[0].category == 'news'
+
+
+def test_evicted_entries_are_not_ingested_again(monkeypatch):
+    requests = []
+    serve(monkeypatch, [FakeResponse(200, sitemap(1, 2, 3, 4)),
+                        FakeResponse(200, sitemap(1, 2, 3, 4, 5))], requests)
+    feed = NewsSitemapFeed('https://example.com/news-sitemap.xml', 'Example', max_entries=2)
+
+    assert feed.poll() == 4
+    assert len(feed.latest(10)) == 2
+    # 보관 범위에서 밀려난 1, 2 는 새 기사로 다시 들어오지 않음
+    assert feed.poll() == 1
+    assert {article.url for article in feed.latest(10)} == {'https://example.com/news/4',
+                                                            'https://example.com/news/5'}
+
+
+def test_latest_fills_only_missing_slots_from_sitemap(monkeypatch):
+    from app.models.article import Article
+    from app.scrapers import registry
+
+    spec = registry.SCRAPERS['thesun']
+    monkeypatch.setattr(spec.sitemap, '_articles', OrderedDict(
+        (url, Article(title=url, url=url, published_date=date)) for url, date in [
+            ('https://x/old', '2026-10-18T00:00:00+00:00'),
+            ('https://x/scraped', '2026-10-19T00:00:00+00:00'),
+            ('https://x/new', '2026-10-19T01:00:00+00:00'),
+        ]))
+
+    class Fake:
+        def get_latest_news(self, category, limit):
+            return [Article(title='scraped', url='https://x/scraped', summary='s', image_url='i')]
+
+    monkeypatch.setitem(registry._instances, 'thesun', Fake())
+    articles = spec.latest_sync('all', 3)
+    # 스크래퍼 카드가 먼저, 같은 URL 은 사이트맵으로 덮어쓰지 않음
+    assert [a.url for a in articles] == ['https://x/scraped', 'https://x/new', 'https://x/old']
+    assert articles[0].summary == 's'
+    # 카테고리 요청은 사이트맵으로 채우지 않음
+    assert len(spec.latest_sync('news', 3)) == 1
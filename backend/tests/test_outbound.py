@@ -0,0 +1,53 @@
+import threading
+import time
+
+from app.scrapers import outbound
+from app.scrapers.outbound import INTERACTIVE, PREFETCH, _HostBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_burst_then_rate_limited():
+    bucket = _HostBucket('example.com', rate=1, burst=2)
+    assert bucket.acquire(INTERACTIVE, 0)
+    assert bucket.acquire(INTERACTIVE, 0)
+    assert not bucket.acquire(INTERACTIVE, 0.05)
+
+
+def test_interactive_request_goes_before_waiting_prefetch():
+    bucket = _HostBucket('example.com', rate=10, burst=1)
+    assert bucket.acquire(INTERACTIVE, 0)
+    order = []
+
+    def take(priority, label, delay):
+        time.sleep(delay)
+        bucket.acquire(priority, 2)
+        order.append(label)
+
+    threads = [threading.Thread(target=take, args=(PREFETCH, 'prefetch', 0)),
+               threading.Thread(target=take, args=(INTERACTIVE, 'interactive', 0.02))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert order == ['interactive', 'prefetch']
+
+
+def test_429_backs_off_host(monkeypatch):
+    bucket = _HostBucket('slow.example', rate=100, burst=4)
+    monkeypatch.setattr(outbound, '_bucket', lambda url: bucket)
+    outbound.note_response('https://slow.example/', FakeResponse(429, {'Retry-After': '2'}))
+    assert not bucket.acquire(INTERACTIVE, 0.2)
+    assert bucket.blocked_until - time.monotonic() > 1.5
+
+
+def test_throttled_get_records_outcome(monkeypatch):
+    monkeypatch.setattr(outbound, '_bucket', lambda url: _HostBucket('x', rate=0, burst=1))
+    monkeypatch.setattr(outbound.requests, 'get', lambda url, **kwargs: FakeResponse(403))
+    with outbound.fetch_report() as report:
+        outbound.throttled_get('https://x/')
+    assert report.failed
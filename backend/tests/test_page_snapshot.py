@@ -0,0 +1,126 @@
+from app.scrapers import page_snapshot
+from app.scrapers.page_snapshot import PageSnapshotStore
+
+
+class FakeResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.status_code = 200
+        self.encoding = 'utf-8'
+        self.apparent_encoding = 'utf-8'
+        self._content = None
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), 4):
+            yield self.body[start:start + 4]
+
+    @property
+    def text(self):
+        return (self._content if self._content is not None else self.body).decode(self.encoding)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def counting_get(body: bytes, calls: list):
+    def get(url, **kwargs):
+        calls.append(url)
+        return FakeResponse(body)
+    return get
+
+
+def read_all(chunks):
+    return [b''.join(chunk if isinstance(chunk, bytes) else chunk.encode() for chunk in chunks).decode()]
+
+
+def read_first(chunks):
+    for chunk in chunks:
+        return [chunk.decode() if isinstance(chunk, bytes) else chunk[:4]]
+    return []
+
+
+def test_streamed_read_to_eof_fills_full_snapshot(monkeypatch):
+    calls = []
+    monkeypatch.setattr(page_snapshot, 'throttled_get', counting_get(b'<html>body</html>', calls))
+    store = PageSnapshotStore(ttl=60)
+
+    assert store.get_streamed('https://x/', read_all, variant='a') == ['<html>body</html>']
+    # 다른 variant 나 전체 본문 파싱도 다시 내려받지 않음
+    assert store.get('https://x/', lambda html: [html.upper()], variant='b') == ['<HTML>BODY</HTML>']
+    assert store.get_streamed('https://x/', read_first, variant='c') == ['<htm']
+    assert calls == ['https://x/']
+
+
+def test_streamed_early_stop_keeps_only_variant_result(monkeypatch):
+    calls = []
+    monkeypatch.setattr(page_snapshot, 'throttled_get', counting_get(b'<html>body</html>', calls))
+    store = PageSnapshotStore(ttl=60)
+
+    assert store.get_streamed('https://x/', read_first, variant='a') == ['<htm']
+    assert store.get_streamed('https://x/', read_first, variant='a') == ['<htm']
+    assert len(calls) == 1
+    store.get('https://x/', lambda html: [html], variant='b')
+    assert len(calls) == 2
+
+
+def test_variants_share_one_download_within_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(page_snapshot, 'throttled_get', counting_get(b'<html>body</html>', calls))
+    store = PageSnapshotStore(ttl=60)
+    parsed = []
+
+    def parse(tag):
+        def run(html):
+            parsed.append(tag)
+            return [tag + html]
+        return run
+
+    assert store.get('https://x/', parse('a'), variant='a') == ['a<html>body</html>']
+    assert store.get('https://x/', parse('a'), variant='a') == ['a<html>body</html>']
+    assert store.get('https://x/', parse('b'), variant='b') == ['b<html>body</html>']
+    assert calls == ['https://x/']
+    # 같은 variant 는 다시 파싱하지 않음
+    assert parsed == ['a', 'b']
+
+
+def test_expired_snapshot_is_downloaded_again(monkeypatch):
+    calls = []
+    monkeypatch.setattr(page_snapshot, 'throttled_get', counting_get(b'body', calls))
+    now = [1000.0]
+    monkeypatch.setattr(page_snapshot.time, 'monotonic', lambda: now[0])
+    store = PageSnapshotStore(ttl=60)
+
+    store.get('https://x/', lambda html: [html], variant='a')
+    now[0] += 59
+    store.get('https://x/', lambda html: [html], variant='a')
+    assert len(calls) == 1
+    now[0] += 2
+    store.get('https://x/', lambda html: [html], variant='a')
+    assert len(calls) == 2
+
+
+def test_returned_results_are_copies(monkeypatch):
+    from app.models.article import Article
+
+    monkeypatch.setattr(page_snapshot, 'throttled_get', counting_get(b'body', []))
+    store = PageSnapshotStore(ttl=60)
+    parse = lambda html: [Article(title='t', url='https://x/1', source='SCMP')]  # noqa: E731
+
+    first = store.get('https://x/', parse)
+    first[0]['source'] = 'changed'
+    first.clear()
+    assert store.get('https://x/', parse)[0].source == 'SCMP'
+
+
+def test_lru_bounds_number_of_urls(monkeypatch):
+    monkeypatch.setattr(page_snapshot, 'throttled_get', counting_get(b'body', []))
+    store = PageSnapshotStore(ttl=60, max_entries=2)
+    for url in ('https://x/1', 'https://x/2', 'https://x/3'):
+        store.get(url, lambda html: [html])
+    assert list(store._snapshots) == ['https://x/2', 'https://x/3']
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from app.models.article import Article
+from app.scrapers import registry
+from app.scrapers.registry import CAP_SEARCH, ScraperSpec
+
+
+def test_select_scrapers_uses_registry_order_and_capability():
+    keys = [spec.key for spec in registry.select_scrapers(['scmp', 'bbc', 'unknown', 'thesun'])]
+    assert keys == ['bbc', 'thesun', 'scmp']
+    assert all(spec.supports(CAP_SEARCH) for spec in registry.select_scrapers(['bbc'], CAP_SEARCH))
+
+
+def test_register_requires_source_metadata():
+    spec = ScraperSpec('bbc', 'bbc_scraper', 'BBCNewsScraper')
+    spec.key = 'missing'
+    with pytest.raises(ValueError):
+        registry.register(spec)
+    assert 'missing' not in registry.SCRAPERS
+
+
+def test_trending_falls_back_to_search_without_latest(monkeypatch):
+    spec = ScraperSpec('bbc', 'bbc_scraper', 'BBCNewsScraper', capabilities=(CAP_SEARCH,))
+    calls = []
+
+    class Fake:
+        def search_news(self, query, limit):
+            calls.append(('search', query, limit))
+            return [{'title': 't', 'url': 'https://x/1'}]
+
+        def get_latest_news(self, category, limit):
+            raise AssertionError('latest 미지원')
+
+    monkeypatch.setitem(registry._instances, 'bbc', Fake())
+    articles = asyncio.run(spec.trending('sports', 3))
+    assert calls == [('search', 'sports', 3)]
+    assert isinstance(articles[0], Article)
+
+
+def test_category_map_is_applied(monkeypatch):
+    calls = []
+
+    class Fake:
+        def get_latest_news(self, category, limit):
+            calls.append(category)
+            return []
+
+    monkeypatch.setitem(registry._instances, 'bbc', Fake())
+    asyncio.run(registry.SCRAPERS['bbc'].latest('sports', 1))
+    assert calls == ['sport']
+
+
+def test_fan_out_yields_in_completion_order():
+    specs = [registry.SCRAPERS['bbc'], registry.SCRAPERS['vnexpress']]
+
+    async def call(spec):
+        await asyncio.sleep(0.05 if spec.key == 'bbc' else 0)
+        return [spec.key]
+
+    async def run():
+        return [result async for result in registry.fan_out(specs, call, timeout=1)]
+
+    results = asyncio.run(run())
+    assert [spec.key for spec, _, _ in results] == ['vnexpress', 'bbc']
+    assert [articles for _, articles, _ in results] == [['vnexpress'], ['bbc']]
@@ -0,0 +1,40 @@
+from app.models.article import Article
+from app.scrapers import scmp_scraper
+from app.scrapers.scmp_scraper import SCMPScraper
+
+
+class FakeResponse:
+    def __init__(self, url):
+        self.text = url
+
+    def raise_for_status(self):
+        pass
+
+
+def test_search_merges_concurrent_endpoints_without_homepage(monkeypatch):
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        return FakeResponse(url)
+
+    def extract(self, html, limit, query):
+        if '/rss/' in html:
+            raise ValueError('feed changed')
+        # 검색/뉴스/토픽 결과가 같은 기사 하나를 공유
+        return [Article(title='Shared story', url='https://www.scmp.com/news/shared'),
+                Article(title=html, url=html + '/article')]
+
+    def no_homepage(*args, **kwargs):
+        raise AssertionError('검색 결과가 있으면 홈페이지를 받지 않음')
+
+    monkeypatch.setattr(scmp_scraper, 'throttled_get', get)
+    monkeypatch.setattr(SCMPScraper, '_extract_search_results', extract)
+    monkeypatch.setattr(SCMPScraper, '_filter_relevant_articles', lambda self, articles, query: articles)
+    monkeypatch.setattr(scmp_scraper, 'get_page', no_homepage)
+
+    articles = SCMPScraper().search_news('hong kong', 10)
+    urls = [article.url for article in articles]
+    assert len(requested) == 4
+    assert urls.count('https://www.scmp.com/news/shared') == 1
+    assert len(urls) == 4
@@ -0,0 +1,20 @@
+from app.core.source_registry import (SOURCE_KEYS, SOURCES, categories_response, expand_sources,
+                                      sources_response)
+
+
+def test_expand_all_and_groups_in_registry_order():
+    assert expand_sources('all') == list(SOURCE_KEYS)
+    assert expand_sources('europe') == ['bbc', 'thesun', 'dailymail']
+    assert expand_sources('asian') == ['vnexpress', 'asahi', 'yomiuri']
+
+
+def test_expand_mixed_names_deduplicates_and_ignores_unknown():
+    assert expand_sources(' SCMP , europe,bbc,unknown') == ['bbc', 'thesun', 'dailymail', 'scmp']
+    assert expand_sources('unknown') == []
+
+
+def test_responses_cover_every_source():
+    body = sources_response()
+    assert body['total_sources'] == len(SOURCES)
+    assert set(body['sources']) == {'all', *SOURCES}
+    assert categories_response()['categories'][0] == 'all'
@@ -0,0 +1,60 @@
+from app.scrapers import stream_html
+from app.scrapers.stream_html import iter_links
+
+ITEM = ('<div class="c"><h3><a href="/news/{n}">Headline number {n}</a></h3>'
+        '<time datetime="2026-10-1{n}">t</time><img src="/img/{n}.jpg"><p class="s">summary {n}</p></div>')
+PAGE = '<html><body><main>' + ''.join(ITEM.format(n=n) for n in range(3)) + '</main></body></html>'
+
+
+def split(text, *cuts):
+    pieces, last = [], 0
+    for cut in cuts:
+        pieces.append(text[last:cut])
+        last = cut
+    pieces.append(text[last:])
+    return [piece.encode() for piece in pieces]
+
+
+def collect(chunks):
+    return [(link['href'], link.find_parent('div').find('time')['datetime'],
+             link.find_parent('div').find('img')['src'])
+            for link in iter_links(chunks, lambda href: '/news/' in href)]
+
+
+def test_siblings_after_link_survive_chunk_split():
+    expected = collect([PAGE.encode()])
+    assert [href for href, _, _ in expected] == ['/news/0', '/news/1', '/news/2']
+    # 각 링크의 </a> 바로 뒤에서 청크를 자름
+    cuts = [PAGE.index('</a>', PAGE.index(f'/news/{n}')) + len('</a>') for n in range(3)]
+    assert collect(split(PAGE, *cuts)) == expected
+    # 한 바이트씩 보내도 같은 결과
+    assert collect([PAGE[i:i + 1].encode() for i in range(len(PAGE))]) == expected
+
+
+def test_handled_containers_are_cleared(monkeypatch):
+    roots = []
+
+    class RecordingParser(stream_html.etree.HTMLPullParser):
+        def close(self):
+            root = super().close()
+            roots.append(root)
+            return root
+
+    monkeypatch.setattr(stream_html.etree, 'HTMLPullParser', RecordingParser)
+    chunks = [b'<html><body><main>'] + [ITEM.format(n=n % 10).encode() for n in range(200)]
+    assert len(list(iter_links(chunks, lambda href: '/news/' in href))) == 200
+    # 처리한 컨테이너는 비워지고 앞 형제는 제거되어 트리가 남지 않음
+    assert sum(1 for _ in roots[0].iter()) < 10
+
+
+def test_early_stop_does_not_read_remaining_chunks():
+    consumed = []
+
+    def chunks():
+        for n in range(10):
+            consumed.append(n)
+            yield ITEM.format(n=n).encode()
+
+    links = iter_links(chunks(), lambda href: '/news/' in href)
+    assert next(links)['href'] == '/news/0'
+    assert len(consumed) <= 2
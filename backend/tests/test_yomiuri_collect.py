@@ -0,0 +1,44 @@
+import threading
+import time
+
+from app.models.article import Article
+from app.scrapers import yomiuri_scraper
+from app.scrapers.yomiuri_scraper import YomiuriScraper
+
+
+def article(title, url):
+    return Article(title=title, url=url, source='Yomiuri Shimbun')
+
+
+def test_collect_stops_at_deadline_and_ranks_homepage_first(monkeypatch):
+    monkeypatch.setattr(yomiuri_scraper, 'COLLECT_DEADLINE', 0.2)
+    scraper = YomiuriScraper()
+    slow_section = scraper.enhanced_section_urls[0]
+    release = threading.Event()
+
+    def homepage(self, limit):
+        return [article('Homepage story', 'https://www.yomiuri.co.jp/national/20261019-OYT1T50001/')]
+
+    def section(self, section_url, per_section):
+        if section_url == slow_section:
+            release.wait(2)
+            return [article('Late section story', section_url + 'late/')]
+        return [article('Section story ' + section_url, section_url + '20261019-OYT1T50002/'),
+                article('Homepage story', section_url + 'duplicate-title/')]
+
+    monkeypatch.setattr(YomiuriScraper, '_get_enhanced_homepage_articles', homepage)
+    monkeypatch.setattr(YomiuriScraper, '_get_enhanced_section_page', section)
+
+    start = time.monotonic()
+    articles = scraper._collect_multi_source(50)
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert elapsed < 1
+    assert articles[0].title == 'Homepage story'
+    assert articles[0].relevance_score == 3.0
+    titles = [a.title for a in articles]
+    # 마감 시간을 넘긴 섹션은 빈 결과, 같은 제목은 한 번만
+    assert 'Late section story' not in titles
+    assert titles.count('Homepage story') == 1
+    assert len(articles) == len(scraper.enhanced_section_urls)